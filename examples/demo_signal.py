@@ -1,12 +1,8 @@
 import numpy as np
 
-from regelung import (
-    PT1,
-    plot_step,
-    simulate_signal,
-    simulate_step,
-    plot_signal
-)
+from regelung import PT1, plot_signal, plot_step, simulate_signal, simulate_step
+from regelung.signals import Ramp, Sine
+
 
 def beispiel_simulate_signal():
     """Beispiel mit simulate_signal - volle Kontrolle"""
@@ -25,7 +21,7 @@ def beispiel_simulate_signal():
     )
 
     # 2. Sinunseingang
-    u_sinus = np.sin(2 * np.pi * 0.2 * t)  # 0.2 Hz
+    u_sinus = Sine(frequency=0.2)(t)  # 0.2 Hz
     t_2, y_2 = simulate_signal(strecke.tf(), t=t, u=u_sinus)
     plot_signal(
         t_2,
@@ -37,7 +33,7 @@ def beispiel_simulate_signal():
     )
 
     # 3. Rampe
-    u_rampe = t * 0.5  # Steigung 0.5
+    u_rampe = Ramp(slope=0.5)(t)  # Steigung 0.5
     t_3, y_3 = simulate_signal(strecke.tf(), t, u_rampe)
     plot_signal(
         t_3,
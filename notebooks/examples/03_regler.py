@@ -24,10 +24,10 @@ def _(mo):
 
 @app.cell
 def _():
-    from regelung import PT1, P, PI, PID, closed_loop, simulate_step
-    import matplotlib.pyplot as plt
+    from regelung import ParametricLoop, StepPlot
+    from regelung.simulation import ResponseTable
     import numpy as np
-    return P, PI, PID, PT1, closed_loop, np, plt, simulate_step
+    return ParametricLoop, ResponseTable, StepPlot, np
 
 
 @app.cell(hide_code=True)
@@ -80,70 +80,57 @@ def _(mo, regler_typ):
 
 
 @app.cell(hide_code=True)
-def _(
-    K_s,
-    Kp,
-    P,
-    PI,
-    PID,
-    PT1,
-    T_s,
-    Td,
-    Ti,
-    closed_loop,
-    np,
-    plt,
-    regler_typ,
-    simulate_step,
-):
-    # Strecke
-    strecke_r = PT1(KP=K_s.value, T=T_s.value)
-
-    # Regler erstellen
+def _(ParametricLoop, ResponseTable, np, regler_typ):
+    # Antworttabelle je Regler-Typ auf dem Raster der Schieberegler; fehlende
+    # Punkte werden beim ersten Zugriff gestapelt berechnet, danach ist jede
+    # Reglerbewegung nur noch ein Nachschlagen
+    raster_r = {
+        "Kp": np.linspace(0.1, 5.0, 50),
+        "Ti": np.linspace(0.1, 5.0, 50),
+        "Td": np.linspace(0.0, 2.0, 21),
+        "Kp_s": np.linspace(0.5, 5.0, 10),
+        "T": np.linspace(0.5, 5.0, 10),
+    }
+    loop_r = ParametricLoop(regler_typ.value, "PT1")
+    table_r = ResponseTable(loop_r, {p: raster_r[p] for p in loop_r.params}, t_end=15.0)
+    return (table_r,)
+
+
+@app.cell(hide_code=True)
+def _(StepPlot):
+    # Figure einmal erzeugen, Schieberegler aktualisieren nur die Daten
+    plot_r = StepPlot(
+        title="Regelkreis", ylabel="Signal", label="Istwert y(t)", setpoint=1.0
+    )
+    return (plot_r,)
+
+
+@app.cell(hide_code=True)
+def _(K_s, Kp, T_s, Td, Ti, plot_r, regler_typ, table_r):
+    # Strecke und Regler
+    params_r = {"Kp": Kp.value, "Kp_s": K_s.value, "T": T_s.value}
     if regler_typ.value == "P":
-        regler_r = P(KP=Kp.value)
         regler_info = f"P(Kp={Kp.value})"
     elif regler_typ.value == "PI":
-        regler_r = PI(KP=Kp.value, TI=Ti.value)
+        params_r["Ti"] = Ti.value
         regler_info = f"PI(Kp={Kp.value}, Ti={Ti.value})"
     else:
-        regler_r = PID(KP=Kp.value, TI=Ti.value, TD=Td.value)
+        params_r.update(Ti=Ti.value, Td=Td.value)
         regler_info = f"PID(Kp={Kp.value}, Ti={Ti.value}, Td={Td.value})"
 
-    # Regelkreis
-    system_r = closed_loop(regler_r, strecke_r)
-    t_r, y_r = simulate_step(system_r, t_end=15.0)
+    # Sprungantwort des Regelkreises aus der Tabelle
+    t_r, y_r = table_r.response(**params_r)
 
-    # Sollwert
-    w_r = np.ones_like(t_r)
-
-    # Plot
-    fig_r, ax_r = plt.subplots(figsize=(12, 6))
-
-    ax_r.plot(t_r, w_r, 'r--', linewidth=2, alpha=0.7, label='Sollwert w(t)')
-    ax_r.plot(t_r, y_r, 'b-', linewidth=2.5, label='Istwert y(t)')
-
-    # Regelgüte
-    steady_state_r = y_r[-1]
-    overshoot_r = (np.max(y_r) - steady_state_r) / steady_state_r * 100 if steady_state_r != 0 else 0
-
-    ax_r.axhline(y=1.0, color='green', linestyle='--', 
-                 linewidth=1, alpha=0.5, label='Ziel: 1.0')
-
-    # 2% Band
-    ax_r.axhline(y=1.02, color='orange', linestyle=':', linewidth=1, alpha=0.3)
-    ax_r.axhline(y=0.98, color='orange', linestyle=':', linewidth=1, alpha=0.3, label='±2% Band')
-
-    ax_r.grid(True, alpha=0.3)
-    ax_r.set_xlabel("Zeit [s]", fontsize=12)
-    ax_r.set_ylabel("Signal", fontsize=12)
-    ax_r.set_title(f"Regelkreis: {regler_info} + PT1(K={K_s.value}, T={T_s.value})", 
-                   fontsize=14, fontweight='bold')
-    ax_r.legend(loc='best')
-    ax_r.set_ylim([-0.1, max(1.5, np.max(y_r) * 1.1)])
+    # Plot aktualisieren (Linien, Markierungen, Regelgüte)
+    metrics_r = plot_r.update(
+        t_r,
+        y_r,
+        title=f"Regelkreis: {regler_info} + PT1(K={K_s.value}, T={T_s.value})",
+    )
+    overshoot_r = metrics_r["overshoot_pct"]
+    steady_state_r = metrics_r["steady_state"]
 
-    plt.tight_layout()
-    fig_r
+    plot_r.fig
     return overshoot_r, steady_state_r
 
 
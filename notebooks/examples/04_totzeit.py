@@ -39,10 +39,9 @@ def _(mo):
 @app.cell
 def _():
     from regelung.strecken.totzeit import Totzeit
-    from regelung import simulate_signal
-    import matplotlib.pyplot as plt
+    from regelung import StepPlot, simulate_signal
     import numpy as np
-    return Totzeit, np, plt, simulate_signal
+    return StepPlot, Totzeit, np, simulate_signal
 
 
 @app.cell
@@ -67,7 +66,25 @@ def _(mo):
 
 
 @app.cell
-def _(Totzeit, Tt_slider, np, order_select, plt, simulate_signal):
+def _(StepPlot):
+    # Figure einmal erzeugen, Schieberegler aktualisieren nur die Daten
+    plot_tot = StepPlot(
+        title="Totzeit-Approximation",
+        ylabel="Signal",
+        label="Padé-Approximation",
+        figsize=(12, 7),
+        metrics=False,
+    )
+    plot_tot.add_line("u", label="Eingang u(t)", color="red", linestyle="--", alpha=0.7)
+    plot_tot.add_line(
+        "ideal", label="Ideale Totzeit", color="green", linestyle=":", linewidth=3
+    )
+    plot_tot.add_line("Tt", label="Totzeit Tt", color="orange", linestyle="--")
+    return (plot_tot,)
+
+
+@app.cell
+def _(Totzeit, Tt_slider, np, order_select, plot_tot, simulate_signal):
     # Totzeit-System erstellen
     totzeit_sys = Totzeit(Tt=Tt_slider.value, order=order_select.value)
 
@@ -84,28 +101,21 @@ def _(Totzeit, Tt_slider, np, order_select, plt, simulate_signal):
     delay_idx = np.argmin(np.abs(t_tot - Tt_slider.value))
     y_ideal[delay_idx:] = u_tot[:-delay_idx] if delay_idx > 0 else u_tot
 
-    # Plot
-    fig_tot, ax_tot = plt.subplots(figsize=(12, 7))
-
-    ax_tot.plot(t_tot, u_tot, 'r--', linewidth=2, alpha=0.7, label='Eingang u(t)')
-    ax_tot.plot(t_tot, y_ideal, 'g:', linewidth=3, alpha=0.5, label='Ideale Totzeit')
-    ax_tot.plot(t_out_tot, y_tot, 'b-', linewidth=2.5, 
-                label=f'Padé-Approximation ({order_select.value}. Ordnung)')
-
-    # Markiere Totzeitpunkt
-    ax_tot.axvline(x=Tt_slider.value, color='orange', linestyle='--', 
-                   linewidth=1.5, alpha=0.7, label=f'Tt = {Tt_slider.value}s')
-
-    ax_tot.grid(True, alpha=0.3)
-    ax_tot.set_xlabel("Zeit [s]", fontsize=12)
-    ax_tot.set_ylabel("Signal", fontsize=12)
-    ax_tot.set_title(f"Totzeit-Approximation: Tt={Tt_slider.value}s, Ordnung={order_select.value}", 
-                     fontsize=14, fontweight='bold')
-    ax_tot.legend(loc='best', fontsize=11)
-    ax_tot.set_ylim([-0.1, 1.3])
-
-    plt.tight_layout()
-    fig_tot
+    # Plot aktualisieren, Totzeitpunkt als senkrechte Linie
+    plot_tot.update(
+        t_out_tot,
+        y_tot,
+        title=(
+            f"Totzeit-Approximation: Tt={Tt_slider.value}s, "
+            f"Ordnung={order_select.value}"
+        ),
+        lines={
+            "u": (t_tot, u_tot),
+            "ideal": (t_tot, y_ideal),
+            "Tt": ([Tt_slider.value] * 2, [-0.1, 1.3]),
+        },
+    )
+    plot_tot.fig
     return y_ideal, y_tot
 
 
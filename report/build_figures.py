@@ -0,0 +1,83 @@
+"""
+Erzeugt die Grafiken für report.md.
+
+Nur Grafiken, deren Systeme, Zeitraster oder Stiloptionen sich seit dem
+letzten Lauf geändert haben, werden neu gezeichnet.
+
+Aufruf:
+    python report/build_figures.py [--force] [--workers N]
+"""
+
+import argparse
+from pathlib import Path
+
+from regelung import (
+    PI,
+    PT1,
+    PT2,
+    Totzeit,
+    closed_loop,
+    plot_step,
+    plot_step_with_metrics,
+    series_connection,
+    simulate_step,
+)
+from regelung.simulation.figures import FigureBuilder
+
+FIGURES = Path(__file__).parent / "figures"
+
+
+def sprung(system, t_end=10.0, **style):
+    """Sprungantwort eines Systems."""
+    t, y = simulate_step(system, t_end)
+    return plot_step(t, y, show=False, **style)
+
+
+def sprung_metriken(system, t_end=10.0, title="Sprungantwort mit Metriken"):
+    """Sprungantwort mit Regelgütekriterien."""
+    t, y = simulate_step(system, t_end)
+    return plot_step_with_metrics(t, y, title=title, show=False)
+
+
+def builder(workers=None):
+    b = FigureBuilder(FIGURES, workers=workers)
+    b.add(
+        "pt1_sprung.png",
+        sprung,
+        system=PT1(Kp=3.0, T=1.3).tf(),
+        t_end=10.0,
+        title="PT1: Kp=3.0, T=1.3",
+        show_input=True,
+    )
+    b.add(
+        "pt2_sprung.png",
+        sprung_metriken,
+        system=PT2(Kp=2.0, T1=1.0, T2=1.5).tf(),
+        t_end=20.0,
+        title="PT2: Kp=2.0, T1=1.0, T2=1.5",
+    )
+    b.add(
+        "pt1_totzeit.png",
+        sprung,
+        system=series_connection(PT1(Kp=3.0, T=1.3), Totzeit(Tt=2.0, order=2)),
+        t_end=15.0,
+        title="PT1 mit Totzeit Tt=2",
+    )
+    b.add(
+        "regelkreis_pi_pt2.png",
+        sprung_metriken,
+        system=closed_loop(PI(Kp=1.2, Ti=2.0), PT2(Kp=2.0, T1=1.0, T2=1.5)),
+        t_end=30.0,
+        title="Regelkreis PI + PT2",
+    )
+    return b
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    for name, status in builder(args.workers).build(force=args.force).items():
+        print(f"{status:>8}  {name}")
@@ -1,13 +1,25 @@
 """Regelungstechnik-Bibliothek"""
 
+from regelung.identifikation import fit_pt1, fit_pt1_totzeit, fit_pt2
 from regelung.regler import PI, PID, P
 from regelung.simulation import (
+    BlockDiagram,
+    ParametricLoop,
+    StepPlot,
+    cascade_loop,
     closed_loop,
+    final_value,
+    gang_of_four,
+    plot_metric_map,
+    plot_root_locus,
     plot_signal,
     plot_step,
+    plot_step_family,
     plot_step_with_metrics,
     series_connection,
+    simulate_closed_loop,
     simulate_signal,
+    simulate_signal_chunked,
     simulate_step,
     simulate_step_scaled,
 )
@@ -30,12 +42,27 @@ __all__ = [
     "IT1",
     # Simulation
     "closed_loop",
+    "cascade_loop",
+    "BlockDiagram",
+    "ParametricLoop",
+    "gang_of_four",
+    "final_value",
+    "simulate_closed_loop",
     "simulate_step",
     "simulate_signal",
+    "simulate_signal_chunked",
     "simulate_step_scaled",
     "series_connection",
+    # Identifikation
+    "fit_pt1",
+    "fit_pt2",
+    "fit_pt1_totzeit",
     # Plot
     "plot_step",
     "plot_step_with_metrics",
     "plot_signal",
+    "plot_root_locus",
+    "plot_metric_map",
+    "plot_step_family",
+    "StepPlot",
 ]
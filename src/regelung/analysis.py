@@ -0,0 +1,143 @@
+"""
+Pole, Nullstellen und Kenngrößen von Übertragungsgliedern.
+
+batch_roots bestimmt die Wurzeln vieler Polynome gleichen Grades über die
+Eigenwerte gestapelter Begleitmatrizen in einem einzigen LAPACK-Aufruf.
+SystemProperties ergänzt Regler und Strecken um gecachte Pole,
+Nullstellen, stationäre Verstärkung und Dämpfungstabelle.
+
+Beispiel:
+    >>> from regelung import PT2
+    >>> strecke = PT2(Kp=1.0, T1=2.0, T2=0.5)
+    >>> strecke.poles().real
+    array([-0.5, -2. ])
+    >>> strecke.damping()["zeta"]
+    array([1., 1.])
+"""
+
+import weakref
+
+import numpy as np
+
+# Objekt -> (Transfer-Funktion, {Name: Wert}); ungültig, sobald G ersetzt wird
+_CACHE = weakref.WeakKeyDictionary()
+
+
+def batch_roots(coefficients):
+    """
+    Wurzeln gestapelter Polynome über Begleitmatrizen.
+
+    Args:
+        coefficients: Koeffizienten (..., n + 1), höchste Potenz zuerst
+
+    Returns:
+        Komplexe Wurzeln (..., n), je Polynom ungeordnet. Polynome mit
+        führendem Koeffizienten 0 liefern nan.
+
+    Beispiel:
+        >>> a1 = np.linspace(1, 5, 1000)
+        >>> den = np.stack([np.ones_like(a1), a1, np.ones_like(a1)], axis=-1)
+        >>> poles = batch_roots(den)  # (1000, 2)
+    """
+    c = np.asarray(coefficients, dtype=float)
+    shape, n = c.shape[:-1], c.shape[-1] - 1
+    if n < 1:
+        return np.zeros(shape + (0,), dtype=complex)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = c[..., 1:] / c[..., :1]
+    valid = np.all(np.isfinite(a), axis=-1)
+    C = np.zeros(shape + (n, n))
+    C[..., 0, :] = np.where(valid[..., None], -a, 0.0)
+    C[..., np.arange(1, n), np.arange(n - 1)] = 1.0
+
+    roots = np.linalg.eigvals(C).astype(complex)
+    return np.where(valid[..., None], roots, np.nan)
+
+
+def damping_table(poles):
+    """
+    Eigenkreisfrequenz und Dämpfung je Pol (wie control.damp).
+
+    Args:
+        poles: Pole (..., n)
+
+    Returns:
+        dict mit poles, wn = |p| und zeta = -Re(p)/|p|, je Zeile nach wn
+        sortiert
+    """
+    poles = np.asarray(poles, dtype=complex)
+    order = np.argsort(np.abs(poles), axis=-1, kind="stable")
+    poles = np.take_along_axis(poles, order, axis=-1)
+    wn = np.abs(poles)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zeta = -poles.real / wn
+    return {"poles": poles, "wn": wn, "zeta": zeta}
+
+
+def _trimmed(coefficients):
+    c = np.trim_zeros(np.atleast_1d(np.asarray(coefficients, dtype=float)), "f")
+    return c if len(c) else np.zeros(1)
+
+
+def _dcgain(num, den):
+    """G(0); ±inf bei Polen im Ursprung (Integratoren)."""
+    if not np.any(num):
+        return 0.0
+    if den[-1] != 0:
+        return float(num[-1] / den[-1])
+    if num[-1] == 0:
+        # Gemeinsame Faktoren s kürzen
+        k = min(len(num) - len(np.trim_zeros(num, "b")), len(den) - 1)
+        return _dcgain(num[: len(num) - k], den[: len(den) - k])
+    return float(np.sign(num[-1] * den[np.flatnonzero(den)[-1]]) * np.inf)
+
+
+def _readonly(value):
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _readonly(item)
+    return value
+
+
+class SystemProperties:
+    """
+    Gecachte Kenngrößen für Klassen mit .tf().
+
+    Die Methoden heißen wie bei TransferFunction von python-control
+    (poles(), zeros(), dcgain()). Die Werte werden beim ersten Aufruf aus
+    der Übertragungsfunktion berechnet und bis zu deren Austausch
+    wiederverwendet. Der Cache liegt
+    außerhalb des Objekts, Attribute und Hashes (z.B. in der asynchronen
+    Simulation) bleiben unverändert.
+    """
+
+    def _cached(self, name, compute):
+        G = self.tf()
+        entry = _CACHE.get(self)
+        if entry is None or entry[0] is not G:
+            entry = (G, {})
+            _CACHE[self] = entry
+        values = entry[1]
+        if name not in values:
+            num, den = _trimmed(G.num[0][0]), _trimmed(G.den[0][0])
+            values[name] = _readonly(compute(num, den))
+        return values[name]
+
+    def poles(self):
+        """Pole der Übertragungsfunktion (nach Betrag sortiert)."""
+        return self._cached("poles", lambda num, den: self.damping()["poles"])
+
+    def zeros(self):
+        """Nullstellen der Übertragungsfunktion."""
+        return self._cached("zeros", lambda num, den: batch_roots(num))
+
+    def dcgain(self):
+        """Stationäre Verstärkung G(0) (±inf bei Integratoren)."""
+        return self._cached("dcgain", _dcgain)
+
+    def damping(self):
+        """Dämpfungstabelle: dict mit poles, wn, zeta (nach wn sortiert)."""
+        return self._cached("damping", lambda num, den: damping_table(batch_roots(den)))
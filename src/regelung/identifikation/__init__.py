@@ -0,0 +1,14 @@
+"""Identifikation von Streckenmodellen aus Messdaten"""
+
+from regelung.identifikation.arx import ARXEstimator, ARXModel, fit_armax, fit_arx
+from regelung.identifikation.sprung import fit_pt1, fit_pt1_totzeit, fit_pt2
+
+__all__ = [
+    "fit_pt1",
+    "fit_pt2",
+    "fit_pt1_totzeit",
+    "fit_arx",
+    "fit_armax",
+    "ARXEstimator",
+    "ARXModel",
+]
@@ -0,0 +1,367 @@
+"""
+Blockweise ARX/ARMAX-Identifikation aus langen Ein-/Ausgangsaufzeichnungen.
+
+Die Normalgleichungen Φᵀ·Φ·θ = Φᵀ·y werden Block für Block aufgebaut, so
+dass nie mehr als ein Block der Regressionsmatrix im Speicher liegt. Die
+Daten können als np.memmap bzw. als Pfad zu einer .npy-Datei übergeben
+werden und werden dann direkt von der Platte gelesen.
+
+Modellstruktur (ARMAX, ARX für nc = 0):
+    A(q) y(k) = B(q) u(k - nk) + C(q) e(k)
+
+    A(q) = 1 + a1 q⁻¹ + ... + a_na q⁻ⁿᵃ
+    B(q) = b1 + b2 q⁻¹ + ... + b_nb q⁻⁽ⁿᵇ⁻¹⁾
+    C(q) = 1 + c1 q⁻¹ + ... + c_nc q⁻ⁿᶜ
+"""
+
+import os
+
+import numpy as np
+from control import TransferFunction
+from scipy.linalg import logm
+from scipy.signal import lfilter, ss2tf
+
+from regelung.simulation.core import _realize, _tf_coefficients
+from regelung.strecken import PT1, PT2, Totzeit
+
+
+class ARXModel:
+    """
+    Zeitdiskretes ARX/ARMAX-Modell.
+
+    Args:
+        a: Koeffizienten a1..a_na
+        b: Koeffizienten b1..b_nb
+        nk: Eingangsverzögerung in Abtastschritten
+        dt: Abtastzeit in Sekunden
+        c: Koeffizienten c1..c_nc des Störmodells (optional)
+        noise_variance: Geschätzte Varianz des Residuums
+    """
+
+    def __init__(self, a, b, nk, dt, c=None, noise_variance=None):
+        self.a = np.asarray(a, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        self.c = np.zeros(0) if c is None else np.asarray(c, dtype=float)
+        self.nk = nk
+        self.dt = dt
+        self.noise_variance = noise_variance
+
+    @property
+    def delay(self):
+        """Totzeit in Sekunden über die Halteglied-Verzögerung hinaus."""
+        return max(self.nk - 1, 0) * self.dt
+
+    def _polynomials(self, shift):
+        """Zähler/Nenner in z (höchste Potenz zuerst) mit Verzögerung shift."""
+        n = max(len(self.a), shift + len(self.b) - 1)
+        num = np.zeros(n + 1)
+        den = np.zeros(n + 1)
+        num[shift : shift + len(self.b)] = self.b
+        den[0] = 1.0
+        den[1 : len(self.a) + 1] = self.a
+        return num, den
+
+    def tf(self):
+        """Zeitdiskrete Übertragungsfunktion B(z)·z⁻ⁿᵏ / A(z)."""
+        num, den = self._polynomials(self.nk)
+        return TransferFunction(num, den, self.dt)
+
+    def to_continuous(self):
+        """
+        Rechnet das Modell (ohne Totzeit, siehe delay) in eine
+        zeitkontinuierliche Übertragungsfunktion um.
+
+        Die Umrechnung invertiert die Diskretisierung mit Halteglied
+        nullter Ordnung über den Matrixlogarithmus.
+
+        Returns:
+            Zeitkontinuierliche Transfer-Funktion
+
+        Raises:
+            ValueError: Bei Polen auf der negativen reellen Achse oder bei
+                z = 0, die keine kontinuierliche Entsprechung haben
+        """
+        num, den = self._polynomials(min(self.nk, 1))
+        Ad, Bd, C, D = _realize([num], den)
+        n = Ad.shape[0]
+        if n == 0:
+            return TransferFunction([D[0, 0]], [1.0])
+
+        M = np.zeros((n + 1, n + 1))
+        M[:n, :n] = Ad
+        M[:n, n] = Bd[:, 0]
+        M[n, n] = 1.0
+
+        if np.any(np.abs(np.linalg.eigvals(Ad)) < 1e-12):
+            raise ValueError("Pole bei z = 0: nb <= na wählen")
+        L = logm(M) / self.dt
+        if np.max(np.abs(np.imag(L))) > 1e-8 * max(np.max(np.abs(L)), 1.0):
+            raise ValueError("Modell hat keine zeitkontinuierliche Entsprechung")
+        L = np.real(L)
+
+        num_c, den_c = ss2tf(L[:n, :n], L[:n, n:], C, D)
+        return TransferFunction(num_c[0], den_c)
+
+    def to_strecke(self, order=2):
+        """
+        Rechnet das Modell in Strecken-Objekte um.
+
+        Aus Verstärkung und Polen wird eine PT1- (na = 1) bzw.
+        PT2-Strecke (na = 2) gebildet. Zählernullstellen werden
+        vernachlässigt. Eine Verzögerung nk > 1 ergibt zusätzlich ein
+        Totzeit-Glied.
+
+        Args:
+            order: Ordnung der Padé-Approximation der Totzeit (default: 2)
+
+        Returns:
+            Liste von Strecken, direkt verwendbar mit series_connection
+
+        Beispiel:
+            >>> modell = fit_arx("u.npy", "y.npy", na=2, nb=2, nk=3, dt=0.01)
+            >>> system = series_connection(*modell.to_strecke())
+        """
+        num, den = _tf_coefficients(self.to_continuous())
+        den = np.trim_zeros(den, "f")
+        K = num[-1] / den[-1]
+
+        if len(den) == 2:
+            strecken = [PT1(Kp=float(K), T=float(den[0] / den[1]))]
+        elif len(den) == 3:
+            T = np.sqrt(den[0] / den[2])
+            D = den[1] / den[2] / (2 * T)
+            if D >= 1.0:
+                root = np.sqrt(D**2 - 1.0)
+                T1, T2 = T * (D + root), T * (D - root)
+                strecken = [PT2(Kp=float(K), T1=float(T1), T2=float(T2))]
+            else:
+                strecken = [PT2.from_damping(Kp=float(K), D=float(D), T=float(T))]
+        else:
+            raise ValueError(
+                "Nur Modelle mit na = 1 oder na = 2 lassen sich als PT1/PT2 "
+                "darstellen, to_continuous() verwenden"
+            )
+
+        if self.delay > 0:
+            strecken.append(Totzeit(Tt=self.delay, order=order))
+        return strecken
+
+    def __repr__(self):
+        return (
+            f"ARXModel(na={len(self.a)}, nb={len(self.b)}, nc={len(self.c)}, "
+            f"nk={self.nk}, dt={self.dt})"
+        )
+
+
+class ARXEstimator:
+    """
+    Blockweiser Aufbau der Normalgleichungen für ARX/ARMAX-Modelle.
+
+    Mit forgetting < 1 werden ältere Abtastwerte exponentiell gewichtet,
+    die Lösung entspricht dann der rekursiven Kleinste-Quadrate-Schätzung
+    mit Vergessensfaktor.
+
+    Args:
+        na: Ordnung von A
+        nb: Anzahl der B-Koeffizienten
+        nk: Eingangsverzögerung in Abtastschritten (default: 1)
+        nc: Ordnung von C (default: 0, ARX)
+        forgetting: Vergessensfaktor 0 < λ <= 1 (default: 1.0)
+
+    Beispiel:
+        >>> est = ARXEstimator(na=2, nb=2)
+        >>> for u_block, y_block in bloecke:
+        ...     est.update(u_block, y_block)
+        >>> modell = est.solve(dt=0.01)
+    """
+
+    def __init__(self, na, nb, nk=1, nc=0, forgetting=1.0):
+        if na < 0 or nb < 1 or nk < 0 or nc < 0:
+            raise ValueError("Ungültige Modellordnung")
+        if not 0 < forgetting <= 1:
+            raise ValueError("Vergessensfaktor muss in (0, 1] liegen")
+
+        self.na, self.nb, self.nk, self.nc = na, nb, nk, nc
+        self.forgetting = forgetting
+        self.lag = max(na, nk + nb - 1, nc)
+
+        n_params = na + nb + nc
+        self.R = np.zeros((n_params, n_params))
+        self.f = np.zeros(n_params)
+        self.yy = 0.0
+        self.n_samples = 0
+        self._tail = None
+
+    def update(self, u, y, e=None):
+        """
+        Nimmt einen weiteren Datenblock auf.
+
+        Args:
+            u: Eingangsblock
+            y: Ausgangsblock
+            e: Residuenblock (nur für nc > 0)
+        """
+        u = np.asarray(u, dtype=float)
+        y = np.asarray(y, dtype=float)
+        e = np.zeros_like(y) if e is None else np.asarray(e, dtype=float)
+        if not u.shape == y.shape == e.shape or y.ndim != 1:
+            raise ValueError("u, y und e müssen eindimensional und gleich lang sein")
+
+        if self._tail is not None:
+            u_old, y_old, e_old = self._tail
+            u = np.concatenate([u_old, u])
+            y = np.concatenate([y_old, y])
+            e = np.concatenate([e_old, e])
+
+        L = self.lag
+        m = len(y) - L
+        if m > 0:
+            Phi = self._regressors(u, y, e, L, m)
+            target = y[L:]
+            if self.forgetting < 1.0:
+                w = self.forgetting ** np.arange(m - 1, -1, -1, dtype=float)
+                decay = self.forgetting**m
+                self.R *= decay
+                self.f *= decay
+                self.yy *= decay
+            else:
+                w = np.ones(m)
+
+            Phi_w = Phi * w[:, None]
+            self.R += Phi_w.T @ Phi
+            self.f += Phi_w.T @ target
+            self.yy += float((w * target) @ target)
+            self.n_samples += m
+
+        start = max(len(y) - L, 0)
+        self._tail = (u[start:], y[start:], e[start:])
+
+    def _regressors(self, u, y, e, L, m):
+        cols = [-y[L - i : L - i + m] for i in range(1, self.na + 1)]
+        cols += [u[L - self.nk - j : L - self.nk - j + m] for j in range(self.nb)]
+        cols += [e[L - i : L - i + m] for i in range(1, self.nc + 1)]
+        return np.column_stack(cols)
+
+    def solve(self, dt=1.0):
+        """
+        Löst die Normalgleichungen.
+
+        Args:
+            dt: Abtastzeit in Sekunden (default: 1.0)
+
+        Returns:
+            ARXModel
+        """
+        if self.n_samples < len(self.f):
+            raise ValueError("Zu wenige Abtastwerte für die Modellordnung")
+
+        theta = np.linalg.lstsq(self.R, self.f, rcond=None)[0]
+        loss = self.yy - 2 * theta @ self.f + theta @ self.R @ theta
+        na, nb = self.na, self.nb
+        return ARXModel(
+            a=theta[:na],
+            b=theta[na : na + nb],
+            c=theta[na + nb :],
+            nk=self.nk,
+            dt=dt,
+            noise_variance=max(float(loss), 0.0) / self.n_samples,
+        )
+
+
+def _as_array(data):
+    """Pfade auf .npy-Dateien werden speicherabgebildet geöffnet."""
+    if isinstance(data, (str, os.PathLike)):
+        return np.load(data, mmap_mode="r")
+    return data
+
+
+def _blocks(u, y, chunk_size):
+    u, y = _as_array(u), _as_array(y)
+    if len(u) != len(y):
+        raise ValueError("u und y müssen gleich lang sein")
+    for start in range(0, len(y), chunk_size):
+        stop = start + chunk_size
+        u_block = np.asarray(u[start:stop], dtype=float)
+        y_block = np.asarray(y[start:stop], dtype=float)
+        yield u_block, y_block
+
+
+def fit_arx(u, y, na, nb, nk=1, dt=1.0, chunk_size=1_000_000, forgetting=1.0):
+    """
+    Identifiziert ein ARX-Modell blockweise aus Ein-/Ausgangsdaten.
+
+    Args:
+        u: Eingangsdaten (Array, np.memmap oder Pfad zu .npy)
+        y: Ausgangsdaten (Array, np.memmap oder Pfad zu .npy)
+        na: Ordnung von A
+        nb: Anzahl der B-Koeffizienten
+        nk: Eingangsverzögerung in Abtastschritten (default: 1)
+        dt: Abtastzeit in Sekunden (default: 1.0)
+        chunk_size: Abtastwerte je Block (default: 1_000_000)
+        forgetting: Vergessensfaktor (default: 1.0)
+
+    Returns:
+        ARXModel
+
+    Beispiel:
+        >>> from regelung.identifikation import fit_arx
+        >>> modell = fit_arx("log_u.npy", "log_y.npy", na=2, nb=2, dt=0.01)
+        >>> strecke, = modell.to_strecke()
+    """
+    est = ARXEstimator(na, nb, nk=nk, forgetting=forgetting)
+    for u_block, y_block in _blocks(u, y, chunk_size):
+        est.update(u_block, y_block)
+    return est.solve(dt)
+
+
+def _stabilize(poly):
+    """Spiegelt Nullstellen außerhalb des Einheitskreises nach innen."""
+    roots = np.roots(poly)
+    outside = np.abs(roots) > 1.0
+    if not np.any(outside):
+        return poly
+    roots[outside] = 1.0 / np.conj(roots[outside])
+    return np.real(np.poly(roots))
+
+
+def fit_armax(u, y, na, nb, nc, nk=1, dt=1.0, chunk_size=1_000_000, n_passes=4):
+    """
+    Identifiziert ein ARMAX-Modell mit erweiterter Kleinste-Quadrate-Schätzung.
+
+    Jeder Durchlauf liest die Daten einmal blockweise: Die Residuen e(k) des
+    vorherigen Modells werden mit durchgereichten Filterzuständen berechnet
+    und als zusätzliche Regressoren verwendet. Der erste Durchlauf ist eine
+    ARX-Schätzung.
+
+    Args:
+        u, y: Ein-/Ausgangsdaten (Array, np.memmap oder Pfad zu .npy)
+        na, nb, nc: Ordnungen von A, B und C
+        nk: Eingangsverzögerung in Abtastschritten (default: 1)
+        dt: Abtastzeit in Sekunden (default: 1.0)
+        chunk_size: Abtastwerte je Block (default: 1_000_000)
+        n_passes: Anzahl der ARMAX-Durchläufe nach der ARX-Schätzung
+
+    Returns:
+        ARXModel mit Störmodell c
+    """
+    model = fit_arx(u, y, na, nb, nk=nk, dt=dt, chunk_size=chunk_size)
+
+    for _ in range(n_passes):
+        # Nachgestellte Null hält die Filterzustände mindestens einelementig
+        a_full = np.concatenate([[1.0], model.a, [0.0]])
+        b_full = np.concatenate([np.zeros(nk), model.b, [0.0]])
+        c_full = _stabilize(np.concatenate([[1.0], model.c, [0.0]]))
+
+        zi_a = np.zeros(len(a_full) - 1)
+        zi_b = np.zeros(len(b_full) - 1)
+        zi_c = np.zeros(len(c_full) - 1)
+
+        est = ARXEstimator(na, nb, nk=nk, nc=nc)
+        for u_block, y_block in _blocks(u, y, chunk_size):
+            ay, zi_a = lfilter(a_full, [1.0], y_block, zi=zi_a)
+            bu, zi_b = lfilter(b_full, [1.0], u_block, zi=zi_b)
+            e_block, zi_c = lfilter([1.0], c_full, ay - bu, zi=zi_c)
+            est.update(u_block, y_block, e_block)
+        model = est.solve(dt)
+
+    return model
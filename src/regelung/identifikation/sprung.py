@@ -0,0 +1,270 @@
+"""
+Identifikation von PT1-, PT2- und PT1+Totzeit-Modellen aus gemessenen
+Sprungantworten.
+
+Alle Funktionen akzeptieren einen einzelnen Datensatz y (Länge N) oder einen
+Stapel Y (B×N) auf gemeinsamem Zeitvektor t. Die Anpassung erfolgt mit einem
+vektorisierten Levenberg-Marquardt-Verfahren über alle Datensätze zugleich,
+Startwerte liefern die Zeitprozentkennwerte der Sprungantwort.
+"""
+
+import numpy as np
+
+from regelung.strecken import PT1, PT2, Totzeit
+
+
+def _prepare(t, y, amplitude):
+    """Prüft Eingaben und normiert die Antworten auf die Sprunghöhe."""
+    t = np.asarray(t, dtype=float)
+    Y = np.asarray(y, dtype=float)
+    single = Y.ndim == 1
+    Y = np.atleast_2d(Y)
+
+    if t.ndim != 1 or Y.ndim != 2 or Y.shape[1] != t.shape[0]:
+        raise ValueError("y muss die Form (N,) oder (B, N) mit N = len(t) haben")
+    if len(t) < 4:
+        raise ValueError("Mindestens 4 Messpunkte erforderlich")
+    if amplitude == 0:
+        raise ValueError("Sprunghöhe darf nicht 0 sein")
+
+    return t - t[0], Y / amplitude, single
+
+
+def _final_value(Y):
+    """Endwert als Mittelwert der letzten 5% der Messpunkte."""
+    n_tail = max(1, Y.shape[1] // 20)
+    return Y[:, -n_tail:].mean(axis=1)
+
+
+def _crossing_times(t, Y, y_inf, fractions):
+    """
+    Erste Durchgangszeiten durch Bruchteile des Endwerts (linear interpoliert).
+
+    Returns:
+        Array der Form (B, len(fractions))
+    """
+    Yn = Y / np.where(y_inf == 0, 1.0, y_inf)[:, None]
+    rows = np.arange(Y.shape[0])
+    times = np.empty((Y.shape[0], len(fractions)))
+
+    for j, f in enumerate(fractions):
+        reached = Yn >= f
+        idx = np.argmax(reached, axis=1)
+        prev = np.maximum(idx - 1, 0)
+        y0, y1 = Yn[rows, prev], Yn[rows, idx]
+        slope = np.where(y1 > y0, y1 - y0, 1.0)
+        frac = np.clip((f - y0) / slope, 0.0, 1.0)
+        tc = t[prev] + frac * (t[idx] - t[prev])
+        times[:, j] = np.where(reached.any(axis=1), tc, t[-1])
+
+    return times
+
+
+def _pt1_model(p, t):
+    K, T = p[:, 0:1], p[:, 1:2]
+    return K * (1.0 - np.exp(-t / T))
+
+
+def _pt1_totzeit_model(p, t):
+    K, T, Tt = p[:, 0:1], p[:, 1:2], p[:, 2:3]
+    tau = np.maximum(t - Tt, 0.0)
+    return K * (1.0 - np.exp(-tau / T))
+
+
+def _pt2_model(p, t):
+    K, D, T = p[:, 0:1], p[:, 1:2], p[:, 2:3]
+    # Aperiodischer Grenzfall D = 1 ist eine hebbare Singularität
+    D = np.where(np.abs(D - 1.0) < 1e-6, 1.0 + 1e-6, D)
+    root = np.sqrt(D.astype(complex) ** 2 - 1.0)
+    p1 = (-D + root) / T
+    p2 = (-D - root) / T
+    with np.errstate(over="ignore", invalid="ignore"):
+        h = 1.0 + (p2 * np.exp(p1 * t) - p1 * np.exp(p2 * t)) / (p1 - p2)
+    return K * h.real
+
+
+def _levenberg_marquardt(model, params, t, Y, lower, n_iter=60):
+    """
+    Vektorisiertes Levenberg-Marquardt-Verfahren für B Datensätze.
+
+    Args:
+        model: Funktion (params (B, p), t (N,)) -> (B, N)
+        params: Startwerte (B, p)
+        t: Zeitvektor (N,)
+        Y: Messdaten (B, N)
+        lower: Untere Parametergrenzen (p,)
+        n_iter: Anzahl Iterationen
+
+    Returns:
+        params, rms: Angepasste Parameter und RMS-Residuen je Datensatz
+    """
+    B, n_p = params.shape
+    lam = np.full(B, 1e-3)
+    eye = np.eye(n_p)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        f = model(params, t)
+        cost = np.sum((Y - f) ** 2, axis=1)
+
+        for _ in range(n_iter):
+            J = np.empty((B, len(t), n_p))
+            for i in range(n_p):
+                h = 1e-6 * np.maximum(np.abs(params[:, i]), 1e-3)
+                shifted = params.copy()
+                shifted[:, i] += h
+                J[:, :, i] = (model(shifted, t) - f) / h[:, None]
+
+            JtJ = np.einsum("bni,bnj->bij", J, J)
+            g = np.einsum("bni,bn->bi", J, Y - f)
+            diag = np.diagonal(JtJ, axis1=1, axis2=2)[:, :, None] * eye
+            damping = lam[:, None, None] * (diag + 1e-12 * eye)
+            step = np.linalg.solve(JtJ + damping, g[:, :, None])
+
+            candidate = np.maximum(params + step[:, :, 0], lower)
+            f_new = model(candidate, t)
+            cost_new = np.sum((Y - f_new) ** 2, axis=1)
+
+            better = np.isfinite(cost_new) & (cost_new < cost)
+            params = np.where(better[:, None], candidate, params)
+            f = np.where(better[:, None], f_new, f)
+            cost = np.where(better, cost_new, cost)
+            lam = np.where(better, lam / 3.0, lam * 4.0)
+
+    return params, np.sqrt(cost / len(t))
+
+
+def _result(models, rms, amplitude, single):
+    rms = rms * abs(amplitude)
+    if single:
+        return models[0], float(rms[0])
+    return models, rms
+
+
+def fit_pt1(t, y, amplitude=1.0):
+    """
+    Identifiziert PT1-Strecken aus gemessenen Sprungantworten.
+
+    Startwert für T ist die 63%-Zeit der Sprungantwort.
+
+    Args:
+        t: Zeitvektor (N,), Sprung bei t[0]
+        y: Sprungantwort (N,) oder Stapel von Sprungantworten (B, N)
+        amplitude: Höhe des Eingangssprungs (default: 1.0)
+
+    Returns:
+        (strecke, residuum) für einen Datensatz bzw.
+        (Liste von PT1, Array der RMS-Residuen) für einen Stapel
+
+    Beispiel:
+        >>> import numpy as np
+        >>> from regelung.identifikation import fit_pt1
+        >>> t = np.linspace(0, 10, 500)
+        >>> y = 2.0 * (1 - np.exp(-t / 1.5)) + 0.01 * np.random.randn(500)
+        >>> strecke, residuum = fit_pt1(t, y)
+    """
+    t, Y, single = _prepare(t, y, amplitude)
+
+    K0 = _final_value(Y)
+    T0 = _crossing_times(t, Y, K0, [0.632])[:, 0]
+    p0 = np.column_stack([K0, np.maximum(T0, 1e-6)])
+
+    params, rms = _levenberg_marquardt(
+        _pt1_model, p0, t, Y, lower=np.array([-np.inf, 1e-9])
+    )
+
+    models = [PT1(Kp=float(K), T=float(T)) for K, T in params]
+    return _result(models, rms, amplitude, single)
+
+
+def fit_pt1_totzeit(t, y, amplitude=1.0, order=2):
+    """
+    Identifiziert PT1-Strecken mit Totzeit aus gemessenen Sprungantworten.
+
+    Startwerte liefert das Zeitprozentkennwert-Verfahren:
+        T = 1.5 · (t63 - t28),  Tt = t63 - T
+
+    Args:
+        t: Zeitvektor (N,), Sprung bei t[0]
+        y: Sprungantwort (N,) oder Stapel von Sprungantworten (B, N)
+        amplitude: Höhe des Eingangssprungs (default: 1.0)
+        order: Ordnung der Padé-Approximation der Totzeit (default: 2)
+
+    Returns:
+        ((PT1, Totzeit), residuum) für einen Datensatz bzw.
+        (Liste von (PT1, Totzeit), Array der RMS-Residuen) für einen Stapel
+
+    Beispiel:
+        >>> from regelung import series_connection
+        >>> (strecke, totzeit), residuum = fit_pt1_totzeit(t, y)
+        >>> modell = series_connection(strecke, totzeit)
+    """
+    t, Y, single = _prepare(t, y, amplitude)
+
+    K0 = _final_value(Y)
+    t28, t63 = _crossing_times(t, Y, K0, [0.283, 0.632]).T
+    T0 = np.maximum(1.5 * (t63 - t28), 1e-6)
+    Tt0 = np.maximum(t63 - T0, 0.0)
+    p0 = np.column_stack([K0, T0, Tt0])
+
+    params, rms = _levenberg_marquardt(
+        _pt1_totzeit_model, p0, t, Y, lower=np.array([-np.inf, 1e-9, 0.0])
+    )
+
+    models = [
+        (PT1(Kp=float(K), T=float(T)), Totzeit(Tt=float(Tt), order=order))
+        for K, T, Tt in params
+    ]
+    return _result(models, rms, amplitude, single)
+
+
+def fit_pt2(t, y, amplitude=1.0):
+    """
+    Identifiziert PT2-Strecken aus gemessenen Sprungantworten.
+
+    Angepasst wird die Standardform G(s) = K / (T² s² + 2 D T s + 1).
+    Schwingende Antworten starten mit D und T aus PT2.identify_from_step
+    (erstes Maximum), aperiodische mit D = 1.5 und T = t63 / 3.
+
+    Args:
+        t: Zeitvektor (N,), Sprung bei t[0]
+        y: Sprungantwort (N,) oder Stapel von Sprungantworten (B, N)
+        amplitude: Höhe des Eingangssprungs (default: 1.0)
+
+    Returns:
+        (strecke, residuum) für einen Datensatz bzw.
+        (Liste von PT2, Array der RMS-Residuen) für einen Stapel.
+        Für D >= 1 wird PT2(Kp, T1, T2) erzeugt, sonst PT2.from_damping.
+    """
+    t, Y, single = _prepare(t, y, amplitude)
+
+    K0 = _final_value(Y)
+    t63 = _crossing_times(t, Y, K0, [0.632])[:, 0]
+    D0 = np.full(len(K0), 1.5)
+    T0 = np.maximum(t63 / 3.0, 1e-6)
+
+    # Schwingende Antworten: Kennwerte aus dem ersten Maximum
+    rows = np.arange(Y.shape[0])
+    Yn = Y / np.where(K0 == 0, 1.0, K0)[:, None]
+    i_max = np.argmax(Yn, axis=1)
+    x = Yn[rows, i_max] - 1.0
+    oscillating = x > 0.01
+    ln_term = np.log(np.where(oscillating, x, 0.5))
+    D_osc = -ln_term / np.sqrt(np.pi**2 + ln_term**2)
+    T_osc = t[i_max] * np.sqrt(1 - D_osc**2) / np.pi
+    D0 = np.where(oscillating, D_osc, D0)
+    T0 = np.where(oscillating & (T_osc > 0), T_osc, T0)
+
+    p0 = np.column_stack([K0, D0, T0])
+    params, rms = _levenberg_marquardt(
+        _pt2_model, p0, t, Y, lower=np.array([-np.inf, 1e-3, 1e-9])
+    )
+
+    models = []
+    for K, D, T in params:
+        if D >= 1.0:
+            root = np.sqrt(D**2 - 1.0)
+            T1, T2 = T * (D + root), T * (D - root)
+            models.append(PT2(Kp=float(K), T1=float(T1), T2=float(T2)))
+        else:
+            models.append(PT2.from_damping(Kp=float(K), D=float(D), T=float(T)))
+    return _result(models, rms, amplitude, single)
@@ -2,8 +2,10 @@ from abc import ABC, abstractmethod
 
 from control import TransferFunction
 
+from regelung.analysis import SystemProperties
 
-class Controller(ABC):
+
+class Controller(SystemProperties, ABC):
     """Basis-Klasse für alle Regler"""
 
     @abstractmethod
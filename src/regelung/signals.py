@@ -0,0 +1,272 @@
+"""
+Testsignale für die Simulation.
+
+Alle Signale sind zeitvektorisiert auswertbar (signal(t)) und lassen sich
+entweder komplett (sample) oder blockweise (chunks) erzeugen. Die Blöcke
+passen direkt zu simulate_signal_chunked, so dass sehr lange Anregungen
+nie vollständig im Speicher liegen.
+
+Beispiel:
+    >>> from regelung import PT1, simulate_signal, simulate_signal_chunked
+    >>> from regelung.signals import PRBS, Step
+    >>> strecke = PT1(Kp=2.0, T=1.0)
+    >>> t, u = Step(amplitude=2.5).sample(t_end=10.0, dt=0.01)
+    >>> t, y = simulate_signal(strecke.tf(), t, u)
+    >>> anregung = PRBS(amplitude=0.5, bit_time=0.2, nbits=12)
+    >>> for t, y in simulate_signal_chunked(strecke, anregung.chunks(1e5, 0.01)):
+    ...     pass  # Block weiterverarbeiten
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+from scipy.signal import chirp, max_len_seq
+
+
+class Signal(ABC):
+    """Basis-Klasse für alle Testsignale"""
+
+    @abstractmethod
+    def __call__(self, t):
+        """Wertet das Signal an den Zeitpunkten t aus."""
+
+    def sample(self, t_end, dt):
+        """
+        Erzeugt das Signal auf einem äquidistanten Zeitraster.
+
+        Args:
+            t_end: Endzeit in Sekunden
+            dt: Abtastzeit in Sekunden
+
+        Returns:
+            t, u: Zeitvektor und Signalwerte
+        """
+        t = np.arange(int(round(t_end / dt)) + 1) * dt
+        return t, self(t)
+
+    def chunks(self, t_end, dt, chunk_size=100_000):
+        """
+        Erzeugt das Signal blockweise auf einem äquidistanten Zeitraster.
+
+        Args:
+            t_end: Endzeit in Sekunden
+            dt: Abtastzeit in Sekunden
+            chunk_size: Abtastwerte je Block (default: 100_000)
+
+        Yields:
+            t, u: Zeitvektor und Signalwerte des Blocks
+        """
+        n_total = int(round(t_end / dt)) + 1
+        for start in range(0, n_total, chunk_size):
+            t = np.arange(start, min(start + chunk_size, n_total)) * dt
+            yield t, self(t)
+
+    def __add__(self, other):
+        return _Sum(self, other)
+
+    def __mul__(self, factor):
+        return _Scaled(self, factor)
+
+    __rmul__ = __mul__
+
+
+class _Sum(Signal):
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+
+    def __call__(self, t):
+        return self.first(t) + self.second(t)
+
+    def __repr__(self):
+        return f"{self.first!r} + {self.second!r}"
+
+
+class _Scaled(Signal):
+    def __init__(self, signal, factor):
+        self.signal = signal
+        self.factor = factor
+
+    def __call__(self, t):
+        return self.factor * self.signal(t)
+
+    def __repr__(self):
+        return f"{self.factor} * {self.signal!r}"
+
+
+class Step(Signal):
+    """
+    Sprung: u(t) = amplitude für t >= t0, sonst 0
+
+    Args:
+        amplitude: Sprunghöhe (default: 1.0)
+        t0: Sprungzeitpunkt in Sekunden (default: 0.0)
+    """
+
+    def __init__(self, amplitude: float = 1.0, t0: float = 0.0):
+        self.amplitude = amplitude
+        self.t0 = t0
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        return np.where(t >= self.t0, self.amplitude, 0.0)
+
+    def __repr__(self):
+        return f"Step(amplitude={self.amplitude}, t0={self.t0})"
+
+
+class Ramp(Signal):
+    """
+    Rampe: u(t) = slope · (t - t0) für t >= t0, sonst 0
+
+    Args:
+        slope: Steigung (default: 1.0)
+        t0: Startzeitpunkt in Sekunden (default: 0.0)
+    """
+
+    def __init__(self, slope: float = 1.0, t0: float = 0.0):
+        self.slope = slope
+        self.t0 = t0
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        return self.slope * np.maximum(t - self.t0, 0.0)
+
+    def __repr__(self):
+        return f"Ramp(slope={self.slope}, t0={self.t0})"
+
+
+class Sine(Signal):
+    """
+    Sinus: u(t) = offset + amplitude · sin(2π·frequency·t + phase)
+
+    Args:
+        amplitude: Amplitude (default: 1.0)
+        frequency: Frequenz in Hz (default: 1.0)
+        phase: Phasenverschiebung in rad (default: 0.0)
+        offset: Gleichanteil (default: 0.0)
+    """
+
+    def __init__(
+        self,
+        amplitude: float = 1.0,
+        frequency: float = 1.0,
+        phase: float = 0.0,
+        offset: float = 0.0,
+    ):
+        self.amplitude = amplitude
+        self.frequency = frequency
+        self.phase = phase
+        self.offset = offset
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        arg = 2 * np.pi * self.frequency * t + self.phase
+        return self.offset + self.amplitude * np.sin(arg)
+
+    def __repr__(self):
+        return f"Sine(amplitude={self.amplitude}, frequency={self.frequency})"
+
+
+class Chirp(Signal):
+    """
+    Gleitsinus von f0 (bei t = 0) bis f1 (bei t = t1).
+
+    Args:
+        f0: Startfrequenz in Hz
+        f1: Frequenz bei t1 in Hz
+        t1: Zeitpunkt der Frequenz f1 in Sekunden
+        amplitude: Amplitude (default: 1.0)
+        method: "linear", "quadratic", "logarithmic" oder "hyperbolic"
+    """
+
+    def __init__(
+        self,
+        f0: float,
+        f1: float,
+        t1: float,
+        amplitude: float = 1.0,
+        method: str = "linear",
+    ):
+        self.f0 = f0
+        self.f1 = f1
+        self.t1 = t1
+        self.amplitude = amplitude
+        self.method = method
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        u = chirp(t, f0=self.f0, t1=self.t1, f1=self.f1, method=self.method, phi=-90)
+        return self.amplitude * u
+
+    def __repr__(self):
+        return f"Chirp(f0={self.f0}, f1={self.f1}, t1={self.t1})"
+
+
+class PRBS(Signal):
+    """
+    Pseudo-Rausch-Binärsignal (Maximalfolge) mit Werten ±amplitude.
+
+    Die Folge der Länge 2^nbits - 1 wird einmal erzeugt und periodisch
+    fortgesetzt, daher ist jede Auswertung unabhängig vom Zeitbereich.
+
+    Args:
+        amplitude: Amplitude (default: 1.0)
+        bit_time: Dauer eines Bits in Sekunden (default: 1.0)
+        nbits: Registerlänge des Schieberegisters (default: 10)
+        offset: Gleichanteil (default: 0.0)
+    """
+
+    def __init__(
+        self,
+        amplitude: float = 1.0,
+        bit_time: float = 1.0,
+        nbits: int = 10,
+        offset: float = 0.0,
+    ):
+        self.amplitude = amplitude
+        self.bit_time = bit_time
+        self.nbits = nbits
+        self.offset = offset
+        self._sequence = 2.0 * max_len_seq(nbits)[0] - 1.0
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        idx = np.floor(t / self.bit_time).astype(np.int64) % len(self._sequence)
+        return self.offset + self.amplitude * self._sequence[idx]
+
+    def __repr__(self):
+        return f"PRBS(amplitude={self.amplitude}, bit_time={self.bit_time})"
+
+
+class Setpoints(Signal):
+    """
+    Stückweise konstantes Sollwertprofil.
+
+    Args:
+        times: Umschaltzeitpunkte in Sekunden (aufsteigend)
+        values: Werte ab dem jeweiligen Umschaltzeitpunkt
+        initial: Wert vor dem ersten Umschaltzeitpunkt (default: 0.0)
+
+    Beispiel:
+        >>> profil = Setpoints(times=[0, 10, 25], values=[1.0, 2.5, 0.5])
+    """
+
+    def __init__(self, times, values, initial: float = 0.0):
+        self.times = np.asarray(times, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        self.initial = initial
+
+        if self.times.shape != self.values.shape or self.times.ndim != 1:
+            raise ValueError("times und values müssen gleich lang sein")
+        if np.any(np.diff(self.times) < 0):
+            raise ValueError("times muss aufsteigend sortiert sein")
+
+        self._levels = np.concatenate([[initial], self.values])
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        return self._levels[np.searchsorted(self.times, t, side="right")]
+
+    def __repr__(self):
+        return f"Setpoints(n={len(self.times)}, initial={self.initial})"
@@ -1,27 +1,67 @@
 """Simulation und Visualisierung von Regelkreisen"""
 
+from regelung.simulation.batch import simulate_signal_batch, simulate_step_batch
 from regelung.simulation.core import (
     closed_loop,
+    final_value,
+    gang_of_four,
     series_connection,
+    simulate_closed_loop,
     simulate_signal,
+    simulate_signal_chunked,
     simulate_step,
     simulate_step_scaled,
 )
+from regelung.simulation.diagram import BlockDiagram, cascade_loop
+from regelung.simulation.metrics import step_metrics_batch, step_metrics_sweep
+from regelung.simulation.parametric import ParametricLoop
 from regelung.simulation.plot import (
+    StepPlot,
     get_step_metrics,
+    plot_metric_map,
+    plot_root_locus,
     plot_signal,
     plot_step,
+    plot_step_family,
     plot_step_with_metrics,
 )
+from regelung.simulation.reduction import balanced_reduction, hankel_singular_values
+from regelung.simulation.rootlocus import root_locus
+from regelung.simulation.sensitivity import step_sensitivities
+from regelung.simulation.setpoint import simulate_setpoint_profile
+from regelung.simulation.steady_state import error_constants
+from regelung.simulation.table import ResponseTable
 
 __all__ = [
     "closed_loop",
+    "cascade_loop",
+    "BlockDiagram",
+    "ParametricLoop",
+    "ResponseTable",
+    "gang_of_four",
+    "final_value",
+    "error_constants",
+    "simulate_closed_loop",
     "simulate_step",
     "simulate_signal",
+    "simulate_signal_chunked",
     "simulate_step_scaled",
+    "simulate_setpoint_profile",
     "series_connection",
+    "simulate_step_batch",
+    "simulate_signal_batch",
     "plot_step",
     "plot_step_with_metrics",
     "plot_signal",
+    "plot_root_locus",
+    "plot_metric_map",
+    "plot_step_family",
+    "StepPlot",
+    "root_locus",
     "get_step_metrics",
+    "step_metrics_batch",
+    "step_metrics_sweep",
+    "step_sensitivities",
+    "balanced_reduction",
+    "hankel_singular_values",
 ]
@@ -0,0 +1,184 @@
+"""
+asyncio-Schnittstelle für die Simulationsfunktionen.
+
+Die blockierenden Berechnungen laufen in einem Thread- oder Prozess-Pool,
+der Event-Loop bleibt frei. Gleichzeitige identische Anfragen werden zu
+einer Berechnung zusammengefasst und die Anzahl gleichzeitig laufender
+Berechnungen ist begrenzt (Gegendruck). Abgebrochene Anfragen, die noch auf
+einen Platz warten, entfallen; bereits laufende Berechnungen lassen sich im
+Executor nicht abbrechen und belegen ihren Platz bis zum Ende.
+
+Beispiel:
+    >>> import asyncio
+    >>> from regelung import PT1, P
+    >>> from regelung.simulation.aio import closed_loop_async, simulate_step_async
+    >>>
+    >>> async def handler():
+    ...     system = await closed_loop_async(P(Kp=2.0), PT1(Kp=1.0, T=1.0))
+    ...     return await simulate_step_async(system, t_end=10.0)
+    >>>
+    >>> t, y = asyncio.run(handler())
+"""
+
+import asyncio
+import functools
+
+from regelung.simulation.core import closed_loop, simulate_signal, simulate_step
+from regelung.simulation.hashing import freeze
+
+
+class AsyncSimulator:
+    """
+    Führt Simulationen asynchron in einem Executor aus.
+
+    Args:
+        executor: concurrent.futures-Executor (default: None, Standard-
+            Thread-Pool des Event-Loops). Ein ProcessPoolExecutor erfordert
+            pickle-fähige Argumente.
+        max_concurrency: Maximale Anzahl gleichzeitig laufender
+            Berechnungen (default: None, unbegrenzt). Weitere Anfragen warten.
+    """
+
+    def __init__(self, executor=None, max_concurrency=None):
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+        self._inflight = {}
+
+    @property
+    def pending(self):
+        """Anzahl der laufenden oder wartenden Berechnungen."""
+        return len(self._inflight)
+
+    async def _execute(self, func, args):
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None:
+            return await loop.run_in_executor(self.executor, func, *args)
+        await self._semaphore.acquire()
+        try:
+            future = loop.run_in_executor(self.executor, func, *args)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        # Platz erst freigeben, wenn der Executor fertig ist, auch wenn die
+        # Anfrage vorher abgebrochen wird
+        future.add_done_callback(lambda _: self._semaphore.release())
+        return await asyncio.shield(future)
+
+    def _forget(self, key, task, _future):
+        entry = self._inflight.get(key)
+        if entry is not None and entry[0] is task:
+            del self._inflight[key]
+
+    async def submit(self, func, *args):
+        """
+        Führt func(*args) im Executor aus.
+
+        Läuft bereits eine Berechnung mit identischen Argumenten, wird auf
+        deren Ergebnis gewartet. Wird die letzte wartende Anfrage
+        abgebrochen, entfällt die Berechnung, solange sie noch auf einen
+        Platz (max_concurrency) wartet. Eine bereits laufende Berechnung
+        wird zu Ende geführt und belegt ihren Platz bis dahin.
+
+        Args:
+            func: Blockierende Funktion (pickle-fähig für Prozess-Pools)
+            *args: Argumente
+
+        Returns:
+            Rückgabewert von func
+        """
+        key = (getattr(func, "__qualname__", repr(func)), freeze(args))
+        entry = self._inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self._execute(func, args))
+            entry = self._inflight[key] = [task, 0]
+            task.add_done_callback(functools.partial(self._forget, key, task))
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if entry[1] == 1 and not task.done():
+                task.cancel()
+                self._forget(key, task, None)
+            raise
+        finally:
+            entry[1] -= 1
+
+    async def simulate_step(self, system, t_end=10.0):
+        """Asynchrone Variante von simulate_step."""
+        return await self.submit(simulate_step, system, t_end)
+
+    async def simulate_signal(self, system, t, u):
+        """Asynchrone Variante von simulate_signal."""
+        return await self.submit(simulate_signal, system, t, u)
+
+    async def closed_loop(self, regler, strecke):
+        """Asynchrone Variante von closed_loop."""
+        return await self.submit(closed_loop, regler, strecke)
+
+
+_default = AsyncSimulator()
+
+
+def configure(executor=None, max_concurrency=None):
+    """
+    Konfiguriert den Executor der Modulfunktionen.
+
+    Args:
+        executor: concurrent.futures-Executor (default: Thread-Pool des Loops)
+        max_concurrency: Maximale Anzahl gleichzeitiger Berechnungen
+
+    Returns:
+        Der neue Standard-AsyncSimulator
+    """
+    global _default
+    _default = AsyncSimulator(executor=executor, max_concurrency=max_concurrency)
+    return _default
+
+
+async def simulate_step_async(system, t_end=10.0):
+    """
+    Simuliert die Sprungantwort ohne den Event-Loop zu blockieren.
+
+    Args:
+        system: Transfer-Funktion oder Regelkreis
+        t_end: Simulationsende in Sekunden (default: 10.0)
+
+    Returns:
+        t, y: Zeit- und Ausgangsvektoren
+    """
+    return await _default.simulate_step(system, t_end)
+
+
+async def simulate_signal_async(system, t, u):
+    """
+    Simuliert die Antwort auf ein Eingangssignal ohne den Event-Loop zu
+    blockieren.
+
+    Args:
+        system: Transfer-Funktion oder Regelkreis
+        t: Zeitvektor
+        u: Eingangssignal
+
+    Returns:
+        t, y: Zeit- und Ausgangsvektoren
+    """
+    return await _default.simulate_signal(system, t, u)
+
+
+async def closed_loop_async(regler, strecke):
+    """
+    Erstellt den geschlossenen Regelkreis ohne den Event-Loop zu blockieren.
+
+    Args:
+        regler: Regler-Objekt mit .tf() Methode
+        strecke: Strecken-Objekt mit .tf() Methode
+
+    Returns:
+        Transfer-Funktion des geschlossenen Regelkreises
+    """
+    return await _default.closed_loop(regler, strecke)
@@ -0,0 +1,241 @@
+"""
+Gestapelte Simulation vieler SISO-Systeme auf einem gemeinsamen Zeitraster.
+
+Alle Systeme werden auf eine gemeinsame Ordnung gebracht, gemeinsam
+diskretisiert (Halteglied erster Ordnung, wie forced_response) und in einer
+einzigen Zustandsrekursion über alle Systeme zugleich simuliert.
+"""
+
+import numpy as np
+from scipy.linalg import expm
+
+from regelung.simulation.core import _tf_coefficients
+
+
+def _coefficient_batch(systems):
+    """
+    Bringt Systeme auf gestapelte Koeffizienten gleicher Ordnung.
+
+    Systeme niedrigerer Ordnung werden mit s^k in Zähler und Nenner
+    erweitert, das ändert die Übertragungsfunktion nicht.
+
+    Args:
+        systems: Liste von Transfer-Funktionen/Objekten mit .tf() oder
+            Tupel (num, den) von Koeffizienten-Arrays der Form (B, m)
+
+    Returns:
+        num, den: Arrays der Form (B, n + 1), höchste Potenz zuerst
+    """
+    if isinstance(systems, tuple) and len(systems) == 2:
+        num = np.atleast_2d(np.asarray(systems[0], dtype=float))
+        den = np.atleast_2d(np.asarray(systems[1], dtype=float))
+        if num.shape[-1] > den.shape[-1]:
+            raise ValueError("Übertragungsfunktion ist nicht proper")
+        num = np.pad(num, ((0, 0), (den.shape[-1] - num.shape[-1], 0)))
+        num, den = np.broadcast_arrays(num, den)
+        if np.any(den[:, 0] == 0):
+            raise ValueError("Führender Nennerkoeffizient darf nicht 0 sein")
+        return np.array(num), np.array(den)
+
+    return _stack_coefficients([_tf_coefficients(system) for system in systems])
+
+
+def _stack_coefficients(pairs):
+    """
+    Stapelt einzelne (num, den)-Paare unterschiedlicher Ordnung.
+
+    Args:
+        pairs: Liste von (num, den), höchste Potenz zuerst
+
+    Returns:
+        num, den: Arrays der Form (B, n + 1)
+    """
+    coefficients = []
+    for num, den in pairs:
+        num = np.trim_zeros(np.asarray(num, dtype=float), "f")
+        den = np.trim_zeros(np.asarray(den, dtype=float), "f")
+        if len(num) > len(den):
+            raise ValueError("Übertragungsfunktion ist nicht proper")
+        num = np.concatenate([np.zeros(len(den) - len(num)), num])
+        coefficients.append((num, den))
+
+    n = max(len(den) for _, den in coefficients)
+    num = np.array([np.pad(b, (0, n - len(b))) for b, _ in coefficients])
+    den = np.array([np.pad(a, (0, n - len(a))) for _, a in coefficients])
+    return num, den
+
+
+def _realize_batch(num, den):
+    """
+    Beobachtbarkeitsnormalform für gestapelte Koeffizienten.
+
+    Returns:
+        A (B, n, n), b (B, n), d (B,) mit Ausgang y = x[0] + d·u
+    """
+    a = den / den[:, :1]
+    bn = num / den[:, :1]
+    n = den.shape[1] - 1
+
+    A = np.zeros((len(den), n, n))
+    A[:, :, 0] = -a[:, 1:]
+    A[:, np.arange(n - 1), np.arange(1, n)] = 1.0
+    d = bn[:, 0]
+    b = bn[:, 1:] - d[:, None] * a[:, 1:]
+    return A, b, d
+
+
+def _discretize_batch(A, b, dt):
+    """
+    Diskretisierung mit Halteglied erster Ordnung (lineare Interpolation).
+
+    Returns:
+        Phi, g1, g2: x[k+1] = Phi x[k] + g1 u[k] + g2 (u[k+1] - u[k])
+    """
+    B, n, _ = A.shape
+    M = np.zeros((B, n + 2, n + 2))
+    M[:, :n, :n] = A * dt
+    M[:, :n, n] = b * dt
+    M[:, n, n + 1] = 1.0
+    E = expm(M)
+    return E[:, :n, :n], E[:, :n, n], E[:, :n, n + 1]
+
+
+def _uniform_dt(t):
+    t = np.asarray(t, dtype=float)
+    if t.ndim != 1 or len(t) < 2:
+        raise ValueError("Zeitvektor braucht mindestens 2 Punkte")
+    steps = np.diff(t)
+    if not np.allclose(steps, steps[0], rtol=1e-6, atol=0):
+        raise ValueError("Zeitvektor muss äquidistant sein")
+    return float(steps[0])
+
+
+def _dtype(precision):
+    """Prüft die Rechengenauigkeit ("float64" oder "float32")."""
+    dtype = np.dtype(precision)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"Nicht unterstützte Genauigkeit: {precision}")
+    return dtype
+
+
+def _hurwitz_stable(den):
+    """
+    Routh-Hurwitz-Kriterium für gestapelte Nennerpolynome.
+
+    Args:
+        den: Koeffizienten (..., n + 1), höchste Potenz zuerst
+
+    Returns:
+        Bool-Array (...), True wenn alle Pole in der linken Halbebene liegen
+    """
+    den = np.asarray(den, dtype=float)
+    lead = den[..., :1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = den / np.where(lead != 0, lead, np.nan)
+    stable = np.all(a > 0, axis=-1)
+    n = den.shape[-1] - 1
+    if n < 2:
+        return stable
+
+    width = n // 2 + 1
+    prev = np.zeros(den.shape[:-1] + (width,))
+    cur = np.zeros_like(prev)
+    prev[..., : len(range(0, n + 1, 2))] = a[..., 0::2]
+    cur[..., : len(range(1, n + 1, 2))] = a[..., 1::2]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(n - 1):
+            pivot = cur[..., :1]
+            stable &= pivot[..., 0] > 0
+            nxt = np.zeros_like(cur)
+            nxt[..., :-1] = prev[..., 1:] - prev[..., :1] * cur[..., 1:] / pivot
+            prev, cur = cur, nxt
+    return stable & (cur[..., 0] > 0)
+
+
+def _simulate_batch(num, den, t, U, precision="float64"):
+    """
+    Zustandsrekursion für alle Systeme zugleich.
+
+    Realisierung und Diskretisierung laufen immer in float64, nur die
+    Rekursion und die Trajektorien verwenden die gewählte Genauigkeit.
+
+    Args:
+        num, den: Gestapelte Koeffizienten (B, n + 1)
+        t: Äquidistanter Zeitvektor (N,)
+        U: Eingänge (B, N)
+        precision: "float64" oder "float32" (default: "float64")
+
+    Returns:
+        Y: Ausgänge (B, N) in der gewählten Genauigkeit
+    """
+    dtype = _dtype(precision)
+    dt = _uniform_dt(t)
+    A, b, d = _realize_batch(num, den)
+    U = np.asarray(U, dtype=dtype)
+    n = A.shape[1]
+    if n == 0:
+        return (d[:, None] * U).astype(dtype)
+
+    Phi, g1, g2 = (M.astype(dtype) for M in _discretize_batch(A, b, dt))
+    d = d.astype(dtype)
+    Y = np.empty_like(U)
+    x = np.zeros((len(num), n), dtype=dtype)
+    for k in range(U.shape[1]):
+        Y[:, k] = x[:, 0] + d * U[:, k]
+        if k + 1 < U.shape[1]:
+            du = U[:, k + 1] - U[:, k]
+            x = np.matmul(Phi, x[:, :, None])[:, :, 0]
+            x += g1 * U[:, k, None] + g2 * du[:, None]
+    return Y
+
+
+def simulate_step_batch(systems, t_end=10.0, n_points=1000, precision="float64"):
+    """
+    Simuliert die Sprungantworten vieler Systeme in einem Durchlauf.
+
+    Args:
+        systems: Liste von Transfer-Funktionen/Regelkreisen/Objekten mit
+            .tf() oder Tupel (num, den) gestapelter Koeffizienten
+        t_end: Simulationsende in Sekunden (default: 10.0)
+        n_points: Anzahl der Zeitpunkte (default: 1000)
+        precision: "float64" oder "float32" für Zustände und Trajektorien
+            (default: "float64"). Die Diskretisierung erfolgt immer in
+            float64; mit float32 liegt der Fehler typischerweise bei
+            1e-6 bis 1e-5 bezogen auf den Endwert, Speicherbedarf und
+            Speicherbandbreite halbieren sich.
+
+    Returns:
+        t, Y: Zeitvektor (N,) und Sprungantworten (B, N)
+
+    Beispiel:
+        >>> from regelung import PT1, P, closed_loop
+        >>> from regelung.simulation import simulate_step_batch
+        >>> strecke = PT1(Kp=1.0, T=1.0)
+        >>> systeme = [closed_loop(P(Kp=kp), strecke) for kp in [0.5, 1.0, 2.0]]
+        >>> t, Y = simulate_step_batch(systeme, t_end=10.0)
+    """
+    num, den = _coefficient_batch(systems)
+    t = np.linspace(0.0, t_end, n_points)
+    U = np.ones((len(num), n_points), dtype=_dtype(precision))
+    return t, _simulate_batch(num, den, t, U, precision)
+
+
+def simulate_signal_batch(systems, t, u, precision="float64"):
+    """
+    Simuliert die Antworten vieler Systeme auf Eingangssignale.
+
+    Args:
+        systems: Liste von Systemen oder Tupel (num, den)
+        t: Äquidistanter Zeitvektor (N,)
+        u: Gemeinsames Eingangssignal (N,) oder eines je System (B, N)
+        precision: "float64" oder "float32" (default: "float64"),
+            siehe simulate_step_batch
+
+    Returns:
+        t, Y: Zeitvektor (N,) und Ausgänge (B, N)
+    """
+    num, den = _coefficient_batch(systems)
+    t = np.asarray(t, dtype=float)
+    U = np.broadcast_to(np.asarray(u, dtype=_dtype(precision)), (len(num), len(t)))
+    return t, _simulate_batch(num, den, t, np.array(U), precision)
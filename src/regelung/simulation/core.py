@@ -2,7 +2,24 @@
 Simulationsfunktionen für Regelkreise.
 """
 
-from control import feedback, forced_response, series, step_response
+import numpy as np
+from control import (
+    StateSpace,
+    TransferFunction,
+    feedback,
+    forced_response,
+    series,
+    step_response,
+    tf,
+)
+from scipy.integrate import solve_ivp
+from scipy.linalg import block_diag
+from scipy.signal import cont2discrete, lfilter, oaconvolve
+
+from regelung.analysis import batch_roots
+
+# Implizite Verfahren mit Schrittweitensteuerung für steife Systeme
+SOLVERS = ("Radau", "BDF", "LSODA")
 
 
 def closed_loop(regler, strecke):
@@ -19,28 +36,68 @@ def closed_loop(regler, strecke):
     return feedback(series(regler.tf(), strecke.tf()), 1)
 
 
-def simulate_step(system, t_end=10.0):
+def simulate_step(
+    system, t_end=10.0, solver=None, t=None, precision=None, **solver_options
+):
     """
     Simuliert Sprungantwort mit einer Amplitude von 1 und optionaler Zeitdauer.
 
     Args:
         system: Transfer-Funktion oder Regelkreis
         t_end: Simulationsende in Sekunden (default: 10.0)
+        solver: None (Zeitraster von python-control) oder "Radau", "BDF",
+            "LSODA" für die adaptive Integration, siehe simulate_signal
+        t: Ausgabezeitpunkte für solver bzw. precision (default: 1000
+            Punkte bis t_end)
+        precision: None (forced_response) oder "float64"/"float32" für die
+            Zustandsrekursion wie in simulate_step_batch, siehe
+            simulate_signal (default: None)
+        **solver_options: Weitere Optionen für solve_ivp (z.B. rtol, atol)
 
     Returns:
         t, y: Zeit- und Ausgangsvektoren
+
+    Beispiel:
+        >>> from regelung import PT1, series_connection, simulate_step
+        >>> strecke = series_connection(PT1(Kp=1.0, T=1000.0), PT1(Kp=1.0, T=0.001))
+        >>> t, y = simulate_step(strecke, t_end=5000.0, solver="Radau")
     """
-    return step_response(system, T=t_end)
+    if solver is None and precision is None:
+        return step_response(system, T=t_end)
+    t = np.linspace(0.0, t_end, 1000) if t is None else np.asarray(t, dtype=float)
+    if precision is not None:
+        return simulate_signal(system, t, np.ones_like(t), solver, precision)
+    return t, _simulate_adaptive(system, t, np.ones_like(t), solver, solver_options)
 
 
-def simulate_signal(system, t, u):
+def simulate_signal(system, t, u, solver=None, precision=None, **solver_options):
     """
     Simuliert Antwort auf beliebiges Eingangssignal.
 
     Args:
         system: Transfer-Funktion oder Regelkreis
         t: Zeitvektor (z.B. np.linspace(0, 10, 1000))
-        u: Eingangssignal (gleiche Länge wie t)
+        u: Eingangssignal (gleiche Länge wie t) oder Signal aus
+            regelung.signals, das auf t ausgewertet wird
+        solver: None (forced_response auf dem Raster t) oder ein implizites
+            Verfahren mit Schrittweitensteuerung ("Radau", "BDF", "LSODA").
+            Die Schrittweite richtet sich dann nach der Dynamik statt nach
+            dem Raster; das lohnt sich bei steifen Systemen (sehr schnelle
+            und sehr langsame Zeitkonstanten) und stückweise linearen
+            Eingängen wie Sprüngen und Rampen.
+            "fft": Faltung mit der abgeschnittenen Impulsantwort im
+            Overlap-Add-Verfahren für sehr lange Signale; u darf dann auch
+            mehrere Kanäle (C, N) enthalten. Grenzstabile Systeme (I, IT1)
+            laufen über die rekursive Differenzengleichung.
+        precision: None (forced_response) oder "float64"/"float32": Die
+            Zustandsrekursion von simulate_signal_batch rechnet in der
+            gewählten Genauigkeit (t äquidistant, nicht mit solver
+            kombinierbar). Die Diskretisierung bleibt float64, float32
+            weicht typischerweise um 1e-6 bis 1e-5 bezogen auf den Endwert
+            ab (default: None)
+        **solver_options: Weitere Optionen für solve_ivp (z.B. rtol, atol)
+            bzw. tol für "fft" (default: 1e-10, relativ zur L1-Norm der
+            Impulsantwort)
 
     Returns:
         t, y: Zeit- und Ausgangsvektoren
@@ -53,10 +110,247 @@ def simulate_signal(system, t, u):
         >>> u = np.ones_like(t) * 2.5  # Sprung mit Amplitude 2.5
         >>> t_out, y = simulate_signal(strecke.tf(), t, u)
     """
+    if callable(u):
+        u = u(t)
+    if precision is not None:
+        if solver is not None:
+            raise ValueError("precision ist nicht mit solver kombinierbar")
+        from regelung.simulation.batch import simulate_signal_batch
+
+        t, Y = simulate_signal_batch([system], t, u, precision)
+        return t, Y[0]
+    if solver == "fft":
+        t = np.asarray(t, dtype=float)
+        return t, _simulate_fft(system, t, np.asarray(u, dtype=float), **solver_options)
+    if solver is not None:
+        t = np.asarray(t, dtype=float)
+        u = np.asarray(u, dtype=float)
+        return t, _simulate_adaptive(system, t, u, solver, solver_options)
     t_out, y = forced_response(system, T=t, U=u)
     return t_out, y
 
 
+def _affine_pieces(t, u):
+    """
+    Zerlegt das linear interpolierte Eingangssignal in affine Abschnitte.
+
+    Returns:
+        Indizes der Abschnittsgrenzen (erster und letzter Punkt inklusive)
+    """
+    if len(t) < 3:
+        return np.array([0, len(t) - 1])
+    slope = np.diff(u) / np.diff(t)
+    scale = max(np.max(np.abs(slope)), 1e-300)
+    kinks = np.flatnonzero(np.abs(np.diff(slope)) > 1e-12 * scale) + 1
+    return np.concatenate([[0], kinks, [len(t) - 1]])
+
+
+def _simulate_adaptive(system, t, u, solver, options):
+    """
+    Integriert das Zustandsraummodell mit einem impliziten Verfahren.
+
+    Der Eingang wird wie bei forced_response zwischen den Abtastpunkten
+    linear interpoliert. An jedem Knick des Eingangs wird neu gestartet,
+    innerhalb der affinen Abschnitte wählt das Verfahren die Schrittweite
+    selbst; ausgegeben wird auf dem Raster t.
+
+    Returns:
+        y: Ausgang auf t
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"Unbekanntes Verfahren: {solver}, erlaubt: {SOLVERS}")
+    if u.shape != t.shape:
+        raise ValueError("Eingangssignal muss die gleiche Länge wie t haben")
+    if len(t) < 2 or np.any(np.diff(t) <= 0):
+        raise ValueError("Zeitvektor muss streng monoton steigen")
+    num, den = _tf_coefficients(system)
+    A, B, C, D = _realize([num], den)
+    b = B[:, 0]
+    options = {"rtol": 1e-6, "atol": 1e-9, **options}
+    if solver != "LSODA":
+        options.setdefault("jac", A)
+
+    y = np.empty_like(t)
+    x = np.zeros(len(A))
+    bounds = _affine_pieces(t, u)
+    for i, j in zip(bounds[:-1], bounds[1:]):
+        slope = (u[i + 1] - u[i]) / (t[i + 1] - t[i])
+
+        def rhs(tau, x, u0=u[i], t0=t[i], slope=slope):
+            return A @ x + b * (u0 + slope * (tau - t0))
+
+        if len(A):
+            sol = solve_ivp(
+                rhs, (t[i], t[j]), x, method=solver, t_eval=t[i : j + 1], **options
+            )
+            if not sol.success:
+                raise RuntimeError(f"Integration fehlgeschlagen: {sol.message}")
+            X = sol.y
+            x = X[:, -1]
+        else:
+            X = np.zeros((0, j - i + 1))
+        y[i : j + 1] = C[0] @ X + D[0, 0] * u[i : j + 1]
+    return y
+
+
+def _discretize_foh(system, dt):
+    """
+    Diskretisiert ein SISO-System mit Halteglied erster Ordnung.
+
+    Das entspricht der linearen Interpolation des Eingangs zwischen den
+    Abtastpunkten, wie sie auch forced_response verwendet.
+
+    Returns:
+        b, a: Koeffizienten der Differenzengleichung für lfilter
+    """
+    num, den = _tf_coefficients(system)
+    num_d, den_d, _ = cont2discrete((num, den), dt, method="foh")
+    return np.ravel(num_d), np.ravel(den_d)
+
+
+def _discretize_step(system, dt):
+    """
+    Diskretisiert ein SISO-System mit Halteglied nullter Ordnung.
+
+    Für Eingänge, die ab t=0 konstant sind, ist das exakt.
+
+    Returns:
+        b, a: Koeffizienten der Differenzengleichung für lfilter
+    """
+    num, den = _tf_coefficients(system)
+    num_d, den_d, _ = cont2discrete((num, den), dt, method="zoh")
+    return np.ravel(num_d), np.ravel(den_d)
+
+
+def _foh_response(filters, u, state=None):
+    """
+    Antwort auf linear interpolierte Eingänge mit Anfangszustand x0 = 0.
+
+    Die FOH-Differenzengleichung hat einen Durchgriff, ihr Ruhezustand
+    passt nur zu u[0] = 0. Der Anfangswert wird deshalb als Sprung
+    abgespalten, dessen Antwort h die ZOH-Diskretisierung exakt liefert:
+
+        y = u[0] · h + FOH(u - u[0])
+
+    Args:
+        filters: ((b, a), (b_step, a_step)) aus _discretize_foh und
+            _discretize_step
+        u: Eingang (..., N)
+        state: Zustand aus dem vorherigen Block (default: None, Beginn bei
+            t=0 aus der Ruhelage)
+
+    Returns:
+        y, state: Ausgang mit der Form von u und Zustand für den nächsten
+        Block
+    """
+    # Nachgestellte Null hält den Filterzustand mindestens einelementig
+    (b, a), (b_step, a_step) = (
+        (np.append(num, 0.0), np.append(den, 0.0)) for num, den in filters
+    )
+    if state is None:
+        state = (
+            u[..., :1],
+            np.zeros(u.shape[:-1] + (max(len(a), len(b)) - 1,)),
+            np.zeros(max(len(a_step), len(b_step)) - 1),
+        )
+    u0, zi, zi_step = state
+    y, zi = lfilter(b, a, u - u0, axis=-1, zi=zi)
+    h, zi_step = lfilter(b_step, a_step, np.ones(u.shape[-1]), zi=zi_step)
+    return y + u0 * h, (u0, zi, zi_step)
+
+
+def _impulse_kernel(b, a, n, tol):
+    """
+    Abgeschnittene Impulsantwort der Differenzengleichung.
+
+    Die Länge folgt aus dem betragsgrößten Pol ρ (Abklingen wie ρ^k);
+    abgeschnitten wird, sobald der Rest der L1-Norm unter tol liegt.
+
+    Returns:
+        Impulsantwort oder None, wenn das System nicht asymptotisch stabil ist
+    """
+    rho = np.max(np.abs(batch_roots(np.trim_zeros(a, "f"))), initial=0.0)
+    if rho >= 1.0 - 1e-12:
+        return None
+    # Reserve für mehrfache Pole (Abklingen wie k^m·ρ^k)
+    length = len(a) + 2 * int(np.ceil(np.log(tol) / np.log(max(rho, 1e-300))))
+    impulse = np.zeros(min(max(length, len(b)), n))
+    impulse[0] = 1.0
+    g = lfilter(b, a, impulse)
+    tail = np.cumsum(np.abs(g[::-1]))[::-1]
+    keep = np.flatnonzero(tail > tol * tail[0])
+    return g[: keep[-1] + 1] if len(keep) else g[:1]
+
+
+def _simulate_fft(system, t, u, tol=1e-10):
+    """
+    Antwort durch Overlap-Add-Faltung mit der Impulsantwort.
+
+    Die Impulsantwort der FOH-Diskretisierung wird einmal berechnet und
+    auf alle Kanäle von u - u[0] angewendet, der Anfangswert geht als
+    exakte Sprungantwort ein (siehe _foh_response). Der Fehler gegenüber
+    der Rekursion ist höchstens tol · ||g||₁ · max|u - u[0]|.
+
+    Returns:
+        y: Ausgang mit der Form von u
+    """
+    if len(t) < 2:
+        raise ValueError("Zeitvektor braucht mindestens 2 Punkte")
+    dt = t[1] - t[0]
+    if dt <= 0 or not np.allclose(np.diff(t), dt, rtol=1e-6, atol=0.0):
+        raise ValueError("Zeitvektor muss äquidistant sein")
+    if u.shape[-1] != len(t):
+        raise ValueError("Eingangssignal muss die gleiche Länge wie t haben")
+
+    filters = (_discretize_foh(system, dt), _discretize_step(system, dt))
+    g = _impulse_kernel(*filters[0], len(t), tol)
+    if g is None:
+        # Grenzstabil: Impulsantwort klingt nicht ab, rekursiv rechnen
+        return _foh_response(filters, u)[0]
+    # Anfangswert als Sprung abspalten, siehe _foh_response
+    u0 = u[..., :1]
+    h = lfilter(*filters[1], np.ones(len(t)))
+    kernel = g.reshape((1,) * (u.ndim - 1) + (-1,))
+    return u0 * h + oaconvolve(u - u0, kernel, axes=-1)[..., : len(t)]
+
+
+def simulate_signal_chunked(system, chunks):
+    """
+    Simuliert die Antwort auf ein blockweise vorliegendes Eingangssignal.
+
+    Der Systemzustand wird zwischen den Blöcken weitergereicht, das
+    Ergebnis ist identisch zu einer Simulation des gesamten Signals. Es
+    liegt aber immer nur ein Block im Speicher.
+
+    Args:
+        system: Transfer-Funktion, Regelkreis oder Objekt mit .tf()
+        chunks: Iterable von (t, u)-Blöcken auf äquidistantem Zeitraster,
+            z.B. Signal.chunks() aus regelung.signals
+
+    Yields:
+        t, y: Zeit- und Ausgangsvektor des Blocks
+
+    Beispiel:
+        >>> from regelung import PT1, simulate_signal_chunked
+        >>> from regelung.signals import Chirp
+        >>> anregung = Chirp(f0=0.01, f1=5.0, t1=1e5)
+        >>> for t, y in simulate_signal_chunked(PT1(Kp=2.0, T=1.0),
+        ...                                     anregung.chunks(1e5, 0.01)):
+        ...     print(t[-1], y.max())
+    """
+    filters = state = None
+    for t, u in chunks:
+        t = np.asarray(t, dtype=float)
+        u = np.asarray(u, dtype=float)
+        if filters is None:
+            if len(t) < 2:
+                raise ValueError("Erster Block braucht mindestens 2 Zeitpunkte")
+            dt = t[1] - t[0]
+            filters = (_discretize_foh(system, dt), _discretize_step(system, dt))
+        y, state = _foh_response(filters, u, state)
+        yield t, y
+
+
 def simulate_step_scaled(system, amplitude=1.0, t_end=10.0):
     """
     Simuliert Sprungantwort mit beliebiger Amplitude.
@@ -99,7 +393,232 @@ def series_connection(*systems):
     tfs = [sys.tf() if hasattr(sys, "tf") else sys for sys in systems]
 
     result = tfs[0]
-    for tf in tfs[1:]:
-        result = series(result, tf)
+    for G in tfs[1:]:
+        result = series(result, G)
 
     return result
+
+
+def _tf_coefficients(system):
+    """
+    Liefert Zähler- und Nennerkoeffizienten eines SISO-Systems.
+
+    Args:
+        system: Transfer-Funktion, Zustandsraummodell oder Objekt mit .tf()
+
+    Returns:
+        num, den: Koeffizienten (höchste Potenz zuerst) als float-Arrays
+    """
+    G = system.tf() if hasattr(system, "tf") else system
+    if isinstance(G, StateSpace):
+        G = tf(G)
+    num = np.atleast_1d(np.asarray(G.num[0][0], dtype=float))
+    den = np.atleast_1d(np.asarray(G.den[0][0], dtype=float))
+    return num, den
+
+
+def final_value(system, tol=1e-9):
+    """
+    Analytischer Endwert der Sprungantwort (Endwertsatz).
+
+    Pole im Ursprung werden gegen Nullstellen im Ursprung gekürzt; die
+    Anzahl der verbleibenden Integratoren bestimmt den Typ:
+        - kein Integrator: Endwert = G(0)
+        - Differenzierer (Nullstelle im Ursprung): Endwert = 0
+        - Integratoren: Ausgang wächst unbeschränkt (Rampe, Parabel, ...),
+          Endwert ±inf
+    Liegen die übrigen Pole nicht alle in der linken Halbebene, existiert
+    kein Endwert (nan).
+
+    Args:
+        system: Transfer-Funktion, Regelkreis oder Objekt mit .tf()
+        tol: Relative Schranke für Koeffizienten und Realteile (default: 1e-9)
+
+    Returns:
+        Endwert als float (inf/-inf bei integrierendem, nan bei instabilem
+        oder dauerhaft schwingendem System)
+
+    Beispiel:
+        >>> from regelung import PT1, I, final_value
+        >>> final_value(PT1(Kp=2.0, T=1.0))  # 2.0
+        >>> final_value(I(Ki=1.0))  # inf
+    """
+    num, den = _tf_coefficients(system)
+    num = np.trim_zeros(num, "f")
+    den = np.trim_zeros(den, "f")
+    if len(num) == 0:
+        return 0.0
+
+    def origin_order(p):
+        # Anzahl verschwindender Koeffizienten am Ende = Wurzeln bei s = 0
+        small = np.abs(p) <= tol * np.max(np.abs(p))
+        return len(p) - 1 - np.flatnonzero(~small)[-1]
+
+    n0, d0 = origin_order(num), origin_order(den)
+    num_r, den_r = num[: len(num) - n0], den[: len(den) - d0]
+    poles = batch_roots(den_r)
+    scale = max(1.0, np.max(np.abs(poles), initial=0.0))
+    if np.any(poles.real >= -tol * scale):
+        return np.nan
+    if d0 == n0:
+        return float(num_r[-1] / den_r[-1])
+    if d0 < n0:
+        return 0.0
+    return float(np.sign(num_r[-1] / den_r[-1]) * np.inf)
+
+
+def _realize(nums, den):
+    """
+    Zustandsraumdarstellung in Beobachtbarkeitsnormalform für mehrere
+    Zähler mit gemeinsamem Nenner (ein Ausgang, ein Eingang je Zähler).
+
+    Die Ordnung entspricht dem Nennergrad, egal wie viele Eingänge
+    angeschlossen sind.
+
+    Args:
+        nums: Liste von Zählerpolynomen
+        den: Gemeinsames Nennerpolynom
+
+    Returns:
+        A, B, C, D: Systemmatrizen
+
+    Raises:
+        ValueError: Wenn ein Zählergrad den Nennergrad übersteigt
+    """
+    den = np.trim_zeros(np.asarray(den, dtype=float), "f")
+    n = len(den) - 1
+    a = den / den[0]
+
+    A = np.zeros((n, n))
+    B = np.zeros((n, len(nums)))
+    C = np.zeros((1, n))
+    D = np.zeros((1, len(nums)))
+
+    if n > 0:
+        A[:, 0] = -a[1:]
+        A[:-1, 1:] = np.eye(n - 1)
+        C[0, 0] = 1.0
+
+    for j, num in enumerate(nums):
+        num = np.trim_zeros(np.asarray(num, dtype=float), "f")
+        if len(num) > n + 1:
+            raise ValueError(
+                "Übertragungsfunktion ist nicht proper (Zählergrad > Nennergrad)"
+            )
+        b = np.concatenate([np.zeros(n + 1 - len(num)), num]) / den[0]
+        D[0, j] = b[0]
+        B[:, j] = b[1:] - b[0] * a[1:]
+
+    return A, B, C, D
+
+
+def _loop_polynomials(regler, strecke):
+    """
+    Polynome des Standardregelkreises R(s) = Zr/Nr, G(s) = Zs/Ns.
+
+    Returns:
+        zr, nr, zs, ns, char: Zähler/Nenner von Regler und Strecke sowie
+        das charakteristische Polynom Nr·Ns + Zr·Zs
+    """
+    zr, nr = _tf_coefficients(regler)
+    zs, ns = _tf_coefficients(strecke)
+    char = np.polyadd(np.polymul(nr, ns), np.polymul(zr, zs))
+    return zr, nr, zs, ns, char
+
+
+def gang_of_four(regler, strecke):
+    """
+    Berechnet die vier Sensitivitätsfunktionen des Regelkreises.
+
+    Alle vier Funktionen teilen sich das charakteristische Polynom
+    Nr·Ns + Zr·Zs, das nur einmal berechnet wird.
+
+    Args:
+        regler: Regler-Objekt mit .tf() Methode (oder Transfer-Funktion)
+        strecke: Strecken-Objekt mit .tf() Methode (oder Transfer-Funktion)
+
+    Returns:
+        dict mit Transfer-Funktionen:
+            - S: Sensitivität 1/(1+RG) (Sollwert → Regelabweichung)
+            - T: Komplementäre Sensitivität RG/(1+RG) (Sollwert → Ausgang)
+            - PS: Störsensitivität G/(1+RG) (Laststörung → Ausgang)
+            - CS: Stellgrößensensitivität R/(1+RG) (Sollwert → Stellgröße)
+
+    Beispiel:
+        >>> from regelung import PT2, PI, gang_of_four
+        >>> gof = gang_of_four(PI(Kp=2.0, Ti=1.0), PT2(Kp=1.0, T1=2.0, T2=0.5))
+        >>> gof["PS"].dcgain()  # 0.0 - PI-Regler regelt Laststörung aus
+    """
+    zr, nr, zs, ns, char = _loop_polynomials(regler, strecke)
+
+    return {
+        "S": TransferFunction(np.polymul(nr, ns), char),
+        "T": TransferFunction(np.polymul(zr, zs), char),
+        "PS": TransferFunction(np.polymul(zs, nr), char),
+        "CS": TransferFunction(np.polymul(zr, ns), char),
+    }
+
+
+def simulate_closed_loop(regler, strecke, t, r=None, d=None, n=None):
+    """
+    Simuliert den Regelkreis für Sollwert, Laststörung und Messrauschen.
+
+    Alle drei Eingänge werden in einem einzigen Zustandsraummodell mit dem
+    gemeinsamen charakteristischen Polynom simuliert:
+
+        y = T·r + PS·d - T·n
+        u = CS·r - T·d - CS·n
+
+    Args:
+        regler: Regler-Objekt mit .tf() Methode
+        strecke: Strecken-Objekt mit .tf() Methode
+        t: Zeitvektor
+        r: Sollwert (optional, default: 0)
+        d: Laststörung am Streckeneingang (optional, default: 0)
+        n: Messrauschen am Ausgang (optional, default: 0)
+
+    Returns:
+        t, y, u: Zeitvektor, Ausgang und Stellgröße. u ist None, wenn
+        R/(1+RG) nicht proper ist (z.B. idealer PID-Regler).
+
+    Beispiel:
+        >>> import numpy as np
+        >>> from regelung import PT1, PI, simulate_closed_loop
+        >>> t = np.linspace(0, 20, 2000)
+        >>> r = np.ones_like(t)
+        >>> d = np.where(t >= 10, 0.5, 0.0)  # Laststörung bei t=10s
+        >>> t, y, u = simulate_closed_loop(PI(Kp=2.0, Ti=1.0), PT1(Kp=1.0, T=1.0),
+        ...                                t, r=r, d=d)
+    """
+    t = np.asarray(t, dtype=float)
+    signals = []
+    for signal in (r, d, n):
+        if signal is None:
+            signal = np.zeros_like(t)
+        signal = np.asarray(signal, dtype=float)
+        if signal.shape != t.shape:
+            raise ValueError("Eingangssignale müssen die gleiche Länge wie t haben")
+        signals.append(signal)
+
+    zr, nr, zs, ns, char = _loop_polynomials(regler, strecke)
+    T_num = np.polymul(zr, zs)
+    PS_num = np.polymul(zs, nr)
+    CS_num = np.polymul(zr, ns)
+
+    blocks = [_realize([T_num, PS_num, -T_num], char)]
+    try:
+        blocks.append(_realize([CS_num, -T_num, -CS_num], char))
+    except ValueError:
+        pass  # Stellgröße nicht darstellbar (nicht proper)
+
+    A = block_diag(*[blk[0] for blk in blocks])
+    B = np.vstack([blk[1] for blk in blocks])
+    C = block_diag(*[blk[2] for blk in blocks])
+    D = np.vstack([blk[3] for blk in blocks])
+
+    response = forced_response(
+        StateSpace(A, B, C, D), T=t, U=np.vstack(signals), squeeze=False
+    )
+    y = response.outputs[0]
+    u = response.outputs[1] if len(blocks) > 1 else None
+    return response.time, y, u
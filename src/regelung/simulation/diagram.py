@@ -0,0 +1,242 @@
+"""
+Blockschaltbilder für Kaskaden-, Vorsteuer- und Mehrschleifenstrukturen.
+
+Jedes Übertragungsglied wird einzeln minimal realisiert und die
+Verschaltung erst beim Kompilieren über die Signalgleichungen aufgelöst.
+Die Ordnung des Gesamtmodells ist damit genau die Summe der Ordnungen der
+Glieder, ohne Polynommultiplikationen und Pol-Nullstellen-Kürzungen.
+"""
+
+import numpy as np
+from control import StateSpace
+from scipy.linalg import block_diag
+
+from regelung.simulation.core import _realize, _tf_coefficients
+
+
+class BlockDiagram:
+    """
+    Signalflussplan aus Eingängen, Summierstellen und Übertragungsgliedern.
+
+    Jeder Knoten definiert genau ein Signal, das über seinen Namen von
+    anderen Knoten referenziert wird.
+
+    Beispiel (Regelkreis mit Störgrößenaufschaltung):
+        >>> from regelung import PT1, PI, P
+        >>> bd = BlockDiagram()
+        >>> bd.add_input("r")
+        >>> bd.add_input("z")
+        >>> bd.add_sum("e", {"r": 1, "y": -1})
+        >>> bd.add_block("u_r", PI(Kp=2.0, Ti=1.0), "e")
+        >>> bd.add_block("u_v", P(Kp=-1.0), "z")  # Vorsteuerung
+        >>> bd.add_sum("u", {"u_r": 1, "u_v": 1, "z": 1})
+        >>> bd.add_block("y", PT1(Kp=1.0, T=1.0), "u")
+        >>> system = bd.compile(inputs=["r", "z"], outputs="y")
+    """
+
+    def __init__(self):
+        self._inputs = []
+        self._sums = {}
+        self._blocks = {}
+
+    def _check_name(self, name):
+        if name in self._inputs or name in self._sums or name in self._blocks:
+            raise ValueError(f"Signal '{name}' ist bereits definiert")
+
+    def add_input(self, name):
+        """
+        Fügt einen externen Eingang hinzu.
+
+        Args:
+            name: Signalname
+        """
+        self._check_name(name)
+        self._inputs.append(name)
+
+    def add_sum(self, name, terms):
+        """
+        Fügt eine Summierstelle hinzu.
+
+        Args:
+            name: Signalname des Summensignals
+            terms: dict {Signalname: Faktor}, z.B. {"r": 1, "y": -1}
+        """
+        self._check_name(name)
+        self._sums[name] = {signal: float(gain) for signal, gain in terms.items()}
+
+    def add_block(self, name, system, input):
+        """
+        Fügt ein Übertragungsglied hinzu.
+
+        Args:
+            name: Signalname des Ausgangs
+            system: Regler/Strecke mit .tf() oder Transfer-Funktion (SISO)
+            input: Signalname des Eingangs
+        """
+        self._check_name(name)
+        num, den = _tf_coefficients(system)
+        self._blocks[name] = (num, den, input)
+
+    def _fuse_improper(self, blocks, outputs):
+        """
+        Fasst nicht-propere Glieder (z.B. idealer PID) mit dem direkt
+        nachfolgenden Glied zusammen, damit sich das Produkt realisieren
+        lässt.
+        """
+        while True:
+            improper = [
+                name
+                for name, (num, den, _) in blocks.items()
+                if len(np.trim_zeros(num, "f")) > len(np.trim_zeros(den, "f"))
+            ]
+            if not improper:
+                return blocks
+
+            name = improper[0]
+            num, den, source = blocks[name]
+            consumers = [b for b, (_, _, src) in blocks.items() if src == name]
+            consumers += [s for s, terms in self._sums.items() if name in terms]
+
+            if name in outputs or len(consumers) != 1 or consumers[0] not in blocks:
+                raise ValueError(
+                    f"Glied '{name}' ist nicht proper und muss direkt und "
+                    "ausschließlich ein weiteres Übertragungsglied speisen"
+                )
+
+            target = consumers[0]
+            num_t, den_t, _ = blocks[target]
+            blocks[target] = (np.polymul(num_t, num), np.polymul(den_t, den), source)
+            del blocks[name]
+
+    def compile(self, inputs=None, outputs=None):
+        """
+        Erzeugt ein Zustandsraummodell des gesamten Blockschaltbilds.
+
+        Args:
+            inputs: Liste der Eingänge (default: alle in Definitionsreihenfolge)
+            outputs: Signalname oder Liste von Signalnamen
+
+        Returns:
+            StateSpace-Modell (SISO-Modelle laufen direkt mit simulate_step
+            und simulate_signal)
+
+        Raises:
+            ValueError: Bei unbekannten Signalen, nicht realisierbaren Gliedern
+                oder algebraischen Schleifen
+        """
+        inputs = list(self._inputs) if inputs is None else list(inputs)
+        if outputs is None:
+            raise ValueError("Mindestens ein Ausgang muss angegeben werden")
+        outputs = [outputs] if isinstance(outputs, str) else list(outputs)
+
+        known = set(self._inputs) | set(self._sums) | set(self._blocks)
+        referenced = [src for _, _, src in self._blocks.values()]
+        referenced += [s for terms in self._sums.values() for s in terms]
+        for signal in referenced + inputs + outputs:
+            if signal not in known:
+                raise ValueError(f"Unbekanntes Signal '{signal}'")
+
+        blocks = self._fuse_improper(dict(self._blocks), outputs)
+        signals = list(self._sums) + list(blocks)
+        s_idx = {name: i for i, name in enumerate(signals)}
+        w_idx = {name: i for i, name in enumerate(inputs)}
+        n_s, n_w = len(signals), len(inputs)
+
+        realizations = [_realize([num], den) for num, den, _ in blocks.values()]
+        orders = [A.shape[0] for A, _, _, _ in realizations]
+        offsets = np.concatenate([[0], np.cumsum(orders)]).astype(int)
+        n_x = int(offsets[-1])
+
+        # Signalgleichungen: s = M s + N x + P w
+        M = np.zeros((n_s, n_s))
+        N = np.zeros((n_s, n_x))
+        P = np.zeros((n_s, n_w))
+        # Eingänge der Glieder: v = Es s + Ew w
+        Es = np.zeros((len(blocks), n_s))
+        Ew = np.zeros((len(blocks), n_w))
+
+        def _connect(row_s, row_w, signal, gain):
+            if signal in s_idx:
+                row_s[s_idx[signal]] += gain
+            elif signal in w_idx:
+                row_w[w_idx[signal]] += gain
+            # Nicht verwendete Eingänge sind null
+
+        for name, terms in self._sums.items():
+            for signal, gain in terms.items():
+                _connect(M[s_idx[name]], P[s_idx[name]], signal, gain)
+
+        for k, (name, (_, _, source)) in enumerate(blocks.items()):
+            _, _, C, D = realizations[k]
+            i = s_idx[name]
+            N[i, offsets[k] : offsets[k + 1]] = C[0]
+            _connect(M[i], P[i], source, D[0, 0])
+            _connect(Es[k], Ew[k], source, 1.0)
+
+        try:
+            inv = np.linalg.inv(np.eye(n_s) - M)
+        except np.linalg.LinAlgError:
+            raise ValueError("Algebraische Schleife ist nicht auflösbar") from None
+        Sx = inv @ N
+        Sw = inv @ P
+
+        A_blk = block_diag(*[A for A, _, _, _ in realizations])
+        B_blk = block_diag(*[B for _, B, _, _ in realizations])
+        A_blk = A_blk.reshape(n_x, n_x)
+        B_blk = B_blk.reshape(n_x, len(blocks))
+
+        A = A_blk + B_blk @ Es @ Sx
+        B = B_blk @ (Es @ Sw + Ew)
+
+        C = np.zeros((len(outputs), n_x))
+        D = np.zeros((len(outputs), n_w))
+        for j, signal in enumerate(outputs):
+            if signal in s_idx:
+                C[j] = Sx[s_idx[signal]]
+                D[j] = Sw[s_idx[signal]]
+            elif signal in w_idx:
+                D[j, w_idx[signal]] = 1.0
+
+        return StateSpace(A, B, C, D)
+
+
+def cascade_loop(outer_regler, inner_regler, inner_strecke, outer_strecke):
+    """
+    Erstellt eine Kaskadenregelung als ein Zustandsraummodell.
+
+    Struktur:
+        r → (+) → Führungsregler → (+) → Folgeregler → innere Strecke
+             ↑-                    ↑-                     │ y_i
+             │                     └──────────────────────┤
+             │                                            ↓
+             └───────────────── y ← äußere Strecke ←──────┘
+
+    Args:
+        outer_regler: Führungsregler (äußerer Kreis, z.B. Füllstand)
+        inner_regler: Folgeregler (innerer Kreis, z.B. Durchfluss)
+        inner_strecke: Strecke des inneren Kreises
+        outer_strecke: Strecke des äußeren Kreises
+
+    Returns:
+        StateSpace-Modell von r nach y
+
+    Hinweis:
+        Ein idealer PID als Folgeregler wird mit der inneren Strecke
+        zusammengefasst. Der Führungsregler speist die innere Summierstelle
+        und muss daher proper sein (P, PI).
+
+    Beispiel:
+        >>> from regelung import PT1, PI, P, cascade_loop, simulate_step
+        >>> system = cascade_loop(PI(Kp=1.0, Ti=5.0), P(Kp=4.0),
+        ...                       PT1(Kp=1.0, T=0.5), PT1(Kp=2.0, T=10.0))
+        >>> t, y = simulate_step(system, t_end=60.0)
+    """
+    bd = BlockDiagram()
+    bd.add_input("r")
+    bd.add_sum("e_a", {"r": 1, "y": -1})
+    bd.add_block("w_i", outer_regler, "e_a")
+    bd.add_sum("e_i", {"w_i": 1, "y_i": -1})
+    bd.add_block("u", inner_regler, "e_i")
+    bd.add_block("y_i", inner_strecke, "u")
+    bd.add_block("y", outer_strecke, "y_i")
+    return bd.compile(inputs=["r"], outputs="y")
@@ -0,0 +1,192 @@
+"""
+Inkrementelle Erzeugung von Report-Grafiken.
+
+Jede Grafik wird durch eine Plot-Funktion und ihre Argumente beschrieben
+(Systeme, Zeitraster, Stiloptionen). Aus Funktion, Argumenten und dem
+Plot-Stil (Quelltext von regelung.simulation.plot, Versionen von regelung
+und matplotlib) wird ein Hash gebildet und neben den Grafiken gespeichert;
+unveränderte Grafiken werden übersprungen, geänderte parallel in
+Worker-Prozessen gezeichnet.
+
+Beispiel:
+    >>> from regelung import PT1, plot_step, simulate_step
+    >>> from regelung.simulation.figures import FigureBuilder
+    >>>
+    >>> def sprung(strecke, t_end=10.0, title=""):
+    ...     t, y = simulate_step(strecke.tf(), t_end)
+    ...     return plot_step(t, y, title=title, show=False)
+    >>>
+    >>> builder = FigureBuilder("report/figures", workers=4)
+    >>> builder.add("pt1.png", sprung, strecke=PT1(Kp=2.0, T=1.0), title="PT1")
+    >>> builder.build()
+    {'pt1.png': 'built'}
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+
+from regelung.simulation.hashing import freeze
+
+_MANIFEST = ".figures.json"
+
+
+@cache
+def _style_version():
+    """
+    Kennung des Plot-Stils: Quelltext von regelung.simulation.plot sowie
+    Versionen von regelung und matplotlib. Stiländerungen dort (Farben,
+    Schriftgrößen, Gitter) machen alle Grafiken ungültig.
+    """
+    import matplotlib
+
+    import regelung
+    from regelung.simulation import plot
+
+    try:
+        source = inspect.getsource(plot)
+    except OSError:
+        source = ""
+    return repr((regelung.__version__, matplotlib.__version__, source))
+
+
+def _digest(func, kwargs, dpi):
+    """Hash aus Plot-Funktion (inkl. Quelltext), Plot-Stil, Argumenten und
+    Auflösung."""
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = ""
+    name = (getattr(func, "__module__", ""), getattr(func, "__qualname__", repr(func)))
+    content = repr((name, source, _style_version(), freeze(kwargs), dpi))
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _render(func, kwargs, path, dpi, headless=False):
+    """Zeichnet und speichert eine Grafik (headless im Worker-Prozess)."""
+    import matplotlib
+
+    if headless:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    if "show" in inspect.signature(func).parameters:
+        kwargs = {"show": False, **kwargs}
+    fig = func(**kwargs)
+    fig.savefig(path, dpi=dpi, bbox_inches="tight")
+    plt.close(fig)
+    return path
+
+
+class FigureBuilder:
+    """
+    Sammelt Grafiken und erzeugt nur die geänderten neu.
+
+    Args:
+        directory: Zielverzeichnis der Grafiken
+        workers: Anzahl Worker-Prozesse (default: None, Anzahl CPUs;
+            1 zeichnet im aktuellen Prozess)
+        dpi: Auflösung der gespeicherten Grafiken (default: 300)
+    """
+
+    def __init__(self, directory, workers=None, dpi=300):
+        self.directory = os.fspath(directory)
+        self.workers = workers
+        self.dpi = dpi
+        self._figures = {}
+
+    def add(self, filename, func, **kwargs):
+        """
+        Registriert eine Grafik.
+
+        Args:
+            filename: Dateiname relativ zum Zielverzeichnis (z.B. "pt1.png")
+            func: Funktion, die eine matplotlib-Figure zurückgibt. Für Worker-
+                Prozesse muss sie auf Modulebene definiert sein.
+            **kwargs: Argumente für func; gehen in den Hash ein
+        """
+        self._figures[filename] = (func, kwargs)
+
+    def figure(self, filename, **kwargs):
+        """Dekorator-Variante von add."""
+
+        def decorator(func):
+            self.add(filename, func, **kwargs)
+            return func
+
+        return decorator
+
+    def _manifest_path(self):
+        return os.path.join(self.directory, _MANIFEST)
+
+    def _load_manifest(self):
+        try:
+            with open(self._manifest_path(), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def outdated(self):
+        """
+        Grafiken, deren Hash sich geändert hat oder deren Datei fehlt.
+
+        Returns:
+            dict Dateiname -> neuer Hash
+        """
+        manifest = self._load_manifest()
+        result = {}
+        for filename, (func, kwargs) in self._figures.items():
+            digest = _digest(func, kwargs, self.dpi)
+            path = os.path.join(self.directory, filename)
+            if manifest.get(filename) != digest or not os.path.exists(path):
+                result[filename] = digest
+        return result
+
+    def build(self, force=False):
+        """
+        Erzeugt alle geänderten Grafiken.
+
+        Args:
+            force: Alle Grafiken neu erzeugen (default: False)
+
+        Returns:
+            dict Dateiname -> "built" oder "skipped"
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = self._load_manifest()
+        if force:
+            todo = {
+                name: _digest(func, kwargs, self.dpi)
+                for name, (func, kwargs) in self._figures.items()
+            }
+        else:
+            todo = self.outdated()
+
+        jobs = [(self._figures[name][0], self._figures[name][1], name) for name in todo]
+        if self.workers == 1 or len(jobs) <= 1:
+            for func, kwargs, name in jobs:
+                _render(func, kwargs, os.path.join(self.directory, name), self.dpi)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [
+                    executor.submit(
+                        _render,
+                        func,
+                        kwargs,
+                        os.path.join(self.directory, name),
+                        self.dpi,
+                        True,
+                    )
+                    for func, kwargs, name in jobs
+                ]
+                for future in futures:
+                    future.result()
+
+        manifest.update(todo)
+        with open(self._manifest_path(), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+        return {name: "built" if name in todo else "skipped" for name in self._figures}
@@ -0,0 +1,52 @@
+"""
+Hashbare Schlüssel aus Simulationsargumenten.
+
+Gemeinsame Grundlage für das Zusammenfassen gleicher Anfragen (aio) und
+den Cache der Report-Grafiken (figures): Arrays, Transfer-Funktionen,
+Zustandsraummodelle und Regler-/Strecken-Objekte werden über ihren Inhalt
+statt über ihre Identität verglichen.
+"""
+
+import hashlib
+import inspect
+
+import numpy as np
+from control import StateSpace, TransferFunction
+
+
+def freeze(obj):
+    """
+    Bildet Argumente auf einen hashbaren Schlüssel ab.
+
+    Args:
+        obj: Beliebiges Argument; Listen, Tupel, dicts und Objekte mit
+            Attributen werden rekursiv abgebildet
+
+    Returns:
+        Hashbares Tupel bzw. obj selbst, wenn es bereits hashbar ist;
+        nicht hashbare Objekte ohne Attribute über ihre id
+    """
+    if isinstance(obj, np.ndarray):
+        digest = hashlib.blake2b(np.ascontiguousarray(obj).tobytes()).hexdigest()
+        return ("ndarray", obj.shape, obj.dtype.str, digest)
+    if isinstance(obj, TransferFunction):
+        num = tuple(np.asarray(obj.num[0][0], dtype=float).tolist())
+        den = tuple(np.asarray(obj.den[0][0], dtype=float).tolist())
+        return ("tf", num, den, obj.dt)
+    if isinstance(obj, StateSpace):
+        matrices = tuple(freeze(np.asarray(M)) for M in (obj.A, obj.B, obj.C, obj.D))
+        return ("ss", matrices, obj.dt)
+    if isinstance(obj, (list, tuple)):
+        return (type(obj).__name__,) + tuple(freeze(item) for item in obj)
+    if isinstance(obj, dict):
+        return ("dict",) + tuple(sorted((k, freeze(v)) for k, v in obj.items()))
+    if hasattr(obj, "__dict__") and not (
+        inspect.isroutine(obj) or isinstance(obj, type)
+    ):
+        items = tuple(sorted((k, freeze(v)) for k, v in vars(obj).items()))
+        return (type(obj).__qualname__, items)
+    try:
+        hash(obj)
+        return obj
+    except TypeError:
+        return ("id", id(obj))
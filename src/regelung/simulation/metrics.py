@@ -0,0 +1,363 @@
+"""
+Vektorisierte Kennwerte vieler Sprungantworten.
+
+Die Kennwerte sind wie in get_step_metrics definiert (Ausregelzeit als
+letzter Austritt aus dem Toleranzband). Im Gegensatz zu get_step_metrics
+werden Maximum und 10%/90%-Durchgänge zwischen den Abtastpunkten
+interpoliert statt auf einen Abtastpunkt gerundet. Die Kennwerte hängen
+dadurch stetig von den Parametern ab und lassen sich differenzieren.
+"""
+
+import numpy as np
+
+from regelung.simulation.batch import (
+    _coefficient_batch,
+    _discretize_batch,
+    _dtype,
+    _hurwitz_stable,
+    _realize_batch,
+    _uniform_dt,
+)
+from regelung.simulation.core import final_value
+
+METRICS = (
+    "steady_state",
+    "t_max",
+    "y_max",
+    "overshoot_pct",
+    "overshoot_abs",
+    "rise_time",
+    "settling_time",
+)
+
+# Felder von step_metrics_sweep
+SWEEP_FIELDS = (
+    "steady_state",
+    "y_end",
+    "t_max",
+    "y_max",
+    "overshoot_pct",
+    "overshoot_abs",
+    "rise_time",
+    "settling_time",
+    "iae",
+    "ise",
+    "itae",
+)
+SWEEP_DTYPE = np.dtype([(name, np.float64) for name in SWEEP_FIELDS])
+
+
+def _peak(t, Y):
+    """
+    Maximum je Zeile mit Parabel-Interpolation um den größten Abtastwert.
+
+    Returns:
+        k, t_peak, y_peak: Index des größten Abtastwerts, interpolierte
+        Zeit und interpolierter Wert
+    """
+    rows = np.arange(Y.shape[0])
+    k = np.argmax(Y, axis=1)
+    km = np.clip(k, 1, Y.shape[1] - 2)
+    y0, y1, y2 = Y[rows, km - 1], Y[rows, km], Y[rows, km + 1]
+    curvature = y0 - 2.0 * y1 + y2
+    interior = (k == km) & (curvature < 0)
+
+    safe = np.where(interior, curvature, 1.0)
+    delta = np.where(interior, 0.5 * (y0 - y2) / safe, 0.0)
+    h = 0.5 * (t[km + 1] - t[km - 1])
+    t_peak = t[k] + delta * h
+    y_peak = np.where(interior, y1 - 0.25 * (y0 - y2) * delta, Y[rows, k])
+    return k, t_peak, y_peak
+
+
+def _first_crossing(t, Yn, level):
+    """
+    Erster Durchgang der normierten Antworten Yn durch level.
+
+    Returns:
+        i, frac, tc: Segmentanfang, Anteil im Segment und Zeitpunkt.
+        Ohne Durchgang ist tc = t[-1] und frac = nan.
+    """
+    rows = np.arange(Yn.shape[0])
+    reached = Yn >= level
+    idx = np.argmax(reached, axis=1)
+    i = np.maximum(idx - 1, 0)
+    y0, y1 = Yn[rows, i], Yn[rows, idx]
+    slope = np.where(y1 > y0, y1 - y0, 1.0)
+    frac = np.where(idx > 0, np.clip((level - y0) / slope, 0.0, 1.0), 0.0)
+    tc = t[i] + frac * (t[idx] - t[i])
+    crossed = reached.any(axis=1)
+    return i, np.where(crossed, frac, np.nan), np.where(crossed, tc, t[-1])
+
+
+def _band_exit(t, Y, y_inf, tolerance):
+    """
+    Letzter Austritt aus dem Toleranzband |y - y_inf| <= tolerance·|y_inf|.
+
+    Returns:
+        i, frac, tc, sign: Segmentanfang, Anteil im Segment, Zeitpunkt und
+        Seite des Bandes (+1 oben, -1 unten). Bleibt die Antwort bis zum
+        Ende außerhalb (nicht ausgeregelt), ist tc = nan; liegt sie immer im
+        Band, t[0].
+    """
+    rows = np.arange(Y.shape[0])
+    N = Y.shape[1]
+    band = tolerance * np.abs(y_inf)[:, None]
+    excess = np.abs(Y - y_inf[:, None]) - band
+    outside = excess > 0
+
+    last = N - 1 - np.argmax(outside[:, ::-1], axis=1)
+    i = np.minimum(last, N - 2)
+    e0, e1 = excess[rows, i], excess[rows, i + 1]
+    frac = np.clip(e0 / np.where(e0 > e1, e0 - e1, 1.0), 0.0, 1.0)
+    tc = t[i] + frac * (t[i + 1] - t[i])
+
+    never = ~outside.any(axis=1)
+    unsettled = last == N - 1
+    tc = np.where(never, t[0], np.where(unsettled, np.nan, tc))
+    frac = np.where(never | unsettled, np.nan, frac)
+    sign = np.sign(Y[rows, i] - y_inf)
+    return i, frac, tc, sign
+
+
+def _step_metrics_batch(t, Y, tolerance, precision=None, y_inf=None):
+    """Kennwerte und Zwischenergebnisse für die Sensitivitätsrechnung."""
+    t = np.asarray(t, dtype=float)
+    Y = np.atleast_2d(np.asarray(Y))
+    if precision is not None:
+        Y = Y.astype(precision, copy=False)
+    elif Y.dtype != np.float32:
+        Y = Y.astype(float)
+    y_inf = Y[:, -1] if y_inf is None else np.asarray(y_inf, dtype=Y.dtype)
+    scale = np.where(y_inf == 0, 1.0, y_inf)
+
+    k, t_max, y_max = _peak(t, Y)
+    Yn = Y / scale[:, None]
+    c10 = _first_crossing(t, Yn, 0.1)
+    c90 = _first_crossing(t, Yn, 0.9)
+    band = _band_exit(t, Y, y_inf, tolerance)
+
+    overshoot_abs = y_max - y_inf
+    metrics = {
+        "steady_state": y_inf,
+        "t_max": t_max,
+        "y_max": y_max,
+        "overshoot_pct": np.where(y_inf != 0, 100.0 * overshoot_abs / scale, 0.0),
+        "overshoot_abs": overshoot_abs,
+        "rise_time": c90[2] - c10[2],
+        "settling_time": band[2],
+    }
+    # Ohne endlichen Endwert sind die bezogenen Kennwerte nicht definiert
+    finite = np.isfinite(y_inf)
+    for name in ("overshoot_pct", "overshoot_abs", "rise_time", "settling_time"):
+        metrics[name] = np.where(finite, metrics[name], np.nan)
+    info = {"peak": k, "c10": c10, "c90": c90, "band": band}
+    return metrics, info
+
+
+def step_metrics_batch(t, Y, tolerance=0.02, precision=None, systems=None):
+    """
+    Berechnet Regelgütekriterien für viele Sprungantworten zugleich.
+
+    Die Kennwerte sind wie in get_step_metrics definiert, werden aber
+    zwischen den Abtastpunkten interpoliert und weichen daher um bis zu
+    einen Zeitschritt (t_max, rise_time) bzw. den entsprechenden
+    Funktionswert (y_max) ab:
+        - t_max, y_max: Parabel durch das größte Abtasttripel
+        - rise_time: 10%-90%-Durchgangszeiten linear interpoliert
+        - settling_time: letzter Austritt aus dem Toleranzband (nan, wenn
+          die Antwort am Ende noch außerhalb liegt)
+
+    Args:
+        t: Zeitvektor (N,)
+        Y: Sprungantworten (B, N) oder (N,)
+        tolerance: Relative Breite des Toleranzbands (default: 0.02)
+        precision: "float64" oder "float32" für die Auswertung (default:
+            None, float32-Eingaben bleiben float32, sonst float64)
+        systems: Die simulierten Systeme (optional). Der Endwert wird dann
+            analytisch bestimmt (final_value) statt als letzter Abtastwert;
+            so genügen auch kurze Simulationen. Ohne endlichen Endwert
+            (integrierend, instabil) sind Überschwingen, Anstiegs- und
+            Ausregelzeit nan.
+
+    Returns:
+        dict mit Arrays der Form (B,) für steady_state, t_max, y_max,
+        overshoot_pct, overshoot_abs, rise_time, settling_time
+
+    Beispiel:
+        >>> from regelung.simulation import simulate_step_batch, step_metrics_batch
+        >>> t, Y = simulate_step_batch(systeme, t_end=20.0)
+        >>> m = step_metrics_batch(t, Y)
+        >>> m["overshoot_pct"]
+    """
+    y_inf = None if systems is None else [final_value(sys) for sys in systems]
+    return _step_metrics_batch(t, Y, tolerance, precision, y_inf)[0]
+
+
+def _static_gain(num, den):
+    """Stationäre Verstärkung G(0) gestapelter Systeme, nan wenn instabil."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y_inf = num[:, -1] / den[:, -1]
+    return np.where(_hurwitz_stable(den), y_inf, np.nan)
+
+
+def _accumulate(num, den, t, tolerance, precision):
+    """
+    Sprungantwort-Rekursion mit laufenden Kennwert-Akkumulatoren.
+
+    Statt der Trajektorien werden je System nur Maximum (mit Nachbarwerten
+    für die Parabel-Interpolation), Durchgangszeiten, letzter Austritt aus
+    dem Toleranzband und die Fehlerintegrale mitgeführt.
+
+    Returns:
+        dict Feldname -> Array (B,)
+    """
+    dtype = _dtype(precision)
+    dt = _uniform_dt(t)
+    N = len(t)
+    B = len(num)
+    A, b, d = _realize_batch(num, den)
+    n = A.shape[1]
+    if n:
+        Phi, g1, _ = (M.astype(dtype) for M in _discretize_batch(A, b, dt))
+    d = d.astype(dtype)
+    x = np.zeros((B, n), dtype=dtype)
+
+    # Sollwert aus der stationären Verstärkung G(0), nur für stabile Systeme
+    y_inf = _static_gain(num, den)
+    band = tolerance * np.abs(y_inf)
+    scale = np.where(y_inf == 0, 1.0, y_inf)
+
+    y_max = np.full(B, -np.inf)
+    k_max = np.zeros(B, dtype=np.int64)
+    peak_prev = np.zeros(B)
+    peak_next = np.zeros(B)
+    crossings = {0.1: np.full(B, np.nan), 0.9: np.full(B, np.nan)}
+    exit_time = np.full(B, t[0])
+    ever_outside = np.zeros(B, dtype=bool)
+    iae, ise, itae = np.zeros(B), np.zeros(B), np.zeros(B)
+    # Werte des vorigen Zeitschritts, ab k = 1 belegt
+    y_prev, yn_prev, e_prev, excess_prev = (np.zeros(B) for _ in range(4))
+    outside_prev = np.zeros(B, dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k in range(N):
+            y = (x[:, 0] + d) if n else d.copy()
+            y = y.astype(float)
+            e = np.abs(1.0 - y)
+            yn = y / scale
+            excess = np.abs(y - y_inf) - band
+            outside = excess > 0
+
+            if k == 0:
+                peak_prev[:] = y
+                for level, tc in crossings.items():
+                    tc[yn >= level] = t[0]
+            else:
+                iae += 0.5 * dt * (e_prev + e)
+                ise += 0.5 * dt * (e_prev**2 + e**2)
+                itae += 0.5 * dt * (t[k - 1] * e_prev + t[k] * e)
+
+                peak_next = np.where(k_max == k - 1, y, peak_next)
+                for level, tc in crossings.items():
+                    hit = np.isnan(tc) & (yn >= level)
+                    step = np.where(yn > yn_prev, yn - yn_prev, 1.0)
+                    frac = np.clip((level - yn_prev) / step, 0.0, 1.0)
+                    tc[hit] = t[k - 1] + frac[hit] * dt
+
+                leaving = outside_prev & ~outside
+                frac = excess_prev / np.where(leaving, excess_prev - excess, 1.0)
+                exit_time[leaving] = t[k - 1] + np.clip(frac[leaving], 0, 1) * dt
+
+            new = y > y_max
+            peak_prev = np.where(new, y_prev if k else y, peak_prev)
+            y_max = np.where(new, y, y_max)
+            k_max = np.where(new, k, k_max)
+            ever_outside |= outside
+
+            y_prev, yn_prev, e_prev = y, yn, e
+            outside_prev, excess_prev = outside, excess
+            if n and k + 1 < N:
+                x = np.matmul(Phi, x[:, :, None])[:, :, 0] + g1
+
+    # Parabel durch das größte Abtasttripel wie in step_metrics_batch
+    curvature = peak_prev - 2.0 * y_max + peak_next
+    interior = (k_max > 0) & (k_max < N - 1) & (curvature < 0)
+    safe = np.where(interior, curvature, 1.0)
+    delta = np.where(interior, 0.5 * (peak_prev - peak_next) / safe, 0.0)
+    t_max = t[k_max] + delta * dt
+    y_peak = np.where(interior, y_max - 0.25 * (peak_prev - peak_next) * delta, y_max)
+
+    finite = np.isfinite(y_inf)
+    t10, t90 = (np.where(np.isnan(tc), t[-1], tc) for tc in crossings.values())
+    settling = np.where(~ever_outside, t[0], np.where(outside_prev, np.nan, exit_time))
+    overshoot_abs = y_peak - y_inf
+    return {
+        "steady_state": y_inf,
+        "y_end": y_prev,
+        "t_max": t_max,
+        "y_max": y_peak,
+        "overshoot_pct": np.where(y_inf != 0, 100.0 * overshoot_abs / scale, 0.0),
+        "overshoot_abs": overshoot_abs,
+        "rise_time": np.where(finite, t90 - t10, np.nan),
+        "settling_time": np.where(finite, settling, np.nan),
+        "iae": iae,
+        "ise": ise,
+        "itae": itae,
+    }
+
+
+def _sweep(num, den, t, tolerance, chunk_size, precision):
+    """Blockweise Akkumulation über alle Systeme."""
+    result = np.empty(len(num), dtype=SWEEP_DTYPE)
+    for start in range(0, len(num), chunk_size):
+        part = slice(start, start + chunk_size)
+        values = _accumulate(num[part], den[part], t, tolerance, precision)
+        for name in SWEEP_FIELDS:
+            result[name][part] = values[name]
+    return result
+
+
+def step_metrics_sweep(
+    systems,
+    t_end=10.0,
+    n_points=1000,
+    tolerance=0.02,
+    chunk_size=100_000,
+    precision="float64",
+):
+    """
+    Kennwerte vieler Sprungantworten, ohne Trajektorien zu speichern.
+
+    Die Simulation führt je System laufende Akkumulatoren (Maximum,
+    Durchgangszeiten, Austritt aus dem Toleranzband, Fehlerintegrale) mit.
+    Der Speicherbedarf wächst daher nur mit der Anzahl der Systeme, nicht
+    mit der Anzahl der Zeitpunkte.
+
+    Bezugswert für Überschwingen, Anstiegs- und Ausregelzeit ist die
+    stationäre Verstärkung G(0) (steady_state); für instabile und
+    integrierende Systeme sind diese Kennwerte nan. Die Fehlerintegrale
+    beziehen sich auf den Sollwert 1 (e = 1 - y).
+
+    Args:
+        systems: Liste von Systemen oder Tupel (num, den) gestapelter
+            Koeffizienten, siehe simulate_step_batch
+        t_end: Simulationsende in Sekunden (default: 10.0)
+        n_points: Anzahl der Zeitpunkte (default: 1000)
+        tolerance: Relative Breite des Toleranzbands (default: 0.02)
+        chunk_size: Systeme je Block (default: 100_000)
+        precision: "float64" oder "float32" für die Rekursion
+
+    Returns:
+        Strukturiertes Array (B,) mit den Feldern steady_state, y_end,
+        t_max, y_max, overshoot_pct, overshoot_abs, rise_time,
+        settling_time, iae, ise, itae
+
+    Beispiel:
+        >>> from regelung.simulation import step_metrics_sweep
+        >>> m = step_metrics_sweep(systeme, t_end=30.0)
+        >>> m["overshoot_pct"], m["itae"]
+    """
+    num, den = _coefficient_batch(systems)
+    t = np.linspace(0.0, t_end, n_points)
+    return _sweep(num, den, t, tolerance, chunk_size, precision)
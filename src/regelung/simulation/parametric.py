@@ -0,0 +1,476 @@
+"""
+Parametrischer Standardregelkreis für Parameterstudien.
+
+Für eine feste Struktur (z.B. PID an PT2) sind alle Koeffizienten des
+geschlossenen Kreises Polynome in den Parametern Kp, Ti, Td, Kp_s, T1, T2.
+ParametricLoop bildet diese Polynome einmal symbolisch und wertet sie
+danach mit NumPy-Broadcasting für beliebig viele Parametersätze aus, ohne
+eine TransferFunction je Parametersatz zu erzeugen.
+
+Beispiel:
+    >>> import numpy as np
+    >>> from regelung import PID, PT2, ParametricLoop
+    >>> loop = ParametricLoop(PID, PT2)
+    >>> loop.params
+    ['Kp', 'Ti', 'Td', 'Kp_s', 'T1', 'T2']
+    >>> Kp, Ti = np.meshgrid(np.linspace(0.5, 5, 200), np.linspace(0.5, 10, 200))
+    >>> stabil = loop.is_stable(Kp=Kp, Ti=Ti, Td=0.2, Kp_s=1.0, T1=2.0, T2=0.5)
+"""
+
+import inspect
+from math import factorial
+
+import numpy as np
+
+from regelung.analysis import batch_roots, damping_table
+from regelung.simulation.batch import _dtype, _hurwitz_stable, _simulate_batch
+from regelung.simulation.metrics import (
+    METRICS,
+    _static_gain,
+    _step_metrics_batch,
+    _sweep,
+)
+from regelung.simulation.steady_state import _error_constants
+
+
+class _Poly:
+    """Multivariates Polynom in den Parametern: {Exponenten: Koeffizient}"""
+
+    def __init__(self, terms, n):
+        self.terms = {m: c for m, c in terms.items() if c != 0}
+        self.n = n
+
+    @classmethod
+    def const(cls, value, n):
+        return cls({(0,) * n: float(value)}, n)
+
+    @classmethod
+    def var(cls, i, n):
+        exponents = [0] * n
+        exponents[i] = 1
+        return cls({tuple(exponents): 1.0}, n)
+
+    def _coerce(self, other):
+        return other if isinstance(other, _Poly) else _Poly.const(other, self.n)
+
+    def __add__(self, other):
+        terms = dict(self.terms)
+        for m, c in self._coerce(other).terms.items():
+            terms[m] = terms.get(m, 0.0) + c
+        return _Poly(terms, self.n)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return _Poly({m: -c for m, c in self.terms.items()}, self.n)
+
+    def __sub__(self, other):
+        return self + (-self._coerce(other))
+
+    def __rsub__(self, other):
+        return self._coerce(other) - self
+
+    def __mul__(self, other):
+        terms = {}
+        for m1, c1 in self.terms.items():
+            for m2, c2 in self._coerce(other).terms.items():
+                m = tuple(a + b for a, b in zip(m1, m2))
+                terms[m] = terms.get(m, 0.0) + c1 * c2
+        return _Poly(terms, self.n)
+
+    __rmul__ = __mul__
+
+    def __pow__(self, k):
+        result = _Poly.const(1.0, self.n)
+        for _ in range(k):
+            result = result * self
+        return result
+
+
+def _pade(Tt, order):
+    """Padé-Approximation der Totzeit mit Tt als Parameter."""
+    c = [
+        factorial(2 * order - k)
+        * factorial(order)
+        / (factorial(2 * order) * factorial(k) * factorial(order - k))
+        for k in range(order, -1, -1)
+    ]
+    num = [(-1) ** k * ck * Tt**k for k, ck in zip(range(order, -1, -1), c)]
+    den = [ck * Tt**k for k, ck in zip(range(order, -1, -1), c)]
+    return num, den
+
+
+# Zähler und Nenner (höchste Potenz zuerst) wie in den Konstruktoren
+_POLYNOMIALS = {
+    "P": lambda Kp: ([Kp], [1]),
+    "PI": lambda Kp, Ti: ([Kp * Ti, Kp], [Ti, 0]),
+    "PID": lambda Kp, Ti, Td: ([Kp * Ti * Td, Kp * Ti, Kp], [Ti, 0]),
+    "PT1": lambda Kp, T: ([Kp], [T, 1]),
+    "PT2": lambda Kp, T1, T2: ([Kp], [T1 * T2, T1 + T2, 1]),
+    "I": lambda Ki: ([Ki], [1, 0]),
+    "IT1": lambda T1, Ki: ([Ki], [T1, 1, 0]),
+    "D": lambda Kd: ([Kd, 0], [1]),
+    "DT1": lambda Kd, T1: ([Kd, 0], [T1, 1]),
+}
+
+
+def _smul(a, b):
+    """Produkt zweier Polynome in s mit Koeffizienten vom Typ _Poly."""
+    result = [0.0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] = x * y + result[i + j]
+    return result
+
+
+def _sadd(a, b):
+    """Summe zweier Polynome in s (höchste Potenz zuerst)."""
+    n = max(len(a), len(b))
+    a = [0.0] * (n - len(a)) + list(a)
+    b = [0.0] * (n - len(b)) + list(b)
+    return [x + y for x, y in zip(a, b)]
+
+
+def _polyval(coefficients, s):
+    """Horner-Schema für gestapelte Koeffizienten (..., n + 1) an s (W,)."""
+    result = np.zeros(coefficients.shape[:-1] + s.shape, dtype=complex)
+    for k in range(coefficients.shape[-1]):
+        result = result * s + coefficients[..., k, None]
+    return result
+
+
+class ParametricLoop:
+    """
+    Standardregelkreis fester Struktur mit Parametern als Arrays.
+
+    Parameternamen entsprechen den Konstruktorargumenten. Gleichnamige
+    Streckenparameter erhalten das Suffix "_s" (z.B. Kp_s), bei mehreren
+    Strecken in Reihe zusätzlich deren Position (T_s1, T_s2, ...).
+
+    Args:
+        regler: Regler-Klasse (P, PI, PID), deren Name oder ein Objekt
+        strecke: Strecken-Klasse, Name, Objekt oder Liste davon
+            (Reihenschaltung)
+        pade_order: Ordnung der Padé-Approximation für Totzeit (default: 2)
+
+    Beispiel:
+        >>> loop = ParametricLoop(PI, [PT1, Totzeit])
+        >>> loop.params
+        ['Kp', 'Ti', 'Kp_s1', 'T', 'Tt']
+        >>> num, den = loop.coefficients(Kp=[1, 2, 3], Ti=2.0, Kp_s1=1.0,
+        ...                              T=1.0, Tt=0.5)
+    """
+
+    def __init__(self, regler, strecke, pade_order=2):
+        strecken = list(strecke) if isinstance(strecke, (list, tuple)) else [strecke]
+        blocks = [_class_name(regler)] + [_class_name(s) for s in strecken]
+
+        functions = []
+        for name in blocks:
+            if name == "Totzeit":
+                functions.append(lambda Tt: _pade(Tt, pade_order))
+            elif name in _POLYNOMIALS:
+                functions.append(_POLYNOMIALS[name])
+            else:
+                raise ValueError(f"Unbekannter Block: {name}")
+
+        # Parameternamen mit Suffix bei Namenskonflikten
+        self.params = []
+        arguments = []
+        for position, func in enumerate(functions):
+            names = []
+            for arg in inspect.signature(func).parameters:
+                name = arg
+                if name in self.params and len(strecken) == 1:
+                    name = f"{arg}_s"
+                elif name in self.params:
+                    name = f"{arg}_s{position}"
+                self.params.append(name)
+                names.append(name)
+            arguments.append(names)
+
+        n = len(self.params)
+        symbols = {p: _Poly.var(i, n) for i, p in enumerate(self.params)}
+        polys = []
+        for func, names in zip(functions, arguments):
+            num, den = func(*(symbols[name] for name in names))
+            polys.append((list(num), list(den)))
+
+        zr, nr = polys[0]
+        zs, ns = [1.0], [1.0]
+        for num, den in polys[1:]:
+            zs, ns = _smul(zs, num), _smul(ns, den)
+
+        L_num = _smul(zr, zs)
+        L_den = _smul(nr, ns)
+        char = _sadd(L_den, L_num)
+        self._blocks = blocks
+        self._compile(
+            {
+                "zr": zr,
+                "nr": nr,
+                "zs": zs,
+                "ns": ns,
+                "num": L_num,
+                "L_den": L_den,
+                "den": char,
+            }
+        )
+
+    def _compile(self, polynomials):
+        """Sammelt alle Monome und legt Koeffizientenmatrizen an."""
+        n = len(self.params)
+        monomials = sorted(
+            {m for poly in polynomials.values() for c in poly for m in _terms(c, n)}
+        )
+        index = {m: j for j, m in enumerate(monomials)}
+        self._exponents = np.array(monomials, dtype=int).reshape(-1, n)
+        self._matrices = {}
+        for key, poly in polynomials.items():
+            C = np.zeros((len(poly), len(monomials)))
+            for k, c in enumerate(poly):
+                for m, value in _terms(c, n).items():
+                    C[k, index[m]] = value
+            self._matrices[key] = C
+
+    def __repr__(self):
+        return f"ParametricLoop({' → '.join(self._blocks)}, params={self.params})"
+
+    def _evaluate(self, keys, params):
+        missing = [p for p in self.params if p not in params]
+        unknown = [p for p in params if p not in self.params]
+        if missing or unknown:
+            raise ValueError(f"Parameter fehlen: {missing}, unbekannt: {unknown}")
+        values = np.broadcast_arrays(
+            *(np.asarray(params[p], dtype=float) for p in self.params)
+        )
+        shape = values[0].shape
+        V = np.ones(shape + (len(self._exponents),))
+        for j, exponents in enumerate(self._exponents):
+            for value, e in zip(values, exponents):
+                if e:
+                    V[..., j] *= value**e
+        return [V @ self._matrices[key].T for key in keys]
+
+    def coefficients(self, **params):
+        """
+        Koeffizienten der Führungsübertragungsfunktion
+
+            T = Zr·Zs / (Nr·Ns + Zr·Zs)
+
+        Args:
+            **params: Parameterwerte (Skalare oder broadcastbare Arrays)
+
+        Returns:
+            num, den: Arrays (..., n + 1), höchste Potenz zuerst, Zähler
+            auf die Länge des Nenners aufgefüllt
+        """
+        num, den = self._evaluate(["num", "den"], params)
+        pad = den.shape[-1] - num.shape[-1]
+        if pad < 0:
+            raise ValueError("Regelkreis ist nicht proper")
+        num = np.concatenate([np.zeros(num.shape[:-1] + (pad,)), num], axis=-1)
+        return num, den
+
+    def is_stable(self, **params):
+        """
+        Stabilität des geschlossenen Kreises (Routh-Hurwitz).
+
+        Returns:
+            Bool-Array in der Broadcast-Form der Parameter
+        """
+        (den,) = self._evaluate(["den"], params)
+        return _hurwitz_stable(den)
+
+    def poles(self, **params):
+        """
+        Pole des geschlossenen Kreises aller Parametersätze.
+
+        Die Wurzeln kommen aus einer gestapelten Eigenwertberechnung der
+        Begleitmatrizen (ein LAPACK-Aufruf für alle Sätze).
+
+        Returns:
+            Komplexes Array (..., n) in der Broadcast-Form der Parameter
+        """
+        (den,) = self._evaluate(["den"], params)
+        return batch_roots(den)
+
+    def zeros(self, **params):
+        """
+        Nullstellen des Führungsverhaltens T(s) aller Parametersätze.
+
+        Returns:
+            Komplexes Array (..., m) in der Broadcast-Form der Parameter
+        """
+        (num,) = self._evaluate(["num"], params)
+        # Strukturell verschwindende führende Koeffizienten weglassen
+        nonzero = np.flatnonzero(np.any(num != 0, axis=tuple(range(num.ndim - 1))))
+        return batch_roots(num[..., nonzero[0] :] if len(nonzero) else num[..., -1:])
+
+    def dcgain(self, **params):
+        """
+        Stationäre Verstärkung T(0) des geschlossenen Kreises.
+
+        Returns:
+            Array in der Broadcast-Form der Parameter
+        """
+        num, den = self._evaluate(["num", "den"], params)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return num[..., -1] / den[..., -1]
+
+    def damping(self, **params):
+        """
+        Eigenkreisfrequenzen und Dämpfungen der Pole, siehe damping_table.
+
+        Returns:
+            dict mit poles, wn, zeta (..., n), je Parametersatz nach wn sortiert
+        """
+        return damping_table(self.poles(**params))
+
+    def error_constants(self, tol=1e-9, **params):
+        """
+        Systemtyp und Fehlerkonstanten des offenen Kreises, siehe
+        error_constants.
+
+        Returns:
+            dict mit Arrays in der Broadcast-Form der Parameter für type,
+            Kp, Kv, Ka, e_step, e_ramp, e_parabola
+        """
+        num, L_den, den = self._evaluate(["num", "L_den", "den"], params)
+        return _error_constants(num, L_den, _hurwitz_stable(den), tol)
+
+    def frequency_response(self, omega, which="T", **params):
+        """
+        Frequenzgang an den Kreisfrequenzen omega.
+
+        Args:
+            omega: Kreisfrequenzen in rad/s (W,)
+            which: "T" (Führung), "S" (Sensitivität) oder "L" (offener Kreis)
+            **params: Parameterwerte
+
+        Returns:
+            Komplexes Array (..., W)
+        """
+        keys = {"T": ("num", "den"), "S": ("L_den", "den"), "L": ("num", "L_den")}
+        if which not in keys:
+            raise ValueError(f"Unbekannte Übertragungsfunktion: {which}")
+        zr, nr, zs, ns, num, den = self._evaluate(
+            ["zr", "nr", "zs", "ns", "num", "den"], params
+        )
+        s = 1j * np.asarray(omega, dtype=float)
+        values = {
+            "num": _polyval(num, s),
+            "den": _polyval(den, s),
+            "L_den": _polyval(nr, s) * _polyval(ns, s),
+        }
+        numerator, denominator = keys[which]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return values[numerator] / values[denominator]
+
+    def step(self, t_end=10.0, n_points=1000, precision="float64", **params):
+        """
+        Sprungantworten aller Parametersätze in einer gestapelten Simulation.
+
+        Args:
+            t_end: Simulationsende in Sekunden (default: 10.0)
+            n_points: Anzahl der Zeitpunkte (default: 1000)
+            precision: "float64" oder "float32" (default: "float64"),
+                siehe simulate_step_batch
+            **params: Parameterwerte
+
+        Returns:
+            t, Y: Zeitvektor (N,) und Antworten (..., N)
+        """
+        num, den = self.coefficients(**params)
+        shape = den.shape[:-1]
+        num = num.reshape(-1, num.shape[-1])
+        den = den.reshape(-1, den.shape[-1])
+        if np.any(den[:, 0] == 0):
+            raise ValueError("Führender Nennerkoeffizient darf nicht 0 sein")
+        t = np.linspace(0.0, t_end, n_points)
+        U = np.ones((len(den), n_points), dtype=_dtype(precision))
+        Y = _simulate_batch(num, den, t, U, precision)
+        return t, Y.reshape(shape + (n_points,))
+
+    def step_metrics(
+        self,
+        t_end=10.0,
+        n_points=1000,
+        tolerance=0.02,
+        chunk_size=10_000,
+        precision="float64",
+        **params,
+    ):
+        """
+        Kennwerte der Sprungantworten wie step_metrics_batch.
+
+        Die Simulation läuft blockweise mit chunk_size Parametersätzen, der
+        Speicherbedarf ist daher unabhängig von der Anzahl der Sätze.
+        Mit precision="float32" laufen Rekursion und Auswertung in float32.
+        Bezugswert ist wie in sweep_metrics die stationäre Verstärkung G(0)
+        (nan bei instabilem Regelkreis), nicht der letzte Abtastwert.
+
+        Returns:
+            dict mit Arrays in der Broadcast-Form der Parameter
+        """
+        num, den = self.coefficients(**params)
+        shape = den.shape[:-1]
+        num = num.reshape(-1, num.shape[-1])
+        den = den.reshape(-1, den.shape[-1])
+        if np.any(den[:, 0] == 0):
+            raise ValueError("Führender Nennerkoeffizient darf nicht 0 sein")
+
+        t = np.linspace(0.0, t_end, n_points)
+        result = {key: np.empty(len(den)) for key in METRICS}
+        for start in range(0, len(den), chunk_size):
+            part = slice(start, start + chunk_size)
+            U = np.ones((len(den[part]), n_points), dtype=_dtype(precision))
+            Y = _simulate_batch(num[part], den[part], t, U, precision)
+            y_inf = _static_gain(num[part], den[part])
+            metrics = _step_metrics_batch(t, Y, tolerance, y_inf=y_inf)[0]
+            for key in METRICS:
+                result[key][part] = metrics[key]
+        return {key: value.reshape(shape) for key, value in result.items()}
+
+    def sweep_metrics(
+        self,
+        t_end=10.0,
+        n_points=1000,
+        tolerance=0.02,
+        chunk_size=100_000,
+        precision="float64",
+        **params,
+    ):
+        """
+        Kennwerte ohne gespeicherte Trajektorien, siehe step_metrics_sweep.
+
+        Geeignet für sehr große Parametergitter: je Parametersatz werden nur
+        laufende Akkumulatoren mitgeführt, zusätzlich liefert das Ergebnis
+        die Fehlerintegrale iae, ise und itae.
+
+        Returns:
+            Strukturiertes Array in der Broadcast-Form der Parameter
+        """
+        num, den = self.coefficients(**params)
+        shape = den.shape[:-1]
+        num = num.reshape(-1, num.shape[-1])
+        den = den.reshape(-1, den.shape[-1])
+        if np.any(den[:, 0] == 0):
+            raise ValueError("Führender Nennerkoeffizient darf nicht 0 sein")
+
+        t = np.linspace(0.0, t_end, n_points)
+        return _sweep(num, den, t, tolerance, chunk_size, precision).reshape(shape)
+
+
+def _class_name(block):
+    if isinstance(block, str):
+        return block
+    if isinstance(block, type):
+        return block.__name__
+    return type(block).__name__
+
+
+def _terms(coefficient, n):
+    if isinstance(coefficient, _Poly):
+        return coefficient.terms
+    return _Poly.const(coefficient, n).terms
@@ -4,6 +4,47 @@ Visualisierungsfunktionen für Regelkreise.
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.collections import LineCollection
+
+from regelung.simulation.core import final_value
+from regelung.simulation.metrics import _band_exit
+
+# Standard-Punktzahl je Linie nach der Ausdünnung (ca. 2 Punkte je Pixel
+# bei 300 dpi und 12 Zoll Breite, also verlustfrei im Bild)
+MAX_POINTS = 8000
+
+
+def _decimate(t, y, max_points):
+    """
+    Min/Max-Ausdünnung für die Darstellung langer Signale.
+
+    Das Signal wird in max_points/2 gleich lange Abschnitte geteilt; je
+    Abschnitt bleiben Minimum und Maximum in zeitlicher Reihenfolge erhalten.
+    Spitzen und Hüllkurve sehen damit wie im Original aus, der Aufwand
+    hängt nur noch von max_points ab.
+
+    Args:
+        t: Zeitvektor (N,)
+        y: Signal (N,)
+        max_points: Zielanzahl der Punkte (None: keine Ausdünnung)
+
+    Returns:
+        t, y: Ausgedünnte Vektoren
+    """
+    t, y = np.asarray(t), np.asarray(y)
+    n = len(y)
+    if max_points is None or n <= max_points or y.ndim != 1:
+        return t, y
+    bins = max(max_points // 2, 1)
+    width = -(-n // bins)
+    padded = np.concatenate([y, np.full(bins * width - n, y[-1])]).reshape(bins, -1)
+    offsets = np.arange(bins) * width
+    low = offsets + np.argmin(padded, axis=1)
+    high = offsets + np.argmax(padded, axis=1)
+    index = np.unique(np.concatenate([[0, n - 1], low, high]))
+    index = index[index < n]
+    return t[index], y[index]
 
 
 def plot_step(
@@ -18,6 +59,7 @@ def plot_step(
     show_input=False,
     u_amplitude=1.0,
     u_signal=None,
+    max_points=MAX_POINTS,
 ):
     """
     Plottet Sprungantwort oder beliebige Signale.
@@ -33,6 +75,8 @@ def plot_step(
         show_input: Zeige Eingangssignal in separatem Plot (default: False)
         u_amplitude: Amplitude des Sprungs (default: 1.0)
         u_signal: Beliebiges Eingangssignal (überschreibt u_amplitude)
+        max_points: Längere Signale werden für die Darstellung per Min/Max
+            ausgedünnt (default: MAX_POINTS, None: alle Punkte)
     Beispiel:
         >>> from regelung import PT1, simulate_step, plot_step
         >>> strecke = PT1(K=2.0, T=1.0)
@@ -49,13 +93,15 @@ def plot_step(
     # ===== EINGANGSSIGNAL (oberer Plot) =====
     if show_input:
         if u_signal is not None:
-            ax_input.plot(t, u_signal, "r-", linewidth=2.5, label="Eingang u(t)")
+            t_u, u_plot = _decimate(t, u_signal, max_points)
+            ax_input.plot(t_u, u_plot, "r-", linewidth=2.5, label="Eingang u(t)")
         else:
             # Standard-Sprung
             u = np.ones_like(t) * u_amplitude
             u[t < 0] = 0
+            t_u, u = _decimate(t, u, max_points)
             ax_input.plot(
-                t,
+                t_u,
                 u,
                 "r-",
                 linewidth=2.5,
@@ -75,7 +121,12 @@ def plot_step(
         ax_input.legend(loc="best", fontsize=10)
 
     # ===== AUSGANGSSIGNAL (unterer Plot / einziger Plot) =====
-    ax_output.plot(t, y, linewidth=2.5, color="#2E86AB", label="Ausgang y(t)")
+    ax_output.plot(
+        *_decimate(t, y, max_points),
+        linewidth=2.5,
+        color="#2E86AB",
+        label="Ausgang y(t)",
+    )
 
     # Endwert-Linie
     steady_state = y[-1]
@@ -121,7 +172,7 @@ def plot_step(
 
 
 def plot_step_with_metrics(
-    t, y, title="Sprungantwort mit Metriken", save=None, show=True
+    t, y, title="Sprungantwort mit Metriken", save=None, show=True, system=None
 ):
     """
     Plottet Sprungantwort mit Regelgütekriterien.
@@ -132,6 +183,8 @@ def plot_step_with_metrics(
         title: Titel des Plots
         save: Pfad zum Speichern (optional)
         show: Plot anzeigen (True/False)
+        system: Simuliertes System (optional) für den analytischen Endwert,
+            siehe get_step_metrics
 
     Zeigt automatisch:
         - Endwert (stationärer Wert)
@@ -146,7 +199,7 @@ def plot_step_with_metrics(
         >>> regler = PID(Kp=2.0, Ti=1.5, Td=0.3)
         >>> system = closed_loop(regler, strecke)
         >>> t, y = simulate_step(system)
-        >>> plot_step_with_metrics(t, y, title="PT2 mit PID-Regler")
+        >>> plot_step_with_metrics(t, y, title="PT2 mit PID-Regler", system=system)
     """
     fig, ax = plt.subplots(figsize=(12, 7))
 
@@ -154,40 +207,29 @@ def plot_step_with_metrics(
     ax.plot(t, y, linewidth=2.5, color="#2E86AB", label="y(t)")
 
     # Metriken berechnen
-    steady_state = y[-1]
-    max_value = np.max(y)
-    overshoot_abs = max_value - steady_state
-    overshoot_pct = (overshoot_abs / steady_state * 100) if steady_state != 0 else 0
-
-    # 2% Band für Ausregelzeit
+    metrics = get_step_metrics(t, y, system=system)
+    steady_state = metrics["steady_state"]
+    max_value = metrics["y_max"]
+    overshoot_abs = metrics["overshoot_abs"]
+    overshoot_pct = metrics["overshoot_pct"]
+    settling_time = metrics["settling_time"]
+    rise_time = metrics["rise_time"]
     tolerance = 0.02 * abs(steady_state)
-    settled_idx = np.where(np.abs(y - steady_state) <= tolerance)[0]
-    settling_time = t[settled_idx[0]] if len(settled_idx) > 0 else t[-1]
-
-    # Anstiegszeit (10% bis 90%)
-    y_10 = 0.1 * steady_state
-    y_90 = 0.9 * steady_state
-
-    try:
-        idx_10 = np.where(y >= y_10)[0][0] if np.any(y >= y_10) else 0
-        idx_90 = np.where(y >= y_90)[0][0] if np.any(y >= y_90) else len(y) - 1
-        rise_time = t[idx_90] - t[idx_10]
-    except IndexError:
-        rise_time = 0
 
     # Markierungen im Plot
     # Endwert
-    ax.axhline(
-        y=steady_state,
-        color="red",
-        linestyle="--",
-        linewidth=1.5,
-        alpha=0.7,
-        label=f"Endwert: {steady_state:.3f}",
-    )
+    if np.isfinite(steady_state):
+        ax.axhline(
+            y=steady_state,
+            color="red",
+            linestyle="--",
+            linewidth=1.5,
+            alpha=0.7,
+            label=f"Endwert: {steady_state:.3f}",
+        )
 
     # 2% Band
-    if steady_state > 0:
+    if np.isfinite(steady_state) and steady_state > 0:
         ax.axhline(
             y=steady_state * 1.02, color="orange", linestyle=":", linewidth=1, alpha=0.5
         )
@@ -201,7 +243,7 @@ def plot_step_with_metrics(
         )
 
     # Ausregelzeit
-    if settling_time < t[-1]:
+    if np.isfinite(settling_time) and settling_time < t[-1]:
         ax.axvline(
             x=settling_time,
             color="green",
@@ -212,7 +254,7 @@ def plot_step_with_metrics(
         )
 
     # Überschwingen markieren
-    if overshoot_abs > tolerance:  # Nur wenn signifikant
+    if np.isfinite(overshoot_abs) and overshoot_abs > tolerance:  # Nur wenn signifikant
         max_idx = np.argmax(y)
         ax.plot(t[max_idx], y[max_idx], "ro", markersize=8, zorder=5)
         ax.annotate(
@@ -268,6 +310,290 @@ def plot_step_with_metrics(
     return fig  # Für marimo: Figure zurückgeben
 
 
+class StepPlot:
+    """
+    Wiederverwendbare Sprungantwort-Figure für Schieberegler und Animationen.
+
+    Figure, Achsen, Beschriftungen und Layout werden einmal erzeugt; update
+    ersetzt nur die Liniendaten und die Metrik-Markierungen. Auf
+    interaktiven Backends mit Blitting (z.B. QtAgg, TkAgg, ipympl) wird nur
+    der Achseninhalt über einen gespeicherten Hintergrund neu gezeichnet.
+    Andere Backends (marimo, Agg) zeichnen die vorhandene Figure erst beim
+    Anzeigen, ohne neue Achsen und ohne tight_layout.
+
+    Args:
+        title: Titel des Plots
+        xlabel: Label der x-Achse
+        ylabel: Label der y-Achse
+        figsize: Größe der Figure (width, height)
+        label: Legendeneintrag der Antwort (default: "y(t)")
+        setpoint: Sollwert als feste Linie (optional, z.B. 1.0)
+        metrics: Endwert, ±2%-Band, Ausregelzeit, Maximum und Textbox mit
+            Regelgütekriterien anzeigen (default: True)
+        blit: Blitting erzwingen (True) oder abschalten (False)
+            (default: None, automatisch je nach Backend)
+        max_points: Längere Signale werden per Min/Max ausgedünnt
+            (default: MAX_POINTS, None: alle Punkte)
+
+    Beispiel:
+        >>> from regelung import P, PT1, StepPlot, closed_loop, simulate_step
+        >>> plot = StepPlot(title="Regelkreis", setpoint=1.0)
+        >>> for Kp in (0.5, 1.0, 2.0):
+        ...     system = closed_loop(P(Kp=Kp), PT1(Kp=2.0, T=1.0))
+        ...     metrics = plot.update(*simulate_step(system), system=system)
+        >>> plot.fig  # Für marimo: Figure als Zellausgabe
+    """
+
+    def __init__(
+        self,
+        title="Sprungantwort",
+        xlabel="Zeit [s]",
+        ylabel="y(t)",
+        figsize=(12, 6),
+        label="y(t)",
+        setpoint=None,
+        metrics=True,
+        blit=None,
+        max_points=MAX_POINTS,
+    ):
+        self.fig, self.ax = plt.subplots(figsize=figsize)
+        self.max_points = max_points
+        self._blit = blit
+        self._animated = False
+        self._background = None
+        self._redraw = True
+        self._lines = {}
+        self._annotations = []
+        ax = self.ax
+
+        if setpoint is not None:
+            ax.axhline(
+                y=setpoint,
+                color="red",
+                linestyle="--",
+                linewidth=2,
+                alpha=0.7,
+                label=f"Sollwert w = {setpoint:g}",
+            )
+        (self.line,) = ax.plot([], [], linewidth=2.5, color="#2E86AB", label=label)
+
+        if metrics:
+            self._steady = ax.axhline(
+                y=0.0,
+                color="olive",
+                linestyle="--",
+                linewidth=1.5,
+                alpha=0.7,
+                label="Endwert",
+                visible=False,
+            )
+            band = dict(color="orange", linestyle=":", linewidth=1, alpha=0.5)
+            self._band = (
+                ax.axhline(y=0.0, visible=False, **band),
+                ax.axhline(y=0.0, visible=False, label="±2% Band", **band),
+            )
+            self._settling = ax.axvline(
+                x=0.0,
+                color="green",
+                linestyle="--",
+                linewidth=1.5,
+                alpha=0.7,
+                label="Ausregelzeit",
+                visible=False,
+            )
+            (self._peak,) = ax.plot([], [], "ro", markersize=8, zorder=5)
+            self._text = ax.text(
+                0.02,
+                0.98,
+                "",
+                transform=ax.transAxes,
+                verticalalignment="top",
+                bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.85),
+                fontsize=10,
+                fontfamily="monospace",
+            )
+            self._annotations = [
+                self._steady,
+                *self._band,
+                self._settling,
+                self._peak,
+                self._text,
+            ]
+
+        # Styling
+        ax.grid(True, alpha=0.3, linestyle="--")
+        ax.set_title(title, fontsize=14, fontweight="bold")
+        ax.set_xlabel(xlabel, fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.legend(loc="right", fontsize=10)
+
+        # Layout nur einmal, update verschiebt keine Achsen mehr
+        plt.tight_layout()
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def add_line(self, name, label=None, **style):
+        """
+        Ergänzt eine weitere Linie, die mit update(..., lines=...) mitläuft.
+
+        Args:
+            name: Schlüssel für update
+            label: Legendeneintrag (default: name)
+            **style: Linienstil für ax.plot, z.B. color="red", linestyle="--"
+
+        Returns:
+            Line2D der neuen Linie
+        """
+        style.setdefault("linewidth", 2)
+        (line,) = self.ax.plot([], [], label=name if label is None else label, **style)
+        line.set_animated(self._animated)
+        self._lines[name] = line
+        self.ax.legend(loc="right", fontsize=10)
+        self._redraw = True
+        return line
+
+    def update(self, t, y, system=None, title=None, lines=None):
+        """
+        Ersetzt Antwort, Metriken und Zusatzlinien auf der bestehenden Figure.
+
+        Achsengrenzen werden nur angepasst, wenn die Daten sie verlassen oder
+        weniger als die Hälfte davon nutzen; nur dann (und bei neuem Titel)
+        wird beim Blitting die ganze Figure neu gezeichnet.
+
+        Args:
+            t: Zeitvektor
+            y: Ausgangssignal
+            system: Simuliertes System (optional) für den analytischen
+                Endwert, siehe get_step_metrics
+            title: Neuer Titel (optional)
+            lines: dict {name: y} oder {name: (t, y)} für Linien aus add_line
+
+        Returns:
+            dict mit Metriken wie get_step_metrics
+        """
+        t = np.asarray(t, dtype=float)
+        y = np.asarray(y, dtype=float)
+        metrics = get_step_metrics(t, y, system=system)
+
+        self.line.set_data(*_decimate(t, y, self.max_points))
+        for name, data in (lines or {}).items():
+            t_line, y_line = data if isinstance(data, tuple) else (t, data)
+            self._lines[name].set_data(*_decimate(t_line, y_line, self.max_points))
+        if self._annotations:
+            self._set_metrics(metrics, t)
+
+        if title is not None and title != self.ax.get_title():
+            self.ax.set_title(title, fontsize=14, fontweight="bold")
+            self._redraw = True
+        self._rescale()
+        self._draw()
+        return metrics
+
+    def _set_metrics(self, metrics, t):
+        """Markierungen und Textbox aus den Metriken."""
+        steady_state = metrics["steady_state"]
+        settling_time = metrics["settling_time"]
+        finite = bool(np.isfinite(steady_state))
+
+        self._steady.set_visible(finite)
+        tolerance = 0.02 * abs(steady_state) if finite else 0.0
+        for line, value in zip(self._band, (1, -1)):
+            line.set_visible(finite and steady_state != 0)
+            if finite:
+                line.set_ydata([steady_state + value * tolerance] * 2)
+        if finite:
+            self._steady.set_ydata([steady_state] * 2)
+
+        settled = bool(np.isfinite(settling_time) and settling_time < t[-1])
+        self._settling.set_visible(settled)
+        if settled:
+            self._settling.set_xdata([settling_time] * 2)
+
+        overshoot = metrics["overshoot_abs"]
+        if np.isfinite(overshoot) and overshoot > tolerance:
+            self._peak.set_data([metrics["t_max"]], [metrics["y_max"]])
+        else:
+            self._peak.set_data([], [])
+
+        self._text.set_text(
+            f"Regelgütekriterien:\n"
+            f"━━━━━━━━━━━━━━━━━\n"
+            f"Endwert:        {steady_state:.4f}\n"
+            f"Maximum:        {metrics['y_max']:.4f}\n"
+            f"Überschwingen:  {metrics['overshoot_pct']:.2f}%\n"
+            f"Ausregelzeit:   {settling_time:.3f}s\n"
+            f"Anstiegszeit:   {metrics['rise_time']:.3f}s"
+        )
+
+    def _rescale(self):
+        """Passt die Achsengrenzen an, wenn die Daten es erfordern."""
+        lines = [self.line, *self._lines.values()]
+        x = np.concatenate([np.asarray(line.get_xdata(), float) for line in lines])
+        y = np.concatenate([np.asarray(line.get_ydata(), float) for line in lines])
+        x, y = x[np.isfinite(x)], y[np.isfinite(y)]
+        if x.size == 0 or y.size == 0:
+            return
+
+        xlim = (x.min(), x.max()) if np.ptp(x) > 0 else (x[0] - 1.0, x[0] + 1.0)
+        span = max(np.ptp(y), 1e-3 * max(abs(y.max()), 1.0))
+        needed = (y.min() - 0.05 * span, y.max() + 0.1 * span)
+        low, high = self.ax.get_ylim()
+        if not np.allclose(self.ax.get_xlim(), xlim):
+            self.ax.set_xlim(xlim)
+            self._redraw = True
+        outside = needed[0] < low or needed[1] > high
+        if outside or high - low > 2 * (needed[1] - needed[0]):
+            # Reserve, damit kleine Parameteränderungen beim Blitting nur
+            # den gespeicherten Hintergrund brauchen
+            self.ax.set_ylim(y.min() - 0.1 * span, y.max() + 0.25 * span)
+            self._redraw = True
+
+    @property
+    def _dynamic(self):
+        return [self.line, *self._lines.values(), *self._annotations]
+
+    def _use_blit(self):
+        canvas = self.fig.canvas
+        if self._blit is not None:
+            return self._blit and canvas.supports_blit
+        # Nur Backends mit eigener Ereignisschleife überschreiben draw_idle
+        interactive = type(canvas).draw_idle is not FigureCanvasBase.draw_idle
+        return canvas.supports_blit and interactive
+
+    def _on_draw(self, event):
+        """Speichert nach jedem vollständigen Zeichnen den Hintergrund."""
+        if not self._animated:
+            return
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._dynamic:
+            self.fig.draw_artist(artist)
+
+    def _draw(self):
+        canvas = self.fig.canvas
+        blit = self._use_blit()
+        if blit != self._animated:
+            # Animierte Artists fehlen beim normalen Zeichnen und Speichern
+            for artist in self._dynamic:
+                artist.set_animated(blit)
+            self._animated = blit
+            self._background = None
+
+        if not blit:
+            if type(canvas).draw_idle is not FigureCanvasBase.draw_idle:
+                canvas.draw_idle()
+            self._redraw = False
+            return
+
+        if self._redraw or self._background is None:
+            canvas.draw()  # _on_draw speichert Hintergrund und zeichnet Daten
+        else:
+            canvas.restore_region(self._background)
+            for artist in self._dynamic:
+                self.fig.draw_artist(artist)
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+        self._redraw = False
+
+
 def plot_signal(
     t,
     y,
@@ -279,6 +605,7 @@ def plot_signal(
     xlabel="Zeit [s]",
     ylabel="Signal",
     figsize=(12, 6),
+    max_points=MAX_POINTS,
 ):
     """
     Plottet beliebige Ein- und Ausgangssignale (Sinus, Rampe, etc.).
@@ -294,6 +621,8 @@ def plot_signal(
         xlabel: Label der x-Achse
         ylabel: Label der y-Achse
         figsize: Größe der Figure (width, height)
+        max_points: Längere Signale werden für die Darstellung per Min/Max
+            ausgedünnt (default: MAX_POINTS, None: alle Punkte)
 
     Beispiel:
         >>> import numpy as np
@@ -314,7 +643,9 @@ def plot_signal(
 
     # ===== EINGANGSSIGNAL (oberer Plot) =====
     if show_input and u is not None:
-        ax_input.plot(t, u, "r-", linewidth=2.5, label="Eingang u(t)")
+        ax_input.plot(
+            *_decimate(t, u, max_points), "r-", linewidth=2.5, label="Eingang u(t)"
+        )
 
         # Styling für Input-Plot
         ax_input.grid(True, alpha=0.3, linestyle="--")
@@ -324,7 +655,12 @@ def plot_signal(
         ax_input.legend(loc="best", fontsize=11)
 
     # ===== AUSGANGSSIGNAL (unterer Plot / einziger Plot) =====
-    ax_output.plot(t, y, linewidth=2.5, color="#2E86AB", label="Ausgang y(t)")
+    ax_output.plot(
+        *_decimate(t, y, max_points),
+        linewidth=2.5,
+        color="#2E86AB",
+        label="Ausgang y(t)",
+    )
 
     # Styling für Output-Plot
     ax_output.grid(True, alpha=0.3, linestyle="--")
@@ -356,13 +692,363 @@ def plot_signal(
     return fig  # Für marimo: Figure zurückgeben
 
 
-def get_step_metrics(t, y):
+def plot_step_family(
+    t,
+    Y,
+    nominal=None,
+    envelope=True,
+    percentiles=None,
+    title="Sprungantworten",
+    save=None,
+    show=True,
+    xlabel="Zeit [s]",
+    ylabel="y(t)",
+    figsize=(10, 6),
+    alpha=None,
+):
+    """
+    Plottet viele Antworten auf einmal (Monte-Carlo, Parameterstudien).
+
+    Alle Verläufe werden als eine einzige LineCollection gezeichnet; auch
+    10⁴ Antworten bleiben so in wenigen Sekunden darstellbar.
+
+    Args:
+        t: Zeitvektor (N,)
+        Y: Antworten (B, N), z.B. aus simulate_step_batch
+        nominal: Hervorgehobener Verlauf, Zeilenindex in Y oder Array (N,)
+            (optional)
+        envelope: Min/Max-Band einzeichnen (default: True)
+        percentiles: Perzentilband, z.B. (5, 95) (optional)
+        title: Titel des Plots
+        save: Pfad zum Speichern (optional)
+        show: Plot anzeigen (True/False)
+        xlabel: Label der x-Achse
+        ylabel: Label der y-Achse
+        figsize: Größe der Figure (width, height)
+        alpha: Deckkraft der einzelnen Verläufe (default: None, abhängig
+            von der Anzahl)
+
+    Beispiel:
+        >>> import numpy as np
+        >>> from regelung import PT2, P, closed_loop, plot_step_family
+        >>> from regelung.simulation import simulate_step_batch
+        >>> rng = np.random.default_rng(0)
+        >>> systeme = [closed_loop(P(Kp=2.0), PT2(Kp=k, T1=2.0, T2=0.5))
+        ...            for k in rng.normal(1.0, 0.1, 1000)]
+        >>> t, Y = simulate_step_batch(systeme, t_end=20.0)
+        >>> plot_step_family(t, Y, nominal=0, percentiles=(5, 95))
+    """
+    t = np.asarray(t, dtype=float)
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    if Y.shape[1] != len(t):
+        raise ValueError("Y muss die Form (Anzahl Verläufe, len(t)) haben")
+    if alpha is None:
+        alpha = float(np.clip(20.0 / len(Y), 0.02, 1.0))
+
+    fig, ax = plt.subplots(figsize=figsize)
+
+    # Alle Verläufe als ein Objekt: Segmente (B, N, 2)
+    segments = np.empty(Y.shape + (2,))
+    segments[..., 0] = t
+    segments[..., 1] = Y
+    lines = LineCollection(
+        segments, colors="#2E86AB", linewidths=1.0, alpha=alpha, label="Verläufe"
+    )
+    ax.add_collection(lines)
+
+    if envelope:
+        ax.fill_between(
+            t,
+            np.nanmin(Y, axis=0),
+            np.nanmax(Y, axis=0),
+            color="#2E86AB",
+            alpha=0.12,
+            linewidth=0,
+            label="Min/Max",
+        )
+    if percentiles is not None:
+        low, high = np.nanpercentile(Y, percentiles, axis=0)
+        ax.fill_between(
+            t,
+            low,
+            high,
+            color="orange",
+            alpha=0.3,
+            linewidth=0,
+            label=f"{percentiles[0]:g}.-{percentiles[1]:g}. Perzentil",
+        )
+    if nominal is not None:
+        y_nom = Y[nominal] if np.ndim(nominal) == 0 else np.asarray(nominal)
+        ax.plot(t, y_nom, linewidth=2.5, color="red", label="Nominal")
+
+    ax.autoscale_view()
+
+    # Styling
+    ax.grid(True, alpha=0.3, linestyle="--")
+    ax.axvline(x=0, color="gray", linestyle=":", linewidth=1, alpha=0.5)
+    ax.set_title(f"{title} ({len(Y)} Verläufe)", fontsize=14, fontweight="bold")
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.legend(loc="best", fontsize=10)
+
+    plt.tight_layout()
+
+    if save:
+        plt.savefig(save, dpi=300, bbox_inches="tight")
+        print(f"✓ Plot gespeichert: {save}")
+
+    if show:
+        plt.show()
+    else:
+        plt.close()
+
+    return fig  # Für marimo: Figure zurückgeben
+
+
+def plot_root_locus(
+    gains,
+    roots,
+    zeros=None,
+    title="Wurzelortskurve",
+    save=None,
+    show=True,
+    figsize=(10, 8),
+):
+    """
+    Plottet eine Wurzelortskurve.
+
+    Args:
+        gains: Verstärkungen (M,), z.B. aus root_locus
+        roots: Pole des geschlossenen Kreises (M, n), Spalte j ist Ast j
+        zeros: Nullstellen des offenen Kreises (optional, Markierung "o")
+        title: Titel des Plots
+        save: Pfad zum Speichern (optional)
+        show: Plot anzeigen (True/False)
+        figsize: Größe der Figure (width, height)
+
+    Markiert die Pole des offenen Kreises (x, erste Verstärkung) und die
+    Verstärkung, ab der der geschlossene Kreis instabil wird.
+
+    Beispiel:
+        >>> from regelung import PT2, Totzeit, plot_root_locus, series_connection
+        >>> from regelung.simulation import root_locus
+        >>> L = series_connection(PT2(Kp=1.0, T1=2.0, T2=0.5), Totzeit(Tt=1.0))
+        >>> gains, roots = root_locus(L, k_max=20.0)
+        >>> plot_root_locus(gains, roots, zeros=L.zeros())
+    """
+    gains = np.asarray(gains)
+    roots = np.asarray(roots)
+    fig, ax = plt.subplots(figsize=figsize)
+
+    # Alle Äste in einem Aufruf (eine Linie je Spalte)
+    ax.plot(roots.real, roots.imag, linewidth=2.0)
+    ax.plot(
+        roots[0].real,
+        roots[0].imag,
+        "x",
+        color="k",
+        markersize=10,
+        markeredgewidth=2,
+        label="Pole (offener Kreis)",
+    )
+    if zeros is not None and len(zeros):
+        zeros = np.asarray(zeros)
+        ax.plot(
+            zeros.real,
+            zeros.imag,
+            "o",
+            color="k",
+            markerfacecolor="none",
+            markersize=9,
+            markeredgewidth=2,
+            label="Nullstellen",
+        )
+
+    # Stabilitätsgrenze: erster Übergang von stabil nach instabil
+    stable = np.all(roots.real < 0, axis=1)
+    transitions = np.flatnonzero(stable[:-1] & ~stable[1:]) + 1
+    if len(transitions):
+        k = transitions[0]
+        crossing = roots[k][roots[k].real >= 0]
+        ax.plot(
+            crossing.real,
+            crossing.imag,
+            "ro",
+            markersize=8,
+            zorder=5,
+            label=f"Stabilitätsgrenze: K ≈ {gains[k]:.3g}",
+        )
+
+    # Imaginäre Achse
+    ax.axvline(x=0, color="k", linewidth=0.8, alpha=0.7)
+    ax.axhline(y=0, color="k", linewidth=0.5, alpha=0.5)
+
+    # Styling
+    ax.grid(True, alpha=0.3, linestyle="--")
+    ax.set_title(title, fontsize=14, fontweight="bold")
+    ax.set_xlabel("Re(s)", fontsize=12)
+    ax.set_ylabel("Im(s)", fontsize=12)
+    ax.legend(loc="best", fontsize=10)
+
+    plt.tight_layout()
+
+    if save:
+        plt.savefig(save, dpi=300, bbox_inches="tight")
+        print(f"✓ Plot gespeichert: {save}")
+
+    if show:
+        plt.show()
+    else:
+        plt.close()
+
+    return fig  # Für marimo: Figure zurückgeben
+
+
+# Achsenbeschriftung der Kennwerte für plot_metric_map
+_METRIC_LABELS = {
+    "steady_state": "Endwert",
+    "y_end": "Letzter Wert",
+    "t_max": "Zeit des Maximums [s]",
+    "y_max": "Maximum",
+    "overshoot_pct": "Überschwingen [%]",
+    "overshoot_abs": "Überschwingen",
+    "rise_time": "Anstiegszeit [s]",
+    "settling_time": "Ausregelzeit [s]",
+    "iae": "IAE",
+    "ise": "ISE",
+    "itae": "ITAE",
+}
+
+
+def _uniform(v):
+    return len(v) < 3 or np.allclose(np.diff(v), v[1] - v[0], rtol=1e-6)
+
+
+def plot_metric_map(
+    x,
+    y,
+    metrics,
+    field="overshoot_pct",
+    limits=None,
+    title=None,
+    xlabel="Kp",
+    ylabel="Ti",
+    cmap="viridis",
+    save=None,
+    show=True,
+    figsize=(10, 7),
+):
+    """
+    Plottet einen Kennwert über einem 2D-Parametergitter als Farbkarte.
+
+    Äquidistante Gitter werden als ein Bild (imshow) gezeichnet, sonst als
+    pcolormesh; es entsteht kein Objekt je Gitterpunkt, auch 10⁶ Zellen
+    bleiben schnell. Zellen ohne Wert (nan, z.B. instabil) bleiben grau.
+
+    Args:
+        x: Parameterwerte der Spalten (nx,) oder Gitter (ny, nx)
+        y: Parameterwerte der Zeilen (ny,) oder Gitter (ny, nx)
+        metrics: Ergebnis einer Parameterstudie, z.B. loop.sweep_metrics
+            (strukturiertes Array) oder loop.step_metrics (dict), oder
+            direkt ein Array (ny, nx)
+        field: Darzustellender Kennwert (default: "overshoot_pct")
+        limits: Grenzwerte als Höhenlinien, z.B. [5.0] für 5% Überschwingen
+            (optional)
+        title: Titel des Plots (default: Beschriftung des Kennwerts)
+        xlabel: Label der x-Achse
+        ylabel: Label der y-Achse
+        cmap: Farbkarte (default: "viridis")
+        save: Pfad zum Speichern (optional)
+        show: Plot anzeigen (True/False)
+        figsize: Größe der Figure (width, height)
+
+    Beispiel:
+        >>> import numpy as np
+        >>> from regelung import PI, PT2, ParametricLoop, plot_metric_map
+        >>> loop = ParametricLoop(PI, PT2)
+        >>> Kp, Ti = np.linspace(0.5, 5, 300), np.linspace(0.5, 10, 200)
+        >>> m = loop.sweep_metrics(Kp=Kp, Ti=Ti[:, None], Kp_s=1.0, T1=2.0, T2=0.5)
+        >>> plot_metric_map(Kp, Ti, m, field="overshoot_pct", limits=[5.0])
+    """
+    if isinstance(metrics, np.ndarray) and metrics.dtype.names is None:
+        Z = metrics
+    else:
+        Z = metrics[field]
+    Z = np.asarray(Z, dtype=float)
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if Z.ndim != 2:
+        raise ValueError("Kennwert muss ein 2D-Gitter (ny, nx) sein")
+    if x.ndim == 1 and y.ndim == 1 and Z.shape != (len(y), len(x)):
+        raise ValueError(
+            f"Form {Z.shape} passt nicht zu (len(y), len(x)) = {(len(y), len(x))}"
+        )
+
+    fig, ax = plt.subplots(figsize=figsize)
+    colormap = plt.get_cmap(cmap).with_extremes(bad="lightgray")
+    Z_masked = np.ma.masked_invalid(Z)
+
+    if x.ndim == 1 and y.ndim == 1 and _uniform(x) and _uniform(y):
+        dx = (x[-1] - x[0]) / max(len(x) - 1, 1) / 2 if len(x) > 1 else 0.5
+        dy = (y[-1] - y[0]) / max(len(y) - 1, 1) / 2 if len(y) > 1 else 0.5
+        image = ax.imshow(
+            Z_masked,
+            origin="lower",
+            aspect="auto",
+            interpolation="nearest",
+            extent=(x[0] - dx, x[-1] + dx, y[0] - dy, y[-1] + dy),
+            cmap=colormap,
+        )
+    else:
+        image = ax.pcolormesh(
+            x, y, Z_masked, shading="auto", cmap=colormap, rasterized=True
+        )
+    label = _METRIC_LABELS.get(field, field)
+    fig.colorbar(image, ax=ax, label=label)
+
+    # Höhenlinien für Grenzwerte (z.B. Überschwingen <= 5%)
+    if limits is not None and np.any(np.isfinite(Z)):
+        X, Y = (x, y) if x.ndim == 2 else np.meshgrid(x, y)
+        contour = ax.contour(
+            X, Y, Z_masked, levels=sorted(limits), colors="red", linewidths=1.5
+        )
+        ax.clabel(contour, fmt="%g", fontsize=9)
+
+    # Styling
+    ax.grid(True, alpha=0.3, linestyle="--")
+    ax.set_title(title or label, fontsize=14, fontweight="bold")
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+
+    plt.tight_layout()
+
+    if save:
+        plt.savefig(save, dpi=300, bbox_inches="tight")
+        print(f"✓ Plot gespeichert: {save}")
+
+    if show:
+        plt.show()
+    else:
+        plt.close()
+
+    return fig  # Für marimo: Figure zurückgeben
+
+
+def get_step_metrics(t, y, system=None):
     """
     Berechnet Regelgütekriterien aus Sprungantwort.
 
+    Ohne system gilt der letzte Abtastwert als Endwert; die Simulation muss
+    dann eingeschwungen sein. Mit system wird der Endwert analytisch über
+    den Endwertsatz bestimmt (final_value), kurze Simulationen genügen.
+    Wächst der Ausgang unbeschränkt (Integrator, steady_state = ±inf) oder
+    ist das System instabil (nan), sind Überschwingen, Anstiegs- und
+    Ausregelzeit nan.
+
     Args:
         t: Zeitvektor
         y: Ausgangssignal
+        system: Simuliertes System (optional), Transfer-Funktion oder
+            Objekt mit .tf()
 
     Returns:
         dict mit Metriken:
@@ -372,7 +1058,10 @@ def get_step_metrics(t, y):
             - overshoot_pct: Überschwingen in %
             - overshoot_abs: Absolutes Überschwingen
             - rise_time: Anstiegszeit (10%-90%)
-            - settling_time: Ausregelzeit (2%-Kriterium)
+            - settling_time: Ausregelzeit (2%-Kriterium): Zeitpunkt, ab
+              dem die Antwort das Band ±2% um den Endwert nicht mehr
+              verlässt (linear interpoliert); nan, wenn sie am Ende der
+              Simulation noch außerhalb liegt
 
     Beispiel:
         >>> from regelung import PT2, simulate_step, get_step_metrics
@@ -381,13 +1070,24 @@ def get_step_metrics(t, y):
         >>> metrics = get_step_metrics(t, y)
         >>> print(f"Überschwingen: {metrics['overshoot_pct']:.2f}%")
     """
-    steady_state = y[-1]
+    steady_state = y[-1] if system is None else final_value(system)
 
     # Maximum
     max_idx = np.argmax(y)
     t_max = t[max_idx]
     y_max = y[max_idx]
 
+    if not np.isfinite(steady_state):
+        return {
+            "steady_state": steady_state,
+            "t_max": t_max,
+            "y_max": y_max,
+            "overshoot_pct": np.nan,
+            "overshoot_abs": np.nan,
+            "rise_time": np.nan,
+            "settling_time": np.nan,
+        }
+
     # Überschwingen
     overshoot_abs = y_max - steady_state
     overshoot_pct = (overshoot_abs / steady_state) * 100 if steady_state != 0 else 0
@@ -403,10 +1103,15 @@ def get_step_metrics(t, y):
     except IndexError:
         rise_time = 0
 
-    # Ausregelzeit (2%-Kriterium)
-    tolerance = 0.02 * abs(steady_state)
-    settled_idx = np.where(np.abs(y - steady_state) <= tolerance)[0]
-    settling_time = t[settled_idx[0]] if len(settled_idx) > 0 else t[-1]
+    # Ausregelzeit (2%-Kriterium): letzter Austritt aus dem Toleranzband
+    # wie in step_metrics_batch, nan wenn noch nicht ausgeregelt
+    band = _band_exit(
+        np.asarray(t, dtype=float),
+        np.asarray(y, dtype=float)[None, :],
+        np.array([steady_state], dtype=float),
+        0.02,
+    )
+    settling_time = float(band[2][0])
 
     return {
         "steady_state": steady_state,
@@ -0,0 +1,216 @@
+"""
+Ordnungsreduktion durch balanciertes Abschneiden und Residualisierung.
+
+Hochaufgelöste Totzeit-Approximationen und lange Reihenschaltungen erzeugen
+Modelle mit vielen Zuständen. Der stabile Anteil wird balanciert und auf
+die Zustände mit den größten Hankel-Singulärwerten σ reduziert; für den
+H∞-Fehler gilt die Schranke
+
+    ||G - Gr||∞ <= 2 · (σ_{r+1} + ... + σ_n)
+
+Pole auf oder rechts der imaginären Achse (z.B. Integratoren) werden
+abgespalten und unverändert übernommen.
+"""
+
+import numpy as np
+from control import StateSpace, TransferFunction, forced_response, ss, tf
+from scipy.linalg import (
+    block_diag,
+    eigh,
+    matrix_balance,
+    schur,
+    solve,
+    solve_continuous_lyapunov,
+    solve_sylvester,
+    svd,
+)
+
+
+def _state_space(system):
+    """Zustandsraummodell aus Transfer-Funktion, Regelkreis oder Objekt."""
+    G = system.tf() if hasattr(system, "tf") else system
+    return G if isinstance(G, StateSpace) else ss(G)
+
+
+def _split(A, B, C, tol=1e-9):
+    """
+    Trennt stabilen und instabilen/grenzstabilen Anteil (Schur + Sylvester).
+
+    Returns:
+        (A1, B1, C1), (A2, B2, C2): stabiler und restlicher Teil, deren
+        Parallelschaltung das Originalsystem ergibt
+    """
+    if len(A) == 0:
+        return (A, B, C), (A, B, C)
+    # Diagonale Skalierung gegen die großen Einträge von Begleitmatrizen,
+    # Toleranz relativ zum betragsgrößten Eigenwert
+    A, (d, _) = matrix_balance(A, permute=False, separate=True)
+    B, C = B / d[:, None], C * d
+    scale = max(1.0, np.max(np.abs(np.linalg.eigvals(A))))
+    T, Z, k = schur(A, output="real", sort=lambda re, im: re < -tol * scale)
+    B, C = Z.T @ B, C @ Z
+    A11, A12, A22 = T[:k, :k], T[:k, k:], T[k:, k:]
+    if 0 < k < len(A):
+        X = solve_sylvester(A11, -A22, -A12)
+    else:
+        X = np.zeros((k, len(A) - k))
+    stable = (A11, B[:k] - X @ B[k:], C[:, :k])
+    rest = (A22, B[k:], C[:, :k] @ X + C[:, k:])
+    return stable, rest
+
+
+def _sqrt_factor(M):
+    """Faktor L mit M = L Lᵀ für symmetrisch positiv semidefinite M."""
+    w, V = eigh((M + M.T) / 2)
+    return V * np.sqrt(np.maximum(w, 0.0))
+
+
+def _balance(A, B, C):
+    """
+    Balancierte Realisierung (Square-Root-Verfahren).
+
+    Returns:
+        Ab, Bb, Cb, hsv: balanciertes System und Hankel-Singulärwerte
+    """
+    P = solve_continuous_lyapunov(A, -B @ B.T)
+    Q = solve_continuous_lyapunov(A.T, -C.T @ C)
+    Lc, Lo = _sqrt_factor(P), _sqrt_factor(Q)
+    U, hsv, Vt = svd(Lo.T @ Lc)
+
+    n = int(np.sum(hsv > hsv[0] * 1e-14)) if len(hsv) and hsv[0] > 0 else 0
+    U, hsv, V = U[:, :n], hsv[:n], Vt[:n].T
+    S = 1.0 / np.sqrt(hsv)
+    T = Lc @ V * S
+    Ti = (S[:, None] * U.T) @ Lo.T
+    return Ti @ A @ T, Ti @ B, C @ T, hsv
+
+
+def hankel_singular_values(system):
+    """
+    Hankel-Singulärwerte des stabilen Anteils.
+
+    Args:
+        system: Transfer-Funktion, Zustandsraummodell oder Objekt mit .tf()
+
+    Returns:
+        Absteigend sortierte Hankel-Singulärwerte
+    """
+    sys = _state_space(system)
+    A, B, C = (np.asarray(M, dtype=float) for M in (sys.A, sys.B, sys.C))
+    (A, B, C), _ = _split(A, B, C)
+    if len(A) == 0:
+        return np.zeros(0)
+    return _balance(A, B, C)[3]
+
+
+def _reduce(Ab, Bb, Cb, D, r, method):
+    """Abschneiden bzw. Residualisieren eines balancierten Systems."""
+    A11, A12 = Ab[:r, :r], Ab[:r, r:]
+    A21, A22 = Ab[r:, :r], Ab[r:, r:]
+    B1, B2, C1, C2 = Bb[:r], Bb[r:], Cb[:, :r], Cb[:, r:]
+    if method == "truncate" or r == len(Ab):
+        return A11, B1, C1, D
+    # Singuläre Störung: ẋ2 = 0, stationäre Verstärkung bleibt erhalten
+    X = solve(A22, np.hstack([A21, B2]))
+    Xa, Xb = X[:, :r], X[:, r:]
+    return A11 - A12 @ Xa, B1 - A12 @ Xb, C1 - C2 @ Xa, D - C2 @ Xb
+
+
+def _assemble(stable, rest, like):
+    A1, B1, C1, D1 = stable
+    A2, B2, C2 = rest
+    A = block_diag(A1, A2)
+    B = np.vstack([B1, B2])
+    C = np.hstack([C1, C2])
+    reduced = ss(A, B, C, D1)
+    return tf(reduced) if isinstance(like, TransferFunction) else reduced
+
+
+def _step_error(full, reduced, t):
+    _, y = forced_response(full, t, np.ones_like(t))
+    _, yr = forced_response(reduced, t, np.ones_like(t))
+    return float(np.max(np.abs(np.squeeze(y) - np.squeeze(yr))))
+
+
+def balanced_reduction(
+    system,
+    order=None,
+    method="truncate",
+    hinf_tol=None,
+    step_tol=None,
+    t_end=None,
+    n_points=1000,
+):
+    """
+    Reduziert die Ordnung eines Systems durch balancierte Realisierung.
+
+    Genau eine der Vorgaben order, hinf_tol oder step_tol bestimmt die
+    Ordnung des stabilen Anteils:
+        - order: feste Anzahl Zustände des stabilen Anteils
+        - hinf_tol: kleinste Ordnung mit 2·Σσ_abgeschnitten <= hinf_tol
+        - step_tol: kleinste Ordnung, deren Sprungantwort höchstens
+          step_tol (absolut) von der des Originals abweicht
+
+    Args:
+        system: Transfer-Funktion (z.B. aus closed_loop/series_connection),
+            Zustandsraummodell oder Objekt mit .tf()
+        order: Zielordnung des stabilen Anteils (default: None)
+        method: "truncate" (Abschneiden, exakt bei hohen Frequenzen) oder
+            "residualize" (Residualisierung, exakte stationäre Verstärkung)
+        hinf_tol: Zulässiger H∞-Fehler (default: None)
+        step_tol: Zulässiger Fehler der Sprungantwort (default: None)
+        t_end: Simulationsende für step_tol (default: None, 10-fache
+            größte Zeitkonstante)
+        n_points: Anzahl der Zeitpunkte für step_tol (default: 1000)
+
+    Returns:
+        reduced, info: Reduziertes System (Typ wie die Eingabe, Objekte
+        liefern eine Transfer-Funktion) und dict mit order, n_unstable,
+        hsv, hinf_bound sowie step_error (bei step_tol)
+
+    Beispiel:
+        >>> from control import feedback
+        >>> from regelung import PT1, P, Totzeit, series_connection
+        >>> strecke = series_connection(PT1(Kp=1.0, T=2.0), Totzeit(Tt=1.0, order=10))
+        >>> system = feedback(P(Kp=0.8).tf() * strecke, 1)
+        >>> reduced, info = balanced_reduction(system, hinf_tol=1e-3)
+        >>> print(info["order"], info["hinf_bound"])
+    """
+    if method not in ("truncate", "residualize"):
+        raise ValueError(f"Unbekannte Methode: {method}")
+    if sum(x is not None for x in (order, hinf_tol, step_tol)) != 1:
+        raise ValueError("Genau eine Vorgabe order, hinf_tol oder step_tol angeben")
+
+    G = system.tf() if hasattr(system, "tf") else system
+    full = _state_space(G)
+    A, B, C, D = (np.asarray(M, dtype=float) for M in (full.A, full.B, full.C, full.D))
+    (A1, B1, C1), rest = _split(A, B, C)
+
+    if len(A1):
+        Ab, Bb, Cb, hsv = _balance(A1, B1, C1)
+    else:
+        Ab, Bb, Cb, hsv = A1, B1, C1, np.zeros(0)
+    # Schranke für Ordnung r: 2 · Summe der abgeschnittenen Singulärwerte
+    tails = 2.0 * np.concatenate([np.cumsum(hsv[::-1])[::-1], [0.0]])
+
+    info = {"n_unstable": len(rest[0]), "hsv": hsv}
+    if order is not None:
+        r = min(int(order), len(hsv))
+    elif hinf_tol is not None:
+        r = int(np.argmax(tails <= hinf_tol))
+    else:
+        if t_end is None:
+            poles = np.linalg.eigvals(A1) if len(A1) else np.array([-1.0])
+            t_end = 10.0 / np.min(np.abs(poles.real))
+        t = np.linspace(0.0, t_end, n_points)
+        for r in range(len(hsv) + 1):
+            candidate = _assemble(_reduce(Ab, Bb, Cb, D, r, method), rest, full)
+            error = _step_error(full, candidate, t)
+            if error <= step_tol:
+                break
+        info["step_error"] = error
+
+    reduced = _assemble(_reduce(Ab, Bb, Cb, D, r, method), rest, G)
+    info["order"] = r + info["n_unstable"]
+    info["hinf_bound"] = float(tails[r])
+    return reduced, info
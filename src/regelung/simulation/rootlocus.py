@@ -0,0 +1,116 @@
+"""
+Wurzelortskurven mit adaptiver Verstärkungsschrittweite.
+
+Für den offenen Kreis L(s) = N(s)/D(s) und die Verstärkung K sind die Pole
+des geschlossenen Kreises die Wurzeln von D(s) + K·N(s). Die Wurzeln aller
+Verstärkungen einer Verfeinerungsstufe werden gemeinsam über Begleitmatrizen
+bestimmt (batch_roots). Zwischen zwei Verstärkungen werden die Äste durch
+eine Zuordnung mit minimaler Gesamtverschiebung verbunden; wo sich die
+Wurzeln zu weit bewegen, werden Zwischenwerte eingefügt.
+"""
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from regelung.analysis import batch_roots
+from regelung.simulation.core import _tf_coefficients
+
+
+def _characteristic(num, den, gains):
+    """Koeffizienten von D + K·N für alle Verstärkungen, (M, n + 1)."""
+    n = max(len(num), len(den))
+    num = np.concatenate([np.zeros(n - len(num)), num])
+    den = np.concatenate([np.zeros(n - len(den)), den])
+    return den[None, :] + gains[:, None] * num[None, :]
+
+
+def _match(roots):
+    """
+    Ordnet die Wurzeln aufeinanderfolgender Verstärkungen den Ästen zu.
+
+    Args:
+        roots: Ungeordnete Wurzeln (M, n)
+
+    Returns:
+        Wurzeln (M, n), Spalte j ist Ast j
+    """
+    tracked = roots.copy()
+    for i in range(1, len(roots)):
+        cost = np.abs(tracked[i - 1][:, None] - roots[i][None, :])
+        cost = np.where(np.isfinite(cost), cost, 1e300)
+        _, columns = linear_sum_assignment(cost)
+        tracked[i] = roots[i][columns]
+    return tracked
+
+
+def root_locus(
+    open_loop,
+    k_max=None,
+    k_min=0.0,
+    resolution=0.01,
+    n_initial=50,
+    max_points=20_000,
+):
+    """
+    Berechnet die Wurzelortskurve für eine Verstärkung K im Regelkreis.
+
+    Die Pole des geschlossenen Kreises 1 + K·L(s) = 0 werden zunächst auf
+    einem logarithmischen Raster berechnet. Danach wird die Schrittweite
+    überall dort halbiert, wo sich ein Ast zwischen zwei Verstärkungen um
+    mehr als resolution · (Ausdehnung der Kurve) bewegt.
+
+    Args:
+        open_loop: Offener Kreis L(s) ohne die Verstärkung K, z.B.
+            series_connection(PT2(...), Totzeit(...))
+        k_max: Größte Verstärkung (default: None, 100 / |L(0)| bzw. 100)
+        k_min: Kleinste Verstärkung (default: 0.0, Pole des offenen Kreises)
+        resolution: Zulässige Bewegung je Schritt relativ zur Ausdehnung
+            der Kurve (default: 0.01)
+        n_initial: Anzahl der Startpunkte (default: 50)
+        max_points: Obergrenze für die Anzahl der Verstärkungen
+            (default: 20_000)
+
+    Returns:
+        gains, roots: Verstärkungen (M,) aufsteigend und Pole (M, n), Spalte
+        j ist ein durchgehend verfolgter Ast
+
+    Beispiel:
+        >>> from regelung import PT2, Totzeit, series_connection
+        >>> from regelung.simulation import root_locus
+        >>> strecke = PT2(Kp=1.0, T1=2.0, T2=0.5)
+        >>> L = series_connection(strecke, Totzeit(Tt=1.0, order=6))
+        >>> gains, roots = root_locus(L, k_max=20.0)
+    """
+    num, den = _tf_coefficients(open_loop)
+    num, den = np.trim_zeros(num, "f"), np.trim_zeros(den, "f")
+    if len(num) > len(den):
+        raise ValueError("Offener Kreis ist nicht proper (Zählergrad > Nennergrad)")
+    if k_max is None:
+        gain = abs(num[-1] / den[-1]) if den[-1] != 0 else 0.0
+        k_max = 100.0 / gain if gain > 0 else 100.0
+    if not 0 <= k_min < k_max:
+        raise ValueError("Es muss 0 <= k_min < k_max gelten")
+
+    start = max(k_min, k_max * 1e-6)
+    gains = np.geomspace(start, k_max, n_initial)
+    if k_min < start:
+        gains = np.concatenate([[k_min], gains])
+    roots = _match(batch_roots(_characteristic(num, den, gains)))
+
+    while len(gains) < max_points:
+        finite = roots[np.isfinite(roots)]
+        if finite.size == 0:
+            break
+        extent = max(np.ptp(finite.real), np.ptp(finite.imag), 1e-12)
+        step = np.abs(np.diff(roots, axis=0))
+        step = np.where(np.isfinite(step), step, 0.0).max(axis=1)
+        # Schranke für die Schrittweite, damit K nicht beliebig fein wird
+        coarse = (step > resolution * extent) & (np.diff(gains) > 1e-9 * k_max)
+        if not np.any(coarse):
+            break
+        index = np.flatnonzero(coarse)[: max_points - len(gains)]
+        middle = 0.5 * (gains[index] + gains[index + 1])
+        gains = np.insert(gains, index + 1, middle)
+        new = batch_roots(_characteristic(num, den, middle))
+        roots = _match(np.insert(roots, index + 1, new, axis=0))
+    return gains, roots
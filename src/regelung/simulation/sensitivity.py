@@ -0,0 +1,244 @@
+"""
+Sensitivitäten der Sprungantwort-Kennwerte bezüglich Regler- und
+Streckenparametern.
+
+Die Ableitungen der Koeffizienten des geschlossenen Regelkreises werden
+zentral differenziert. Für Verstärkungen und Zeitkonstanten, in denen die
+Koeffizienten höchstens quadratisch sind, ist das bis auf Rundungsfehler
+exakt; bei der Padé-Näherung der Totzeit (Koeffizienten rational in Tt)
+bleibt ein Fehler der Ordnung rel_step², der bei der Standardschrittweite
+vernachlässigbar ist. Daraus ergeben sich die Sensitivitätssysteme
+dy/dp = (N'·D - N·D') / D² · u, die zusammen mit dem nominalen System in
+einer einzigen gestapelten Simulation laufen. Die Ableitungen der Kennwerte
+folgen aus der Kettenregel an den interpolierten Durchgangszeiten.
+
+Alternativ (method="fd") werden alle gestörten Parametersätze gemeinsam
+simuliert und die Kennwerte zentral differenziert.
+"""
+
+import inspect
+
+import numpy as np
+
+from regelung.simulation.batch import _simulate_batch, _stack_coefficients
+from regelung.simulation.core import _loop_polynomials
+from regelung.simulation.metrics import METRICS, _step_metrics_batch
+
+
+def _arguments(obj):
+    """Konstruktorargumente eines Regler- oder Strecken-Objekts."""
+    signature = inspect.signature(type(obj).__init__)
+    return {
+        name: (getattr(obj, name, None), param.annotation)
+        for name, param in list(signature.parameters.items())[1:]
+    }
+
+
+def _parameters(regler, strecke, params):
+    """
+    Wählt die zu variierenden Parameter aus.
+
+    Returns:
+        Liste von (Besitzer, Name, Wert) mit Besitzer "regler" oder "strecke"
+    """
+    available = []
+    for owner, obj in (("regler", regler), ("strecke", strecke)):
+        for name, (value, annotation) in _arguments(obj).items():
+            if annotation is int:
+                continue
+            if value is None:
+                raise ValueError(f"{type(obj).__name__}: Parameter {name} unbekannt")
+            available.append((owner, name, float(value)))
+
+    if params is None:
+        return available
+
+    selected = []
+    for name in params:
+        matches = [p for p in available if name in (p[1], f"{p[0]}.{p[1]}")]
+        if len(matches) != 1:
+            raise ValueError(f"Parameter {name!r} unbekannt oder nicht eindeutig")
+        selected.append(matches[0])
+    return selected
+
+
+def _coefficients(regler, strecke, owner=None, name=None, value=None):
+    """Zähler und Nenner des geschlossenen Kreises, optional mit einem
+    geänderten Parameter."""
+    if owner is not None:
+        obj = regler if owner == "regler" else strecke
+        kwargs = {k: v for k, (v, _) in _arguments(obj).items()}
+        kwargs[name] = value
+        changed = type(obj)(**kwargs)
+        if owner == "regler":
+            regler = changed
+        else:
+            strecke = changed
+    zr, _, zs, _, char = _loop_polynomials(regler, strecke)
+    return np.polymul(zr, zs), char
+
+
+def _interp(S, i, frac):
+    """Wertet Zeilen von S zwischen i und i + 1 linear aus."""
+    return S[:, i] + frac * (S[:, i + 1] - S[:, i])
+
+
+def _chain_rule(t, y, S, tolerance):
+    """
+    Ableitungen der Kennwerte aus Trajektoriensensitivitäten.
+
+    Args:
+        t: Zeitvektor (N,)
+        y: Nominale Sprungantwort (N,)
+        S: Sensitivitäten dy/dp (P, N)
+        tolerance: Relative Breite des Toleranzbands
+
+    Returns:
+        metrics, derivatives: Nominale Kennwerte und dict Kennwert -> (P,)
+    """
+    metrics, info = _step_metrics_batch(t, y[None, :], tolerance)
+    metrics = {key: float(value[0]) for key, value in metrics.items()}
+    y_inf = metrics["steady_state"]
+    d_inf = S[:, -1]
+
+    def crossing(i, frac, level_derivative):
+        i, frac = int(i[0]), float(frac[0])
+        slope = (y[i + 1] - y[i]) / (t[i + 1] - t[i])
+        if not np.isfinite(frac) or slope == 0:
+            return np.zeros(len(S))
+        return (level_derivative - _interp(S, i, frac)) / slope
+
+    # Maximum: dy_max = s(t_max), dt_max = -ṡ(t_max) / ÿ(t_max)
+    k = int(info["peak"][0])
+    t_max = metrics["t_max"]
+    if 0 < k < len(t) - 1 and t_max != t[k]:
+        h = 0.5 * (t[k + 1] - t[k - 1])
+        curvature = (y[k - 1] - 2.0 * y[k] + y[k + 1]) / h**2
+        d_ymax = np.array([np.interp(t_max, t, s) for s in S])
+        d_tmax = -(S[:, k + 1] - S[:, k - 1]) / (2.0 * h) / curvature
+    else:
+        d_ymax = S[:, k]
+        d_tmax = np.zeros(len(S))
+
+    i, frac, _ = info["c10"]
+    d_t10 = crossing(i, frac, 0.1 * d_inf)
+    i, frac, _ = info["c90"]
+    d_t90 = crossing(i, frac, 0.9 * d_inf)
+    i, frac, _, sign = info["band"]
+    level = d_inf * (1.0 + sign[0] * tolerance * np.sign(y_inf))
+    d_settle = crossing(i, frac, level)
+
+    y_max = metrics["y_max"]
+    if y_inf != 0:
+        d_pct = 100.0 * (d_ymax * y_inf - y_max * d_inf) / y_inf**2
+    else:
+        d_pct = np.zeros(len(S))
+
+    derivatives = {
+        "steady_state": d_inf,
+        "t_max": d_tmax,
+        "y_max": d_ymax,
+        "overshoot_pct": d_pct,
+        "overshoot_abs": d_ymax - d_inf,
+        "rise_time": d_t90 - d_t10,
+        "settling_time": d_settle,
+    }
+    return metrics, derivatives
+
+
+def step_sensitivities(
+    regler,
+    strecke,
+    params=None,
+    t_end=10.0,
+    n_points=1000,
+    method="sensitivity",
+    rel_step=None,
+    tolerance=0.02,
+):
+    """
+    Jacobi-Matrix der Sprungantwort-Kennwerte des geschlossenen Kreises.
+
+    Alle benötigten Systeme werden in einer gestapelten Simulation
+    berechnet, statt simulate_step je gestörtem Parameter aufzurufen.
+    Abgeleitet werden die Kennwerte von step_metrics_batch: gleiche
+    Definitionen wie get_step_metrics, aber zwischen den Abtastpunkten
+    interpoliert. Die auf das Zeitraster gerundeten Werte von
+    get_step_metrics sind stückweise konstant und nicht differenzierbar.
+
+    Args:
+        regler: Regler-Objekt (z.B. PID)
+        strecke: Strecken-Objekt (z.B. PT2, IT1)
+        params: Namen der Parameter, z.B. ["Ti", "strecke.Kp"]; ohne Präfix
+            nur wenn eindeutig (default: None, alle Parameter)
+        t_end: Simulationsende in Sekunden (default: 10.0)
+        n_points: Anzahl der Zeitpunkte (default: 1000)
+        method: "sensitivity" (Sensitivitätssysteme, default) oder "fd"
+            (zentrale Differenzen der Kennwerte)
+        rel_step: Relative Schrittweite (default: 1e-6 bzw. 1e-4 für "fd")
+        tolerance: Relative Breite des Toleranzbands (default: 0.02)
+
+    Returns:
+        dict mit:
+            - params: Parameternamen "regler.Kp", "strecke.T1", ...
+            - metrics: Kennwertnamen wie in step_metrics_batch
+            - jacobian: Array (len(metrics), len(params))
+            - nominal: dict der nominalen Kennwerte
+
+    Beispiel:
+        >>> from regelung import PID, PT2
+        >>> from regelung.simulation.sensitivity import step_sensitivities
+        >>> sens = step_sensitivities(PID(Kp=2.0, Ti=3.0, Td=0.5),
+        ...                           PT2(Kp=1.0, T1=2.0, T2=0.5), t_end=30.0)
+        >>> i = sens["metrics"].index("overshoot_pct")
+        >>> j = sens["params"].index("regler.Kp")
+        >>> print(f"dÜberschwingen/dKp = {sens['jacobian'][i, j]:.2f} %")
+    """
+    if method not in ("sensitivity", "fd"):
+        raise ValueError(f"Unbekannte Methode: {method}")
+    if rel_step is None:
+        rel_step = 1e-6 if method == "sensitivity" else 1e-4
+
+    selected = _parameters(regler, strecke, params)
+    names = [f"{owner}.{name}" for owner, name, _ in selected]
+    N, D = _coefficients(regler, strecke)
+    t = np.linspace(0.0, t_end, n_points)
+
+    steps, plus, minus = [], [], []
+    for owner, name, value in selected:
+        h = rel_step * (abs(value) if value != 0 else 1.0)
+        steps.append(h)
+        plus.append(_coefficients(regler, strecke, owner, name, value + h))
+        minus.append(_coefficients(regler, strecke, owner, name, value - h))
+    steps = np.array(steps)
+
+    if method == "fd":
+        num, den = _stack_coefficients([(N, D)] + plus + minus)
+        Y = _simulate_batch(num, den, t, np.ones((len(num), n_points)))
+        values = _step_metrics_batch(t, Y, tolerance)[0]
+        P = len(selected)
+        nominal = {key: float(values[key][0]) for key in METRICS}
+        jacobian = np.array(
+            [
+                (values[key][1 : P + 1] - values[key][P + 1 :]) / (2.0 * steps)
+                for key in METRICS
+            ]
+        )
+    else:
+        systems = [(N, D)]
+        for (Np, Dp), (Nm, Dm), h in zip(plus, minus, steps):
+            dN = np.polysub(Np, Nm) / (2.0 * h)
+            dD = np.polysub(Dp, Dm) / (2.0 * h)
+            sens_num = np.polysub(np.polymul(dN, D), np.polymul(N, dD))
+            systems.append((sens_num, np.polymul(D, D)))
+        num, den = _stack_coefficients(systems)
+        Y = _simulate_batch(num, den, t, np.ones((len(num), n_points)))
+        nominal, derivatives = _chain_rule(t, Y[0], Y[1:], tolerance)
+        jacobian = np.array([derivatives[key] for key in METRICS])
+
+    return {
+        "params": names,
+        "metrics": list(METRICS),
+        "jacobian": jacobian,
+        "nominal": nominal,
+    }
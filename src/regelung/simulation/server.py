@@ -0,0 +1,603 @@
+"""
+Lokaler Simulationsdienst über HTTP oder Unix-Socket.
+
+Der Dienst hält Modelle und Ergebnisse im Speicher und fasst Anfragen, die
+innerhalb eines kurzen Zeitfensters eintreffen, zu einer gestapelten
+Simulation zusammen (Micro-Batching). Aufträge beschreiben Strecke und
+optional Regler über ihre Parameter:
+
+    {"strecke": {"type": "PT2", "Kp": 1.0, "T1": 2.0, "T2": 0.5},
+     "regler": {"type": "PI", "Kp": 2.0, "Ti": 1.5},
+     "t_end": 20.0, "n_points": 1000}
+
+Endpunkte:
+    POST /step     Sprungantwort          -> {"t": [...], "y": [...]}
+    POST /signal   Antwort auf "t", "u"   -> {"t": [...], "y": [...]}
+    POST /metrics  Kennwerte der Sprungantwort (get_step_metrics)
+    GET  /stats    Latenz-Perzentile und Batch-Statistik
+
+Mit Regler wird der geschlossene Regelkreis simuliert, eine Liste von
+Streckenbeschreibungen wird in Reihe geschaltet.
+
+Beispiel:
+    >>> from regelung.simulation.server import SimulationClient, SimulationServer
+    >>> with SimulationServer(("127.0.0.1", 0)) as server:
+    ...     client = SimulationClient(server.address)
+    ...     t, y = client.step({"type": "PT1", "Kp": 1.0, "T": 2.0}, t_end=10.0)
+    ...     print(client.stats()["p50_ms"])
+
+Als eigenständiger Dienst:
+    python -m regelung.simulation.server --port 8765
+    python -m regelung.simulation.server --unix /tmp/regelung.sock
+"""
+
+import argparse
+import http.client
+import inspect
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+
+import numpy as np
+from control import feedback, series, tf
+
+from regelung import regler as _regler
+from regelung import strecken as _strecken
+from regelung.simulation.batch import (
+    _simulate_batch,
+    _stack_coefficients,
+    _uniform_dt,
+)
+from regelung.simulation.core import _tf_coefficients
+from regelung.simulation.plot import get_step_metrics
+
+_CLASSES = {
+    name: getattr(module, name)
+    for module in (_regler, _strecken)
+    for name in module.__all__
+}
+
+
+def to_spec(obj):
+    """
+    Beschreibt ein Regler- oder Strecken-Objekt als JSON-fähiges dict.
+
+    Args:
+        obj: Objekt aus regelung.regler/regelung.strecken, eine Liste davon
+            (Reihenschaltung) oder bereits eine Beschreibung (dict)
+
+    Returns:
+        dict {"type": Klassenname, **Parameter} bzw. Liste davon
+    """
+    if obj is None or isinstance(obj, dict):
+        return obj
+    if isinstance(obj, (list, tuple)):
+        return [to_spec(item) for item in obj]
+
+    name = type(obj).__name__
+    if _CLASSES.get(name) is not type(obj):
+        raise ValueError(f"Unbekannter Typ: {name}")
+    params = inspect.signature(type(obj).__init__).parameters
+    spec = {"type": name}
+    for key in list(params)[1:]:
+        value = getattr(obj, key, None)
+        if value is None:
+            raise ValueError(f"{name} ohne Parameter {key} nicht beschreibbar")
+        spec[key] = value
+    return spec
+
+
+def _build(spec):
+    """Erzeugt Objekt bzw. Reihenschaltung aus einer Beschreibung."""
+    if isinstance(spec, list):
+        systems = [_build(item).tf() for item in spec]
+        if not systems:
+            raise ValueError("Leere Reihenschaltung")
+        G = systems[0]
+        for other in systems[1:]:
+            G = series(G, other)
+        return _Wrapped(G)
+
+    spec = dict(spec)
+    cls = _CLASSES.get(spec.pop("type", None))
+    if cls is None:
+        raise ValueError(f"Unbekannter Typ in {spec!r}")
+    if cls.__name__ == "PT2" and "D" in spec:
+        return cls.from_damping(**spec)
+    return cls(**spec)
+
+
+class _Wrapped:
+    def __init__(self, G):
+        self.G = G
+
+    def tf(self):
+        return self.G
+
+
+@lru_cache(maxsize=4096)
+def _model(key):
+    """
+    Koeffizienten des zu simulierenden Systems (gecacht).
+
+    Args:
+        key: JSON-Text {"strecke": ..., "regler": ...} mit sortierten Schlüsseln
+
+    Returns:
+        num, den als Tupel von Floats
+    """
+    job = json.loads(key)
+    strecke = _build(job["strecke"])
+    if job.get("regler") is None:
+        G = strecke.tf()
+    else:
+        G = feedback(series(_build(job["regler"]).tf(), strecke.tf()), 1)
+    num, den = _tf_coefficients(G)
+    return tuple(map(float, num)), tuple(map(float, den))
+
+
+def _model_key(payload):
+    model = {"strecke": payload["strecke"], "regler": payload.get("regler")}
+    return json.dumps(model, sort_keys=True)
+
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class _Job:
+    __slots__ = ("kind", "payload", "group", "event", "result", "error")
+
+    def __init__(self, kind, payload):
+        self.kind = kind
+        self.payload = payload
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SimulationServer:
+    """
+    Lokaler Simulationsdienst mit Micro-Batching.
+
+    Args:
+        address: (host, port) für HTTP oder Pfad eines Unix-Sockets
+            (default: ("127.0.0.1", 8765), Port 0 wählt einen freien Port)
+        window: Sammelfenster in Sekunden, Anfragen innerhalb des Fensters
+            werden gemeinsam simuliert (default: 0.005)
+        max_batch: Maximale Anzahl Aufträge je Batch (default: 256)
+        cache_size: Anzahl gecachter Ergebnisse (default: 1024)
+        latency_window: Anzahl Anfragen für die Latenz-Statistik
+            (default: 10000)
+    """
+
+    def __init__(
+        self,
+        address=("127.0.0.1", 8765),
+        window=0.005,
+        max_batch=256,
+        cache_size=1024,
+        latency_window=10000,
+    ):
+        self.window = window
+        self.max_batch = max_batch
+        self.cache_size = cache_size
+        self._queue = queue.Queue()
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=latency_window)
+        self._batch_sizes = deque(maxlen=latency_window)
+        self._cache_hits = 0
+        self._threads = []
+        self._running = False
+
+        handler = _make_handler(self)
+        if isinstance(address, (str, os.PathLike)):
+            if os.path.exists(address):
+                os.unlink(address)
+            self._httpd = _UnixHTTPServer(os.fspath(address), handler)
+        else:
+            self._httpd = ThreadingHTTPServer(tuple(address), handler)
+            self._httpd.daemon_threads = True
+
+    @property
+    def address(self):
+        """Tatsächliche Adresse: (host, port) oder Socket-Pfad."""
+        return self._httpd.server_address
+
+    def start(self):
+        """Startet Batch-Verarbeitung und Server in Hintergrund-Threads."""
+        if self._running:
+            return self
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._batch_loop, daemon=True),
+            threading.Thread(target=self._httpd.serve_forever, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        """
+        Beendet den Server und gibt die Adresse frei.
+
+        Aufträge, die noch in der Warteschlange stehen, schlagen mit
+        RuntimeError fehl.
+        """
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        for thread in self._threads:
+            thread.join()
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            job.error = RuntimeError("Server wurde beendet")
+            job.event.set()
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
+
+    def serve_forever(self):
+        """Blockiert bis zum Abbruch (Strg+C)."""
+        self.start()
+        try:
+            while self._running:
+                time.sleep(0.5)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def submit(self, kind, payload, timeout=None):
+        """
+        Führt einen Auftrag aus (blockierend, auch ohne HTTP nutzbar).
+
+        Args:
+            kind: "step", "signal" oder "metrics"
+            payload: Auftragsbeschreibung (dict)
+            timeout: Maximale Wartezeit in Sekunden (default: None, ohne
+                Begrenzung)
+
+        Returns:
+            Ergebnis als JSON-fähiges dict
+
+        Raises:
+            RuntimeError: Server nicht gestartet oder beendet, bevor der
+                Auftrag ausgeführt wurde
+            TimeoutError: Kein Ergebnis innerhalb von timeout
+        """
+        if kind not in ("step", "signal", "metrics"):
+            raise ValueError(f"Unbekannter Auftrag: {kind}")
+        if not self._running:
+            raise RuntimeError("Server nicht gestartet (start() aufrufen)")
+        cache_key = None
+        if kind != "signal":
+            cache_key = (kind, json.dumps(payload, sort_keys=True))
+            with self._lock:
+                if cache_key in self._cache:
+                    self._cache.move_to_end(cache_key)
+                    self._cache_hits += 1
+                    return self._cache[cache_key]
+
+        job = _Job(kind, payload)
+        job.group = self._group(kind, payload)
+        with self._lock:
+            if not self._running:
+                raise RuntimeError("Server nicht gestartet (start() aufrufen)")
+            self._queue.put(job)
+        if not job.event.wait(timeout):
+            raise TimeoutError(f"Kein Ergebnis nach {timeout} s")
+        if job.error is not None:
+            raise job.error
+
+        if cache_key is not None:
+            with self._lock:
+                self._cache[cache_key] = job.result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return job.result
+
+    def stats(self):
+        """
+        Latenz- und Batch-Statistik.
+
+        Returns:
+            dict mit count, p50_ms, p90_ms, p99_ms, max_ms, batches,
+            mean_batch_size, cache_hits, cache_size
+        """
+        with self._lock:
+            latencies = np.array(self._latencies) * 1e3
+            sizes = np.array(self._batch_sizes)
+            stats = {
+                "count": len(latencies),
+                "batches": len(sizes),
+                "mean_batch_size": float(sizes.mean()) if len(sizes) else 0.0,
+                "cache_hits": self._cache_hits,
+                "cache_size": len(self._cache),
+            }
+        if len(latencies):
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+            stats.update(
+                p50_ms=float(p50),
+                p90_ms=float(p90),
+                p99_ms=float(p99),
+                max_ms=float(latencies.max()),
+            )
+        return stats
+
+    def _record(self, latency):
+        with self._lock:
+            self._latencies.append(latency)
+
+    @staticmethod
+    def _group(kind, payload):
+        """
+        Aufträge mit gleichem Zeitraster werden gemeinsam simuliert.
+
+        Signal-Aufträge werden über den vollständigen Zeitvektor gruppiert,
+        nicht nur über Start, Schrittweite und Länge; nicht äquidistante
+        Zeitvektoren werden abgelehnt.
+        """
+        if kind == "signal":
+            t = np.asarray(payload["t"], dtype=float)
+            _uniform_dt(t)
+            return ("signal", t.tobytes())
+        t_end = float(payload.get("t_end", 10.0))
+        n_points = int(payload.get("n_points", 1000))
+        return ("step", t_end, n_points)
+
+    def _batch_loop(self):
+        while self._running:
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            jobs = [first]
+            deadline = time.perf_counter() + self.window
+            while len(jobs) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    jobs.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            groups = defaultdict(list)
+            for job in jobs:
+                groups[job.group].append(job)
+            for group, members in groups.items():
+                self._run_group(group, members)
+
+    def _run_group(self, group, jobs):
+        valid, models = [], []
+        for job in jobs:
+            try:
+                model = _model(_model_key(job.payload))
+                n = len(job.payload["t"]) if job.kind == "signal" else 0
+                if job.kind == "signal" and len(job.payload["u"]) != n:
+                    raise ValueError("u muss die gleiche Länge wie t haben")
+            except Exception as exc:  # noqa: BLE001 - Fehler an den Aufrufer
+                job.error = exc
+                job.event.set()
+                continue
+            valid.append(job)
+            models.append(model)
+        if not valid:
+            return
+
+        try:
+            num, den = _stack_coefficients(models)
+            if group[0] == "signal":
+                t = np.asarray(valid[0].payload["t"], dtype=float)
+                U = np.array([j.payload["u"] for j in valid], dtype=float)
+            else:
+                t = np.linspace(0.0, group[1], group[2])
+                U = np.ones((len(valid), len(t)))
+            Y = _simulate_batch(num, den, t, U)
+        except Exception as exc:  # noqa: BLE001
+            for job in valid:
+                job.error = exc
+                job.event.set()
+            return
+
+        with self._lock:
+            self._batch_sizes.append(len(valid))
+        for job, y in zip(valid, Y):
+            try:
+                if job.kind == "metrics":
+                    # Analytischer Endwert wie get_step_metrics(..., system=...)
+                    system = tf(*map(list, _model(_model_key(job.payload))))
+                    metrics = get_step_metrics(t, y, system=system)
+                    job.result = {k: _to_json(v) for k, v in metrics.items()}
+                else:
+                    job.result = {"t": t.tolist(), "y": y.tolist()}
+            except Exception as exc:  # noqa: BLE001
+                job.error = exc
+            finally:
+                job.event.set()
+
+
+class _UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        UnixStreamServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def _make_handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def address_string(self):
+            return self.client_address[0] if self.client_address else "unix"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _reply(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/stats":
+                self._reply(200, server.stats())
+            elif self.path == "/health":
+                self._reply(200, {"status": "ok"})
+            else:
+                self._reply(404, {"error": f"Unbekannter Pfad: {self.path}"})
+
+        def do_POST(self):
+            start = time.perf_counter()
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                result = server.submit(self.path.strip("/"), payload)
+            except (ValueError, KeyError, TypeError) as exc:
+                self._reply(400, {"error": str(exc)})
+                return
+            except Exception as exc:  # noqa: BLE001
+                self._reply(500, {"error": str(exc)})
+                return
+            server._record(time.perf_counter() - start)
+            self._reply(200, result)
+
+    return Handler
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class SimulationClient:
+    """
+    Client für SimulationServer.
+
+    Args:
+        address: (host, port) oder Pfad eines Unix-Sockets
+        timeout: Timeout je Anfrage in Sekunden (default: 30.0)
+
+    Regler und Strecken können als Objekte (PT2(...), PI(...)) oder als
+    Beschreibung {"type": "PT2", ...} übergeben werden.
+    """
+
+    def __init__(self, address=("127.0.0.1", 8765), timeout=30.0):
+        self.address = address
+        self.timeout = timeout
+
+    def _connection(self):
+        if isinstance(self.address, (str, os.PathLike)):
+            return _UnixHTTPConnection(os.fspath(self.address), self.timeout)
+        host, port = self.address[:2]
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _request(self, method, path, body=None):
+        conn = self._connection()
+        try:
+            data = None if body is None else json.dumps(body).encode()
+            headers = {"Content-Type": "application/json"} if data else {}
+            conn.request(method, path, body=data, headers=headers)
+            response = conn.getresponse()
+            result = json.loads(response.read())
+        finally:
+            conn.close()
+        if response.status != 200:
+            raise RuntimeError(f"{response.status}: {result.get('error')}")
+        return result
+
+    @staticmethod
+    def _payload(strecke, regler, **kwargs):
+        return {"strecke": to_spec(strecke), "regler": to_spec(regler), **kwargs}
+
+    def step(self, strecke, regler=None, t_end=10.0, n_points=1000):
+        """
+        Sprungantwort der Strecke bzw. des geschlossenen Regelkreises.
+
+        Returns:
+            t, y: Zeit- und Ausgangsvektoren
+        """
+        payload = self._payload(strecke, regler, t_end=t_end, n_points=n_points)
+        result = self._request("POST", "/step", payload)
+        return np.array(result["t"]), np.array(result["y"])
+
+    def signal(self, strecke, t, u, regler=None):
+        """
+        Antwort auf ein Eingangssignal auf äquidistantem Zeitvektor t.
+
+        Returns:
+            t, y: Zeit- und Ausgangsvektoren
+        """
+        t = np.asarray(t, dtype=float)
+        u = np.broadcast_to(np.asarray(u, dtype=float), t.shape)
+        payload = self._payload(strecke, regler, t=t.tolist(), u=u.tolist())
+        result = self._request("POST", "/signal", payload)
+        return np.array(result["t"]), np.array(result["y"])
+
+    def metrics(self, strecke, regler=None, t_end=10.0, n_points=1000):
+        """
+        Kennwerte der Sprungantwort wie get_step_metrics.
+
+        Returns:
+            dict mit Metriken
+        """
+        payload = self._payload(strecke, regler, t_end=t_end, n_points=n_points)
+        return self._request("POST", "/metrics", payload)
+
+    def stats(self):
+        """Latenz- und Batch-Statistik des Servers."""
+        return self._request("GET", "/stats")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lokaler Simulationsdienst")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Pfad eines Unix-Sockets statt TCP")
+    parser.add_argument("--window", type=float, default=0.005)
+    parser.add_argument("--max-batch", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    address = args.unix or (args.host, args.port)
+    server = SimulationServer(address, window=args.window, max_batch=args.max_batch)
+    print(f"regelung-Simulationsdienst auf {server.address}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Sollwertprofile durch Überlagerung von Sprungantworten.
+
+Ein stückweise konstantes Sollwertprofil ist eine Summe verschobener
+Sprünge. Da der Regelkreis linear ist, ergibt sich die Antwort als Summe
+verschobener und skalierter Kopien einer einzigen Sprungantwort:
+
+    y(t) = Σ Δr_k · h(t - τ_k)
+
+Die Sprungantwort h wird je System und Zeitraster nur einmal berechnet.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from control import forced_response, tf
+from scipy.signal import fftconvolve
+
+from regelung.simulation.core import _tf_coefficients
+
+
+@lru_cache(maxsize=64)
+def _step_samples(num, den, dt, n):
+    """Sprungantwort auf dem Raster k·dt, k = 0..n-1 (schreibgeschützt)."""
+    t = np.arange(n) * dt
+    _, h = forced_response(tf(list(num), list(den)), T=t, U=np.ones(n))
+    h = np.array(h, dtype=float)
+    h.setflags(write=False)
+    return h
+
+
+def _steps(t, profile):
+    """
+    Sprungzeitpunkte und -höhen eines Sollwertprofils.
+
+    Returns:
+        tau, delta: Zeitpunkte (K,) und Sprunghöhen (K,)
+    """
+    if callable(profile):
+        profile = profile(t)
+    profile = np.asarray(profile, dtype=float)
+    if profile.shape == t.shape:
+        # Abgetastetes Profil, zwischen den Abtastpunkten gehalten
+        delta = np.diff(profile, prepend=0.0)
+        return t, delta
+    if profile.ndim != 2 or profile.shape[1] != 2:
+        raise ValueError(
+            "Profil muss die Länge von t haben oder aus (Zeit, Wert)-Paaren bestehen"
+        )
+    order = np.argsort(profile[:, 0], kind="stable")
+    tau, values = profile[order, 0], profile[order, 1]
+    if len(tau) and tau[0] < t[0]:
+        raise ValueError("Sollwertsprünge vor t[0] sind nicht erlaubt")
+    return tau, np.diff(values, prepend=0.0)
+
+
+def _weights(t, tau, delta):
+    """
+    Sprunghöhen auf das Raster verteilt.
+
+    Ein Sprung zwischen zwei Abtastpunkten wird anteilig auf beide verteilt;
+    das entspricht der linearen Interpolation der verschobenen Sprungantwort.
+    """
+    n = len(t)
+    dt = t[1] - t[0]
+    keep = (delta != 0) & (tau <= t[-1])
+    position = (tau[keep] - t[0]) / dt
+    nearest = np.round(position)
+    position = np.where(np.abs(position - nearest) < 1e-9, nearest, position)
+    j = np.floor(position).astype(np.int64)
+    frac = position - j
+
+    w = np.zeros(n)
+    np.add.at(w, j, delta[keep] * (1.0 - frac))
+    upper = j + 1 < n
+    np.add.at(w, j[upper] + 1, delta[keep][upper] * frac[upper])
+    return w
+
+
+def simulate_setpoint_profile(system, t, profile, method="auto"):
+    """
+    Simuliert die Antwort auf ein stückweise konstantes Sollwertprofil.
+
+    Die Sprungantwort des Systems wird einmal berechnet und zwischen
+    Aufrufen mit gleichem System und Raster wiederverwendet. Die Antwort
+    auf das Profil entsteht durch Faltung mit den Sprunghöhen, per FFT in
+    O(N log N) oder als dünn besetzte Summe in O(K·N) für wenige Sprünge.
+
+    Args:
+        system: Transfer-Funktion (z.B. aus closed_loop) oder Objekt mit .tf()
+        t: Äquidistanter Zeitvektor
+        profile: Sollwertprofil, entweder
+            - Folge von (Zeit, Wert)-Paaren: Wert gilt ab Zeit, davor 0
+            - Array gleicher Länge wie t, zwischen den Abtastpunkten
+              gehalten (nicht linear interpoliert wie bei simulate_signal)
+            - Signal aus regelung.signals, das auf t ausgewertet wird
+        method: "fft", "sparse" oder "auto" (default: "auto", "sparse" bei
+            wenigen Sprüngen)
+
+    Returns:
+        t, y: Zeit- und Ausgangsvektoren
+
+    Beispiel:
+        >>> import numpy as np
+        >>> from regelung import PI, PT2, closed_loop
+        >>> from regelung.simulation import simulate_setpoint_profile
+        >>> system = closed_loop(PI(Kp=2.0, Ti=1.5), PT2(Kp=1.0, T1=2.0, T2=0.5))
+        >>> t = np.linspace(0, 3600, 360_001)
+        >>> profil = [(0.0, 20.0), (600.0, 35.0), (1800.0, 25.0)]
+        >>> t, y = simulate_setpoint_profile(system, t, profil)
+    """
+    if method not in ("auto", "fft", "sparse"):
+        raise ValueError(f"Unbekannte Methode: {method}")
+    t = np.asarray(t, dtype=float)
+    if len(t) < 2:
+        raise ValueError("Zeitvektor braucht mindestens 2 Punkte")
+    dt = t[1] - t[0]
+    if dt <= 0 or not np.allclose(np.diff(t), dt, rtol=1e-6, atol=0.0):
+        raise ValueError("Zeitvektor muss äquidistant sein")
+
+    num, den = _tf_coefficients(system)
+    h = _step_samples(tuple(num.tolist()), tuple(den.tolist()), float(dt), len(t))
+    w = _weights(t, *_steps(t, profile))
+
+    nonzero = np.flatnonzero(w)
+    if method == "auto":
+        method = "sparse" if len(nonzero) <= 4 * np.log2(len(t)) else "fft"
+    if method == "fft":
+        y = fftconvolve(w, h)[: len(t)]
+    else:
+        y = np.zeros_like(t)
+        for k in nonzero:
+            y[k:] += w[k] * h[: len(t) - k]
+    return t, y
@@ -0,0 +1,108 @@
+"""
+Stationäre Regelabweichung aus den Fehlerkonstanten des offenen Kreises.
+
+Für den offenen Kreis L(s) = R(s)·G(s) mit N Integratoren (Typ N) gilt bei
+stabilem geschlossenem Kreis:
+
+    Lage:           Kp = lim L(s),       e_step     = 1 / (1 + Kp)
+    Geschwindigkeit: Kv = lim s·L(s),    e_ramp     = 1 / Kv
+    Beschleunigung: Ka = lim s²·L(s),    e_parabola = 1 / Ka
+
+(Grenzwerte für s → 0, Eingänge Sprung 1, Rampe t und Parabel t²/2.)
+"""
+
+import numpy as np
+
+from regelung.simulation.batch import _hurwitz_stable
+from regelung.simulation.core import _tf_coefficients
+
+
+def _origin_order(p, tol):
+    """Anzahl Wurzeln bei s = 0 (verschwindende Koeffizienten am Ende)."""
+    scale = np.max(np.abs(p), axis=-1, keepdims=True)
+    small = np.abs(p) <= tol * scale
+    return np.cumprod(small[..., ::-1], axis=-1).sum(axis=-1)
+
+
+def _error_constants(num, den, stable, tol=1e-9):
+    """
+    Fehlerkonstanten für gestapelte Polynome des offenen Kreises.
+
+    Args:
+        num, den: Zähler und Nenner von L(s), (..., m) bzw. (..., n),
+            höchste Potenz zuerst
+        stable: Bool-Array (...), Stabilität des geschlossenen Kreises
+
+    Returns:
+        dict mit Arrays (...) für type, Kp, Kv, Ka, e_step, e_ramp, e_parabola
+    """
+    num = np.asarray(num, dtype=float)
+    den = np.asarray(den, dtype=float)
+    n0, d0 = _origin_order(num, tol), _origin_order(den, tol)
+    zero = n0 >= num.shape[-1]
+
+    # Niedrigster nicht verschwindender Koeffizient = Verstärkung bei s → 0
+    i = np.minimum(num.shape[-1] - 1 - n0, num.shape[-1] - 1)
+    j = den.shape[-1] - 1 - d0
+    gain = (
+        np.take_along_axis(num, i[..., None], axis=-1)[..., 0]
+        / np.take_along_axis(den, j[..., None], axis=-1)[..., 0]
+    )
+
+    result = {"type": np.maximum(d0 - n0, 0).astype(int)}
+    for k, name in enumerate(("Kp", "Kv", "Ka")):
+        excess = d0 - n0 - k
+        K = np.where(excess == 0, gain, 0.0)
+        K = np.where(excess > 0, np.sign(gain) * np.inf, K)
+        result[name] = np.where(zero, 0.0, K)
+
+    with np.errstate(divide="ignore"):
+        errors = {
+            "e_step": 1.0 / (1.0 + result["Kp"]),
+            "e_ramp": 1.0 / result["Kv"],
+            "e_parabola": 1.0 / result["Ka"],
+        }
+    for name, e in errors.items():
+        # + 0.0 macht aus -0.0 (1/-inf) eine 0; ohne Stabilität gibt es
+        # keinen stationären Zustand
+        result[name] = np.where(stable, e + 0.0, np.nan)
+    return result
+
+
+def error_constants(open_loop, tol=1e-9):
+    """
+    Systemtyp, Fehlerkonstanten und stationäre Regelabweichungen.
+
+    Die Werte folgen exakt aus den Koeffizienten des offenen Kreises, eine
+    Simulation ist nicht nötig. Für viele Reglerparameter auf einmal siehe
+    ParametricLoop.error_constants.
+
+    Args:
+        open_loop: Offener Kreis L(s), z.B. series_connection(regler, strecke)
+        tol: Relative Schranke für verschwindende Koeffizienten
+            (default: 1e-9)
+
+    Returns:
+        dict mit
+            - type: Anzahl der Integratoren im offenen Kreis
+            - Kp, Kv, Ka: Lage-, Geschwindigkeits- und Beschleunigungs-
+              fehlerkonstante (inf bei höherem Typ)
+            - e_step, e_ramp, e_parabola: Bleibende Regelabweichung für
+              Sprung 1, Rampe t und Parabel t²/2 (nan bei instabilem
+              geschlossenem Kreis)
+
+    Beispiel:
+        >>> from regelung import PI, PT1, series_connection
+        >>> from regelung.simulation import error_constants
+        >>> L = series_connection(PI(Kp=2.0, Ti=1.0), PT1(Kp=1.0, T=1.0))
+        >>> c = error_constants(L)
+        >>> c["type"], c["Kv"], c["e_ramp"]
+        (1, 2.0, 0.5)
+    """
+    num, den = _tf_coefficients(open_loop)
+    stable = _hurwitz_stable(np.polyadd(den, num))
+    result = _error_constants(num, den, stable, tol)
+    return {
+        name: int(value) if name == "type" else float(value)
+        for name, value in result.items()
+    }
@@ -0,0 +1,249 @@
+"""
+Vorberechnete Sprungantworten für Parametergitter (z.B. Schieberegler).
+
+ResponseTable speichert die Sprungantworten eines ParametricLoop auf einem
+festen Gitter von Parameterwerten. Fehlende Gitterpunkte werden bei Bedarf
+gemeinsam simuliert: beim ersten Zugriff auf einen Punkt das ganze
+Achsenkreuz durch diesen Punkt, sodass das Verschieben eines einzelnen
+Reglers danach nur noch ein Nachschlagen ist. Werte zwischen den
+Gitterpunkten werden multilinear interpoliert.
+
+Mit compress=True wird jede Antwort auf 16 Bit quantisiert (Offset und
+Skalierung je Antwort, Fehler höchstens 1/131070 der Spannweite), das
+entspricht einem Viertel des float64-Speichers.
+"""
+
+from itertools import islice
+
+import numpy as np
+
+# Quantisierungsstufen für compress=True (uint16)
+_LEVELS = np.iinfo(np.uint16).max
+
+
+def _encode(Y, compress):
+    """
+    Antworten (B, N) in speicherbare Tupel (Daten, Offset, Skalierung).
+
+    Antworten mit nicht endlichen Werten (instabile Kreise) erhalten den
+    Offset nan und werden als nan zurückgegeben.
+    """
+    finite = np.all(np.isfinite(Y), axis=-1)
+    Y = np.where(finite[:, None], Y, 0.0)
+    if not compress:
+        low = np.where(finite, 0.0, np.nan)
+        return [(y, lo, 1.0) for y, lo in zip(Y, low)]
+
+    low, high = Y.min(axis=-1), Y.max(axis=-1)
+    scale = np.where(high > low, (high - low) / _LEVELS, 1.0)
+    Q = np.rint((Y - low[:, None]) / scale[:, None]).astype(np.uint16)
+    low = np.where(finite, low, np.nan)
+    return list(zip(Q, low, scale))
+
+
+def _decode(entry):
+    data, low, scale = entry
+    return low + scale * data.astype(float)
+
+
+class ResponseTable:
+    """
+    Sprungantworten eines ParametricLoop auf einem Parametergitter.
+
+    Die Tabelle ist anfangs leer und füllt sich beim Nachschlagen;
+    precompute berechnet alle Gitterpunkte vorab, save/load legen die
+    Tabelle komprimiert auf der Festplatte ab.
+
+    Args:
+        loop: ParametricLoop des Regelkreises
+        grid: dict {Parameter: Werte} für alle loop.params; Werte
+            aufsteigend, Skalare halten einen Parameter fest
+        t_end: Simulationsende in Sekunden (default: 10.0)
+        n_points: Anzahl der Zeitpunkte (default: 1000)
+        compress: Antworten auf 16 Bit quantisieren (default: True)
+
+    Beispiel:
+        >>> import numpy as np
+        >>> from regelung import PI, PT1, ParametricLoop
+        >>> from regelung.simulation import ResponseTable
+        >>> table = ResponseTable(
+        ...     ParametricLoop(PI, PT1),
+        ...     {
+        ...         "Kp": np.linspace(0.1, 5.0, 50),
+        ...         "Ti": np.linspace(0.1, 5.0, 50),
+        ...         "Kp_s": np.linspace(0.5, 5.0, 10),
+        ...         "T": np.linspace(0.5, 5.0, 10),
+        ...     },
+        ...     t_end=15.0,
+        ... )
+        >>> t, y = table.response(Kp=1.0, Ti=1.0, Kp_s=2.0, T=1.0)
+        >>> t, y = table.response(Kp=1.05, Ti=1.0, Kp_s=2.0, T=1.0)  # interpoliert
+    """
+
+    def __init__(self, loop, grid, t_end=10.0, n_points=1000, compress=True):
+        missing = [p for p in loop.params if p not in grid]
+        unknown = [p for p in grid if p not in loop.params]
+        if missing or unknown:
+            raise ValueError(f"Parameter fehlen: {missing}, unbekannt: {unknown}")
+
+        self.loop = loop
+        self.grid = {}
+        for p in loop.params:
+            values = np.atleast_1d(np.asarray(grid[p], dtype=float))
+            if values.ndim != 1 or np.any(np.diff(values) <= 0):
+                raise ValueError(f"Gitter für {p} muss 1-D und aufsteigend sein")
+            self.grid[p] = values
+        self.shape = tuple(len(values) for values in self.grid.values())
+        self.t = np.linspace(0.0, t_end, n_points)
+        self.compress = compress
+        # Gitterindex -> (Daten, Offset, Skalierung)
+        self._responses = {}
+
+    def __len__(self):
+        """Anzahl der bereits berechneten Gitterpunkte."""
+        return len(self._responses)
+
+    def __repr__(self):
+        return (
+            f"ResponseTable({self.loop!r}, shape={self.shape}, "
+            f"gefüllt={len(self)}/{int(np.prod(self.shape))})"
+        )
+
+    @property
+    def nbytes(self):
+        """Speicherbedarf der gespeicherten Antworten in Byte."""
+        return sum(entry[0].nbytes for entry in self._responses.values())
+
+    def _fill(self, indices, chunk_size=10_000):
+        """Simuliert alle noch fehlenden Gitterpunkte gestapelt."""
+        missing = sorted(set(indices) - self._responses.keys())
+        for start in range(0, len(missing), chunk_size):
+            part = missing[start : start + chunk_size]
+            params = {
+                p: self.grid[p][[index[k] for index in part]]
+                for k, p in enumerate(self.grid)
+            }
+            _, Y = self.loop.step(t_end=self.t[-1], n_points=len(self.t), **params)
+            self._responses.update(zip(part, _encode(Y, self.compress)))
+
+    def _cross(self, index):
+        """Alle Gitterpunkte, die sich von index in nur einer Achse unterscheiden."""
+        for k, n in enumerate(self.shape):
+            for j in range(n):
+                yield index[:k] + (j,) + index[k + 1 :]
+
+    def precompute(self, chunk_size=10_000):
+        """
+        Berechnet alle fehlenden Gitterpunkte vorab.
+
+        Args:
+            chunk_size: Parametersätze je gestapelter Simulation
+                (default: 10_000)
+
+        Returns:
+            self (für Verkettung)
+        """
+        indices = np.ndindex(self.shape)
+        while chunk := list(islice(indices, chunk_size)):
+            self._fill(chunk, chunk_size)
+        return self
+
+    def response(self, **params):
+        """
+        Sprungantwort für beliebige Parameterwerte innerhalb des Gitters.
+
+        Auf Gitterpunkten wird die gespeicherte Antwort zurückgegeben,
+        dazwischen die multilinear interpolierte Antwort der umgebenden
+        Gitterpunkte (eine Näherung; feinere Gitter sind genauer).
+
+        Args:
+            **params: Parameterwerte; festgehaltene Parameter (Gitter mit
+                einem Wert) dürfen fehlen
+
+        Returns:
+            t, y: Zeitvektor (N,) und Sprungantwort (N,), nan bei
+            instabilem Regelkreis
+        """
+        unknown = [p for p in params if p not in self.grid]
+        if unknown:
+            raise ValueError(f"Unbekannte Parameter: {unknown}")
+
+        # Eckpunkte der Gitterzelle mit Gewichten, Gewicht 0 entfällt
+        corners = [((), 1.0)]
+        for p, values in self.grid.items():
+            if p not in params:
+                if len(values) > 1:
+                    raise ValueError(f"Parameter fehlt: {p}")
+                x = values[0]
+            else:
+                x = float(params[p])
+            tol = 1e-9 * max(values[-1] - values[0], abs(values[0]), 1.0)
+            if not values[0] - tol <= x <= values[-1] + tol:
+                raise ValueError(
+                    f"{p}={x} liegt außerhalb des Gitters [{values[0]}, {values[-1]}]"
+                )
+            if len(values) == 1:
+                pairs = [(0, 1.0)]
+            else:
+                i = int(np.clip(np.searchsorted(values, x) - 1, 0, len(values) - 2))
+                w = np.clip((x - values[i]) / (values[i + 1] - values[i]), 0.0, 1.0)
+                pairs = [(j, v) for j, v in ((i, 1.0 - w), (i + 1, w)) if v > 1e-9]
+            corners = [(c + (j,), cw * v) for c, cw in corners for j, v in pairs]
+
+        missing = [c for c, _ in corners if c not in self._responses]
+        if missing:
+            self._fill([index for c in missing for index in self._cross(c)])
+
+        total = sum(w for _, w in corners)
+        y = sum(w / total * _decode(self._responses[c]) for c, w in corners)
+        return self.t, y
+
+    def save(self, path):
+        """
+        Speichert die berechneten Antworten komprimiert (.npz).
+
+        Args:
+            path: Zieldatei
+        """
+        keys = sorted(self._responses)
+        entries = [self._responses[key] for key in keys]
+        dtype = np.uint16 if self.compress else float
+        np.savez_compressed(
+            path,
+            loop=repr(self.loop),
+            params=np.array(list(self.grid)),
+            t=self.t,
+            compress=self.compress,
+            index=np.array(keys, dtype=np.int64).reshape(len(keys), len(self.shape)),
+            data=np.array([e[0] for e in entries], dtype=dtype).reshape(
+                len(keys), len(self.t)
+            ),
+            low=np.array([e[1] for e in entries], dtype=float),
+            scale=np.array([e[2] for e in entries], dtype=float),
+            **{f"grid_{p}": values for p, values in self.grid.items()},
+        )
+
+    @classmethod
+    def load(cls, path, loop):
+        """
+        Lädt eine mit save gespeicherte Tabelle.
+
+        Args:
+            path: Datei aus save
+            loop: ParametricLoop, mit dem fehlende Punkte berechnet werden;
+                muss zum gespeicherten Regelkreis passen
+
+        Returns:
+            ResponseTable
+        """
+        with np.load(path) as f:
+            if str(f["loop"]) != repr(loop):
+                raise ValueError(f"Tabelle gehört zu {f['loop']}, nicht zu {loop!r}")
+            grid = {str(p): f[f"grid_{p}"] for p in f["params"]}
+            t = f["t"]
+            table = cls(loop, grid, t[-1], len(t), bool(f["compress"]))
+            for index, data, low, scale in zip(
+                f["index"], f["data"], f["low"], f["scale"]
+            ):
+                table._responses[tuple(int(i) for i in index)] = (data, low, scale)
+        return table
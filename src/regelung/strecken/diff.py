@@ -1,7 +1,9 @@
 from control import TransferFunction
 
+from regelung.analysis import SystemProperties
 
-class D:
+
+class D(SystemProperties):
     """
     D-Strecke : G(s) = Kd * s
     """
@@ -14,7 +16,7 @@ class D:
         return self.G
 
 
-class DT1:
+class DT1(SystemProperties):
     """
     DT1-Strecke : G(s) = (Kd * s) / (1 + T1 * s)
     """
@@ -1,7 +1,9 @@
 from control import TransferFunction
 
+from regelung.analysis import SystemProperties
 
-class I:
+
+class I(SystemProperties):
     """
     I-Regelstrecke (Integrator): G(s) = Ki / s = 1 / (Ti·s)
 
@@ -47,7 +49,7 @@ class I:
         return f"I(Ki={self.Ki:.3f}, Ti={self.Ti:.3f})"
 
 
-class IT1:
+class IT1(SystemProperties):
     """
     IT1-Regelstrecke: G(s) = Ki / (s·(T1·s + 1))
 
@@ -2,8 +2,10 @@ import math
 
 from control import TransferFunction
 
+from regelung.analysis import SystemProperties
 
-class PT1:
+
+class PT1(SystemProperties):
     """
     PT1-Regelstrecke: G(s) = Kp / (T s + 1)
 
@@ -24,7 +26,7 @@ class PT1:
         return self.G
 
 
-class PT2:
+class PT2(SystemProperties):
     """
     PT2-Regelstrecke:
 
@@ -1,7 +1,9 @@
 from control import TransferFunction, pade
 
+from regelung.analysis import SystemProperties
 
-class Totzeit:
+
+class Totzeit(SystemProperties):
     """
     Totzeit-Approximation mit Padé-Approximation.
 
@@ -0,0 +1,52 @@
+"""
+Tests für die adaptive Integration steifer Systeme
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+from control import tf
+
+from regelung import PT1, PT2, series_connection, simulate_signal, simulate_step
+
+
+class TestAdaptiveSolver:
+    """Tests für simulate_step/simulate_signal mit solver"""
+
+    @pytest.mark.parametrize("solver", ["Radau", "BDF", "LSODA"])
+    def test_stiff_step_response(self, solver):
+        """Test: Zeitkonstanten 1000 s und 1 ms, analytische Lösung"""
+        T1, T2 = 1000.0, 0.001
+        strecke = series_connection(PT1(Kp=1.0, T=T1), PT1(Kp=1.0, T=T2))
+        t = np.concatenate([np.linspace(0, 0.01, 50), np.linspace(0.02, 5000, 200)])
+
+        t_out, y = simulate_step(strecke, solver=solver, t=t, rtol=1e-8)
+
+        exact = 1 - (T1 * np.exp(-t / T1) - T2 * np.exp(-t / T2)) / (T1 - T2)
+        assert np.array_equal(t_out, t)
+        assert np.allclose(y, exact, atol=1e-6)
+
+    def test_signal_matches_forced_response(self):
+        """Test: Stückweise lineare Eingänge wie forced_response"""
+        strecke = PT2(Kp=2.0, T1=1.0, T2=0.3)
+        t = np.linspace(0, 20, 2001)
+        u = np.where(t >= 2.0, 1.0, 0.0) + np.clip(t - 10.0, 0.0, 2.0)
+
+        _, y_ref = simulate_signal(strecke.tf(), t, u)
+        _, y = simulate_signal(strecke, t, u, solver="Radau", rtol=1e-9, atol=1e-12)
+
+        assert np.allclose(y, y_ref, atol=1e-6)
+
+    def test_direct_feedthrough(self):
+        """Test: Statisches System ohne Zustände"""
+        t = np.linspace(0, 1, 11)
+        _, y = simulate_signal(tf([2.0], [1.0]), t, t, solver="BDF")
+
+        assert np.allclose(y, 2.0 * t)
+
+    def test_unknown_solver(self):
+        """Test: Unbekanntes Verfahren wird abgelehnt"""
+        with pytest.raises(ValueError):
+            simulate_step(PT1(Kp=1.0, T=1.0), solver="RK45")
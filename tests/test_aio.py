@@ -0,0 +1,144 @@
+"""
+Tests für die asyncio-Schnittstelle
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from regelung import PT1, P, closed_loop, simulate_step
+from regelung.simulation.aio import (
+    AsyncSimulator,
+    closed_loop_async,
+    simulate_signal_async,
+    simulate_step_async,
+)
+
+
+class TestAsyncAPI:
+    """Tests für die asynchronen Simulationsfunktionen"""
+
+    def test_results_match_blocking_calls(self):
+        """Test: Asynchrone Ergebnisse entsprechen den blockierenden"""
+        regler, strecke = P(Kp=2.0), PT1(Kp=1.0, T=1.0)
+
+        async def run():
+            system = await closed_loop_async(regler, strecke)
+            return await simulate_step_async(system, 5.0)
+
+        t, y = asyncio.run(run())
+        t_ref, y_ref = simulate_step(closed_loop(regler, strecke), 5.0)
+
+        assert np.allclose(t, t_ref)
+        assert np.allclose(y, y_ref)
+
+    def test_simulate_signal_async(self):
+        """Test: Signal-Simulation läuft asynchron"""
+        t = np.linspace(0, 10, 200)
+
+        t_out, y = asyncio.run(
+            simulate_signal_async(PT1(Kp=2.0, T=1.0).tf(), t, np.ones_like(t))
+        )
+
+        assert np.isclose(y[-1], 2.0, rtol=1e-3)
+
+
+class TestAsyncSimulator:
+    """Tests für Zusammenfassung, Gegendruck und Abbruch"""
+
+    def test_identical_requests_are_merged(self):
+        """Test: Gleichzeitige identische Anfragen rechnen nur einmal"""
+        calls = []
+
+        def slow_square(x):
+            calls.append(x)
+            time.sleep(0.05)
+            return x * x
+
+        async def run():
+            sim = AsyncSimulator()
+            return await asyncio.gather(
+                *[sim.submit(slow_square, np.array([1.0, 2.0])) for _ in range(5)],
+                sim.submit(slow_square, np.array([3.0])),
+            )
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 2
+        assert all(np.allclose(r, [1.0, 4.0]) for r in results[:5])
+
+    def test_max_concurrency(self):
+        """Test: Höchstens max_concurrency Berechnungen laufen gleichzeitig"""
+        lock = threading.Lock()
+        active = [0, 0]  # aktuell, maximal
+
+        def work(i):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return i
+
+        async def run():
+            sim = AsyncSimulator(max_concurrency=2)
+            return await asyncio.gather(*[sim.submit(work, i) for i in range(8)])
+
+        assert asyncio.run(run()) == list(range(8))
+        assert active[1] <= 2
+
+    def test_cancel_waiting_request(self):
+        """Test: Abgebrochene wartende Anfrage wird nicht ausgeführt"""
+        calls = []
+
+        def work(i):
+            calls.append(i)
+            time.sleep(0.05)
+            return i
+
+        async def run():
+            sim = AsyncSimulator(max_concurrency=1)
+            first = asyncio.ensure_future(sim.submit(work, 1))
+            second = asyncio.ensure_future(sim.submit(work, 2))
+            await asyncio.sleep(0.01)
+            second.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await second
+            assert await first == 1
+            assert sim.pending == 0
+
+        asyncio.run(run())
+        assert calls == [1]
+
+    def test_cancelled_requests_keep_their_slot(self):
+        """Test: Abgebrochene laufende Berechnungen zählen bis zum Ende mit"""
+        lock = threading.Lock()
+        active = [0, 0]  # aktuell, maximal
+
+        def work(i):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return i
+
+        async def run():
+            sim = AsyncSimulator(max_concurrency=2)
+            tasks = [asyncio.ensure_future(sim.submit(work, i)) for i in range(5)]
+            await asyncio.sleep(0.01)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            assert await sim.submit(work, 10) == 10
+
+        asyncio.run(run())
+        assert active[1] <= 2
@@ -0,0 +1,118 @@
+"""
+Tests für Pole, Nullstellen und gecachte Kenngrößen
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+
+from regelung import DT1, IT1, PID, PT1, PT2, I, ParametricLoop, Totzeit
+from regelung.analysis import batch_roots, damping_table
+
+
+def _sorted(roots):
+    return np.sort_complex(np.round(roots, 10))
+
+
+class TestBatchRoots:
+    """Tests für batch_roots"""
+
+    def test_matches_np_roots(self):
+        """Test: Gleiche Wurzeln wie np.roots für viele Polynome"""
+        coefficients = np.random.default_rng(2).uniform(0.5, 2.0, (500, 5))
+
+        roots = batch_roots(coefficients)
+
+        assert roots.shape == (500, 4)
+        for c, r in zip(coefficients, roots):
+            assert np.allclose(_sorted(r), _sorted(np.roots(c)), atol=1e-8)
+
+    def test_leading_zero_gives_nan(self):
+        """Test: Führende Null ist ungültig"""
+        roots = batch_roots([[1.0, 3.0, 2.0], [0.0, 1.0, 2.0]])
+
+        assert np.allclose(_sorted(roots[0]), [-2.0, -1.0])
+        assert np.all(np.isnan(roots[1]))
+
+    def test_damping_table(self):
+        """Test: Dämpfung und Eigenkreisfrequenz eines Polpaars"""
+        D, wn = 0.3, 2.0
+        poles = batch_roots([1.0, 2 * D * wn, wn**2])
+
+        table = damping_table(poles)
+
+        assert np.allclose(table["wn"], wn)
+        assert np.allclose(table["zeta"], D)
+
+
+class TestSystemProperties:
+    """Tests für die gecachten Kenngrößen der Modellobjekte"""
+
+    def test_pt2(self):
+        """Test: Pole, Dämpfung und Verstärkung PT2"""
+        strecke = PT2(Kp=3.0, T1=2.0, T2=0.5)
+
+        assert np.allclose(strecke.poles().real, [-0.5, -2.0])
+        assert np.allclose(strecke.damping()["zeta"], 1.0)
+        assert strecke.dcgain() == 3.0
+        assert strecke.zeros().shape == (0,)
+
+    @pytest.mark.parametrize(
+        "system, gain",
+        [
+            (I(Ki=2.0), np.inf),
+            (IT1(T1=1.0, Ki=-1.0), -np.inf),
+            (DT1(Kd=1.0, T1=1.0), 0.0),
+        ],
+    )
+    def test_dcgain_special_cases(self, system, gain):
+        """Test: Integrierende und differenzierende Glieder"""
+        assert system.dcgain() == gain
+
+    def test_controller_zeros(self):
+        """Test: Nullstellen des PID-Reglers"""
+        regler = PID(Kp=2.0, Ti=4.0, Td=1.0)
+
+        assert np.allclose(_sorted(regler.zeros()), [-0.5, -0.5], atol=1e-6)
+        assert np.allclose(regler.poles(), 0.0)
+
+    def test_cache(self):
+        """Test: Zweiter Zugriff liefert dasselbe, schreibgeschützte Array"""
+        strecke = Totzeit(Tt=1.0, order=4)
+
+        poles = strecke.poles()
+
+        assert strecke.poles() is poles
+        assert not poles.flags.writeable
+        assert "poles" not in vars(strecke)
+
+    def test_cache_follows_transfer_function(self):
+        """Test: Neue Übertragungsfunktion macht den Cache ungültig"""
+        strecke = PT1(Kp=1.0, T=1.0)
+        assert np.allclose(strecke.poles(), -1.0)
+
+        strecke.G = PT1(Kp=1.0, T=0.5).tf()
+
+        assert np.allclose(strecke.poles(), -2.0)
+
+
+class TestParametricPoles:
+    """Tests für die vektorisierten Pole des ParametricLoop"""
+
+    def test_grid(self):
+        """Test: Pole aller Parametersätze wie np.roots"""
+        loop = ParametricLoop(PID, PT2)
+        Kp = np.linspace(0.5, 5.0, 50)[:, None]
+        Ti = np.linspace(0.5, 5.0, 40)
+        p = dict(Kp=Kp, Ti=Ti, Td=0.2, Kp_s=1.0, T1=2.0, T2=0.5)
+
+        poles = loop.poles(**p)
+        num, den = loop.coefficients(**p)
+
+        assert poles.shape == (50, 40, 3)
+        assert np.allclose(_sorted(poles[7, 3]), _sorted(np.roots(den[7, 3])))
+        assert np.array_equal(np.all(poles.real < 0, axis=-1), loop.is_stable(**p))
+        assert np.allclose(loop.dcgain(**p), 1.0)
+        assert loop.zeros(**p).shape == (50, 40, 2)
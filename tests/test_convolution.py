@@ -0,0 +1,74 @@
+"""
+Tests für die FFT-Faltung langer Signale
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+
+from regelung import IT1, PI, PT2, I, closed_loop, simulate_signal
+
+
+class TestFFTEngine:
+    """Tests für simulate_signal mit solver="fft" """
+
+    def test_matches_forced_response(self):
+        """Test: Gleiche Antwort wie die Rekursion von forced_response"""
+        system = closed_loop(PI(Kp=2.0, Ti=1.5), PT2(Kp=1.0, T1=2.0, T2=0.5))
+        t = np.linspace(0, 200, 20001)
+        u = np.random.default_rng(1).standard_normal(len(t))
+
+        _, y_ref = simulate_signal(system, t, u)
+        _, y = simulate_signal(system, t, u, solver="fft")
+
+        assert y.shape == t.shape
+        assert np.allclose(y, y_ref, atol=1e-8)
+
+    def test_multiple_channels(self):
+        """Test: Mehrere Eingangskanäle mit einer Impulsantwort"""
+        strecke = PT2(Kp=1.0, T1=1.0, T2=0.2)
+        t = np.linspace(0, 50, 5001)
+        U = np.vstack([np.sin(t), np.ones_like(t), np.sign(np.sin(0.3 * t))])
+
+        _, Y = simulate_signal(strecke, t, U, solver="fft")
+
+        assert Y.shape == U.shape
+        for u, y in zip(U, Y):
+            _, y_ref = simulate_signal(strecke.tf(), t, u)
+            assert np.allclose(y, y_ref, atol=1e-8)
+
+    def test_step_from_rest(self):
+        """Test: Strikt proper startet bei 0, Integrator ohne Versatz"""
+        t = np.linspace(0, 20, 2001)
+
+        _, y = simulate_signal(
+            PT2(Kp=1.0, T1=1.0, T2=0.2), t, 3.0 * np.ones_like(t), solver="fft"
+        )
+        assert y[0] == 0.0
+
+        _, y = simulate_signal(I(Ki=0.5), t, np.ones_like(t), solver="fft")
+        assert np.allclose(y, 0.5 * t, atol=1e-10)
+
+    @pytest.mark.parametrize("strecke", [I(Ki=0.5), IT1(Ki=1.0, T1=0.5)])
+    def test_marginally_stable_fallback(self, strecke):
+        """Test: Integrierende Strecken laufen rekursiv"""
+        t = np.linspace(0, 20, 2001)
+        u = np.ones_like(t)
+
+        _, y_ref = simulate_signal(strecke.tf(), t, u)
+        _, y = simulate_signal(strecke, t, u, solver="fft")
+
+        assert np.allclose(y, y_ref, atol=1e-8)
+
+    def test_tolerance_controls_error(self):
+        """Test: Gröbere Toleranz kürzt die Impulsantwort"""
+        strecke = PT2(Kp=1.0, T1=5.0, T2=1.0)
+        t = np.linspace(0, 100, 10001)
+        u = np.where(t < 50.0, 1.0, 0.0)
+
+        _, y_ref = simulate_signal(strecke.tf(), t, u)
+        _, y = simulate_signal(strecke, t, u, solver="fft", tol=1e-3)
+
+        assert 0 < np.max(np.abs(y - y_ref)) <= 1e-3 * np.max(np.abs(y_ref)) * 1.01
@@ -0,0 +1,71 @@
+"""
+Tests für die inkrementelle Grafik-Erzeugung
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+
+from regelung import PT1, plot_step, simulate_step
+from regelung.simulation import figures
+from regelung.simulation.figures import FigureBuilder
+
+
+def sprung(strecke, t_end=5.0, title="Sprungantwort", show=True):
+    t, y = simulate_step(strecke.tf(), t_end)
+    return plot_step(t, y, title=title, show=show)
+
+
+class TestFigureBuilder:
+    """Tests für FigureBuilder"""
+
+    def _builder(self, directory, **kwargs):
+        builder = FigureBuilder(directory, workers=1, dpi=50)
+        builder.add("a.png", sprung, strecke=PT1(Kp=1.0, T=1.0), **kwargs)
+        builder.add("b.png", sprung, strecke=PT1(Kp=2.0, T=0.5))
+        return builder
+
+    def test_unchanged_figures_are_skipped(self, tmp_path):
+        """Test: Zweiter Lauf zeichnet nichts neu"""
+        first = self._builder(tmp_path).build()
+        second = self._builder(tmp_path).build()
+
+        assert first == {"a.png": "built", "b.png": "built"}
+        assert second == {"a.png": "skipped", "b.png": "skipped"}
+        assert (tmp_path / "a.png").exists()
+
+    def test_changed_inputs_are_rebuilt(self, tmp_path):
+        """Test: Geänderte Stiloptionen und fehlende Dateien"""
+        self._builder(tmp_path).build()
+
+        result = self._builder(tmp_path, title="Neu").build()
+        assert result == {"a.png": "built", "b.png": "skipped"}
+
+        (tmp_path / "b.png").unlink()
+        assert list(self._builder(tmp_path, title="Neu").outdated()) == ["b.png"]
+
+    def test_style_change_rebuilds_all(self, tmp_path, monkeypatch):
+        """Test: Geänderter Plot-Stil macht alle Grafiken ungültig"""
+        self._builder(tmp_path).build()
+
+        monkeypatch.setattr(figures, "_style_version", lambda: "neuer Stil")
+        assert sorted(self._builder(tmp_path).outdated()) == ["a.png", "b.png"]
+
+    def test_array_inputs_are_hashed(self, tmp_path):
+        """Test: Zeitraster gehen in den Hash ein"""
+        builder = FigureBuilder(tmp_path, workers=1, dpi=50)
+        t = np.linspace(0, 5, 100)
+        builder.add("c.png", plot_step, t=t, y=1 - np.exp(-t))
+        builder.build()
+
+        builder.add("c.png", plot_step, t=t, y=1 - np.exp(-2 * t))
+        assert list(builder.outdated()) == ["c.png"]
+
+    def test_parallel_build(self, tmp_path):
+        """Test: Paralleles Zeichnen in Worker-Prozessen"""
+        builder = self._builder(tmp_path)
+        builder.workers = 2
+
+        assert set(builder.build().values()) == {"built"}
+        assert (tmp_path / "b.png").exists()
@@ -0,0 +1,193 @@
+"""
+Tests für die Identifikation aus Messdaten
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+from scipy.signal import lfilter
+
+from regelung import PT1, PT2, Totzeit, fit_pt1, fit_pt1_totzeit, fit_pt2
+from regelung.identifikation import ARXEstimator, fit_armax, fit_arx
+
+
+class TestFitPT1:
+    """Tests für PT1-Identifikation"""
+
+    def test_fit_pt1_exact(self):
+        """Test: Rauschfreie PT1-Antwort wird exakt identifiziert"""
+        t = np.linspace(0, 10, 500)
+        y = 2.0 * (1 - np.exp(-t / 1.5))
+
+        strecke, residuum = fit_pt1(t, y)
+
+        assert np.isclose(strecke.Kp, 2.0, rtol=1e-3)
+        assert np.isclose(strecke.T, 1.5, rtol=1e-3)
+        assert residuum < 1e-4
+
+    def test_fit_pt1_batch(self):
+        """Test: Stapel von Datensätzen liefert Liste von Modellen"""
+        t = np.linspace(0, 20, 400)
+        K = np.array([1.0, 2.0, -0.5])
+        T = np.array([0.5, 2.0, 4.0])
+        rng = np.random.default_rng(0)
+        Y = K[:, None] * (1 - np.exp(-t / T[:, None]))
+        Y += 0.005 * rng.standard_normal(Y.shape)
+
+        strecken, residuen = fit_pt1(t, Y)
+
+        assert len(strecken) == 3
+        assert residuen.shape == (3,)
+        for strecke, K_i, T_i in zip(strecken, K, T):
+            assert np.isclose(strecke.Kp, K_i, rtol=0.02)
+            assert np.isclose(strecke.T, T_i, rtol=0.05)
+
+    def test_fit_pt1_amplitude(self):
+        """Test: Sprunghöhe wird herausgerechnet"""
+        t = np.linspace(0, 10, 500)
+        y = 2.5 * 3.0 * (1 - np.exp(-t / 1.0))
+
+        strecke, _ = fit_pt1(t, y, amplitude=2.5)
+
+        assert np.isclose(strecke.Kp, 3.0, rtol=1e-3)
+
+    def test_fit_pt1_shape_mismatch(self):
+        """Test: Falsche Form wirft Fehler"""
+        with pytest.raises(ValueError):
+            fit_pt1(np.linspace(0, 1, 10), np.ones(5))
+
+
+class TestFitPT1Totzeit:
+    """Tests für PT1+Totzeit-Identifikation"""
+
+    def test_fit_pt1_totzeit_exact(self):
+        """Test: PT1 mit Totzeit wird identifiziert"""
+        t = np.linspace(0, 20, 1000)
+        y = 1.5 * (1 - np.exp(-np.maximum(t - 1.0, 0) / 2.0))
+
+        (strecke, totzeit), residuum = fit_pt1_totzeit(t, y)
+
+        assert np.isclose(strecke.Kp, 1.5, rtol=1e-2)
+        assert np.isclose(strecke.T, 2.0, rtol=2e-2)
+        assert np.isclose(totzeit.Tt, 1.0, atol=0.05)
+        assert residuum < 1e-2
+
+
+class TestFitPT2:
+    """Tests für PT2-Identifikation"""
+
+    def test_fit_pt2_oscillating(self):
+        """Test: Schwingende PT2-Antwort (D < 1)"""
+        K, D, T = 2.0, 0.3, 1.0
+        t = np.linspace(0, 20, 1000)
+        wd = np.sqrt(1 - D**2) / T
+        y = K * (
+            1
+            - np.exp(-D * t / T)
+            * (np.cos(wd * t) + D / np.sqrt(1 - D**2) * np.sin(wd * t))
+        )
+
+        strecke, residuum = fit_pt2(t, y)
+
+        assert isinstance(strecke, PT2)
+        assert np.isclose(strecke.tf().dcgain(), K, rtol=1e-3)
+        assert residuum < 1e-3
+        assert np.allclose(strecke.tf().den[0][0], [T**2, 2 * D * T, 1], rtol=1e-2)
+
+    def test_fit_pt2_aperiodic(self):
+        """Test: Aperiodische PT2-Antwort liefert T1 und T2"""
+        T1, T2 = 2.0, 0.5
+        t = np.linspace(0, 20, 1000)
+        y = 1 - (T1 * np.exp(-t / T1) - T2 * np.exp(-t / T2)) / (T1 - T2)
+
+        strecke, residuum = fit_pt2(t, y)
+
+        assert np.isclose(strecke.T1, T1, rtol=2e-2)
+        assert np.isclose(strecke.T2, T2, rtol=5e-2)
+        assert residuum < 1e-3
+
+
+class TestARX:
+    """Tests für die blockweise ARX/ARMAX-Identifikation"""
+
+    def _data(self, n=20000, noise=0.0, seed=0):
+        rng = np.random.default_rng(seed)
+        u = np.sign(rng.standard_normal(n))  # Binäres Rauschsignal
+        a, b = [1.0, -1.5, 0.7], [0.0, 1.0, 0.5]
+        y = lfilter(b, a, u) + noise * rng.standard_normal(n)
+        return u, y
+
+    def test_fit_arx_exact(self):
+        """Test: Rauschfreie Daten liefern exakte Koeffizienten"""
+        u, y = self._data()
+
+        modell = fit_arx(u, y, na=2, nb=2)
+
+        assert np.allclose(modell.a, [-1.5, 0.7], atol=1e-8)
+        assert np.allclose(modell.b, [1.0, 0.5], atol=1e-8)
+
+    def test_chunks_match_single_pass(self):
+        """Test: Blockgröße hat keinen Einfluss auf das Ergebnis"""
+        u, y = self._data(noise=0.1)
+
+        ref = fit_arx(u, y, na=2, nb=2, chunk_size=len(y))
+        blockwise = fit_arx(u, y, na=2, nb=2, chunk_size=777)
+
+        assert np.allclose(ref.a, blockwise.a)
+        assert np.allclose(ref.b, blockwise.b)
+
+    def test_fit_arx_memmap(self, tmp_path):
+        """Test: Daten werden direkt aus .npy-Dateien gelesen"""
+        u, y = self._data()
+        np.save(tmp_path / "u.npy", u)
+        np.save(tmp_path / "y.npy", y)
+
+        modell = fit_arx(tmp_path / "u.npy", tmp_path / "y.npy", na=2, nb=2)
+
+        assert np.allclose(modell.a, [-1.5, 0.7], atol=1e-8)
+
+    def test_to_strecke_pt1_with_delay(self):
+        """Test: Diskretisierte PT1-Strecke mit Totzeit wird zurückgerechnet"""
+        K, T, dt, nk = 2.0, 1.5, 0.1, 4
+        a = np.exp(-dt / T)
+        rng = np.random.default_rng(1)
+        u = rng.standard_normal(5000)
+        y = lfilter(np.r_[np.zeros(nk), K * (1 - a)], [1.0, -a], u)
+
+        modell = fit_arx(u, y, na=1, nb=1, nk=nk, dt=dt)
+        strecke, totzeit = modell.to_strecke()
+
+        assert isinstance(strecke, PT1)
+        assert isinstance(totzeit, Totzeit)
+        assert np.isclose(strecke.Kp, K, rtol=1e-6)
+        assert np.isclose(strecke.T, T, rtol=1e-6)
+        assert np.isclose(totzeit.Tt, (nk - 1) * dt)
+
+    def test_forgetting_tracks_change(self):
+        """Test: Vergessensfaktor folgt einer Parameteränderung"""
+        rng = np.random.default_rng(2)
+        u = rng.standard_normal(4000)
+        y1 = lfilter([0.0, 1.0], [1.0, -0.5], u[:2000])
+        y2 = lfilter([0.0, 1.0], [1.0, -0.9], u[2000:])
+
+        est = ARXEstimator(na=1, nb=1, forgetting=0.98)
+        est.update(u[:2000], y1)
+        est.update(u[2000:], y2)
+
+        assert np.isclose(est.solve().a[0], -0.9, atol=0.05)
+
+    def test_fit_armax(self):
+        """Test: ARMAX schätzt Störmodell C"""
+        rng = np.random.default_rng(3)
+        n = 50000
+        u = np.sign(rng.standard_normal(n))
+        e = 0.2 * rng.standard_normal(n)
+        y = lfilter([0.0, 1.0], [1.0, -0.8], u) + lfilter([1.0, 0.5], [1.0, -0.8], e)
+
+        modell = fit_armax(u, y, na=1, nb=1, nc=1, chunk_size=10000)
+
+        assert np.isclose(modell.a[0], -0.8, atol=0.02)
+        assert np.isclose(modell.b[0], 1.0, atol=0.02)
+        assert np.isclose(modell.c[0], 0.5, atol=0.05)
@@ -0,0 +1,122 @@
+"""
+Tests für den parametrischen Regelkreis
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+from control import feedback
+
+from regelung import (
+    IT1,
+    PI,
+    PID,
+    PT1,
+    PT2,
+    ParametricLoop,
+    Totzeit,
+    closed_loop,
+    series_connection,
+)
+from regelung.simulation import simulate_step_batch, step_metrics_batch
+
+
+def _normalized(num, den):
+    num, den = np.atleast_1d(num), np.atleast_1d(den)
+    num = np.concatenate([np.zeros(len(den) - len(num)), num])
+    return num / den[0], den / den[0]
+
+
+class TestParametricLoop:
+    """Tests für ParametricLoop"""
+
+    def test_parameter_names(self):
+        """Test: Streckenparameter mit Namenskonflikt erhalten Suffix"""
+        names = ["Kp", "Ti", "Td", "Kp_s", "T1", "T2"]
+        assert ParametricLoop(PID, PT2).params == names
+        assert ParametricLoop("PI", [PT1, Totzeit]).params == [
+            "Kp",
+            "Ti",
+            "Kp_s1",
+            "T",
+            "Tt",
+        ]
+
+    def test_coefficients_match_closed_loop(self):
+        """Test: Koeffizienten entsprechen closed_loop"""
+        loop = ParametricLoop(PID, PT2)
+        params = dict(Kp=2.0, Ti=3.0, Td=0.5, Kp_s=1.5, T1=2.0, T2=0.4)
+        num, den = loop.coefficients(**params)
+
+        G = closed_loop(PID(Kp=2.0, Ti=3.0, Td=0.5), PT2(Kp=1.5, T1=2.0, T2=0.4))
+        ref_num, ref_den = _normalized(G.num[0][0], G.den[0][0])
+
+        assert np.allclose(num / den[0], ref_num)
+        assert np.allclose(den / den[0], ref_den)
+
+    def test_totzeit_matches_pade(self):
+        """Test: Padé-Koeffizienten entsprechen Totzeit"""
+        loop = ParametricLoop(PI, [PT1, Totzeit], pade_order=3)
+        num, den = loop.coefficients(Kp=1.0, Ti=2.0, Kp_s1=1.0, T=1.0, Tt=0.5)
+
+        strecke = series_connection(PT1(Kp=1.0, T=1.0), Totzeit(Tt=0.5, order=3))
+        G = feedback(PI(Kp=1.0, Ti=2.0).tf() * strecke, 1)
+        ref_num, ref_den = _normalized(G.num[0][0], G.den[0][0])
+
+        assert np.allclose(num / den[0], ref_num)
+        assert np.allclose(den / den[0], ref_den)
+
+    def test_broadcasting(self):
+        """Test: Parameter-Arrays werden gegeneinander gebroadcastet"""
+        loop = ParametricLoop(PID, PT2)
+        Kp, Ti = np.meshgrid(np.linspace(0.5, 5, 7), np.linspace(1, 10, 5))
+
+        num, den = loop.coefficients(Kp=Kp, Ti=Ti, Td=0.1, Kp_s=1.0, T1=2.0, T2=0.5)
+
+        assert num.shape == den.shape == (5, 7, 4)
+
+    def test_stability_matches_roots(self):
+        """Test: Routh-Hurwitz entspricht den Polen"""
+        loop = ParametricLoop(PI, IT1)
+        # Stabil genau für Kp > 0, da Ti > T1
+        Kp = np.linspace(-5.0, 20.0, 50)
+        stable = loop.is_stable(Kp=Kp, Ti=3.0, T1=1.0, Ki=1.0)
+
+        _, den = loop.coefficients(Kp=Kp, Ti=3.0, T1=1.0, Ki=1.0)
+        expected = [np.all(np.roots(d).real < 0) for d in den]
+
+        assert np.array_equal(stable, expected)
+        assert np.array_equal(stable, Kp > 0)
+
+    def test_frequency_response(self):
+        """Test: Frequenzgang entspricht der Transfer-Funktion"""
+        loop = ParametricLoop(PI, PT2)
+        omega = np.logspace(-2, 2, 30)
+
+        T = loop.frequency_response(omega, Kp=2.0, Ti=1.5, Kp_s=1.0, T1=2.0, T2=0.5)
+        G = closed_loop(PI(Kp=2.0, Ti=1.5), PT2(Kp=1.0, T1=2.0, T2=0.5))
+
+        assert np.allclose(T, G(1j * omega))
+
+    def test_step_and_metrics(self):
+        """Test: Sprungantworten und Kennwerte entsprechen der Einzelrechnung"""
+        loop = ParametricLoop(PID, PT2)
+        Kp = np.array([0.5, 1.0, 2.0])
+        params = dict(Kp=Kp, Ti=3.0, Td=0.2, Kp_s=1.0, T1=2.0, T2=0.5)
+
+        t, Y = loop.step(t_end=20.0, n_points=500, **params)
+        strecke = PT2(Kp=1.0, T1=2.0, T2=0.5)
+        systems = [closed_loop(PID(Kp=k, Ti=3.0, Td=0.2), strecke) for k in Kp]
+        _, Y_ref = simulate_step_batch(systems, t_end=20.0, n_points=500)
+        metrics = loop.step_metrics(t_end=20.0, n_points=500, chunk_size=2, **params)
+
+        assert np.allclose(Y, Y_ref, atol=1e-8)
+        expected = step_metrics_batch(t, Y, systems=systems)["overshoot_pct"]
+        assert np.allclose(metrics["overshoot_pct"], expected)
+
+    def test_missing_parameter(self):
+        """Test: Fehlende Parameter werden gemeldet"""
+        with pytest.raises(ValueError):
+            ParametricLoop(PID, PT2).coefficients(Kp=1.0)
@@ -0,0 +1,212 @@
+"""
+Tests für die Visualisierung
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection
+
+from regelung import (
+    PI,
+    PT1,
+    PT2,
+    P,
+    ParametricLoop,
+    StepPlot,
+    closed_loop,
+    plot_metric_map,
+    plot_signal,
+    plot_step,
+    plot_step_family,
+    simulate_step,
+)
+from regelung.simulation import get_step_metrics
+from regelung.simulation.plot import _decimate
+
+
+class TestPlotMetricMap:
+    """Tests für plot_metric_map"""
+
+    def test_sweep_result(self):
+        """Test: Strukturiertes Array aus sweep_metrics mit Grenzwertlinie"""
+        loop = ParametricLoop(PI, PT2)
+        Kp, Ti = np.linspace(0.5, 5, 30), np.linspace(0.5, 10, 20)
+        m = loop.sweep_metrics(
+            t_end=40.0, n_points=800, Kp=Kp, Ti=Ti[:, None], Kp_s=1.0, T1=2.0, T2=0.5
+        )
+
+        fig = plot_metric_map(Kp, Ti, m, limits=[5.0], show=False)
+
+        ax = fig.axes[0]
+        assert len(ax.images) == 1
+        assert ax.images[0].get_array().shape == (20, 30)
+
+    def test_large_grid_single_artist(self):
+        """Test: 10⁶ Zellen ergeben ein einziges Bild"""
+        x, y = np.linspace(0, 1, 1000), np.linspace(0, 2, 1000)
+        Z = np.sin(3 * x)[None, :] * np.cos(y)[:, None]
+        Z[:10] = np.nan
+
+        fig = plot_metric_map(x, y, Z, limits=[0.0, 0.5], show=False)
+
+        assert len(fig.axes[0].images) == 1
+
+    def test_nonuniform_grid(self):
+        """Test: Logarithmisches Gitter wird als pcolormesh gezeichnet"""
+        x, y = np.logspace(-1, 1, 40), np.linspace(1, 2, 10)
+        metrics = {"settling_time": np.outer(y, x)}
+
+        fig = plot_metric_map(x, y, metrics, field="settling_time", show=False)
+
+        assert len(fig.axes[0].images) == 0
+        assert len(fig.axes[0].collections) >= 1
+
+    def test_shape_mismatch(self):
+        """Test: Vertauschte Achsen werden erkannt"""
+        with pytest.raises(ValueError):
+            plot_metric_map(np.arange(3), np.arange(4), np.zeros((3, 4)), show=False)
+
+
+class TestPlotStepFamily:
+    """Tests für plot_step_family"""
+
+    def test_single_collection(self):
+        """Test: 10⁴ Verläufe als eine LineCollection"""
+        t = np.linspace(0, 10, 500)
+        T = np.random.default_rng(0).uniform(0.5, 2.0, 10_000)
+        Y = 1 - np.exp(-t[None, :] / T[:, None])
+
+        fig = plot_step_family(t, Y, nominal=0, percentiles=(5, 95), show=False)
+
+        ax = fig.axes[0]
+        collections = [c for c in ax.collections if isinstance(c, LineCollection)]
+        assert len(collections) == 1
+        assert len(collections[0].get_segments()) == 10_000
+        assert len(ax.lines) == 2  # Nominalverlauf und Linie bei t=0
+
+    def test_wrong_shape(self):
+        """Test: Zeitachse muss zur zweiten Dimension passen"""
+        with pytest.raises(ValueError):
+            plot_step_family(np.arange(5), np.zeros((5, 3)), show=False)
+
+
+class TestDecimation:
+    """Tests für die Min/Max-Ausdünnung langer Signale"""
+
+    def test_extrema_and_endpoints_kept(self):
+        """Test: Spitzen, Anfang und Ende bleiben erhalten"""
+        t = np.linspace(0, 100, 1_000_001)
+        y = np.sin(t) + 0.1 * np.random.default_rng(3).standard_normal(len(t))
+        y[123_457] = 5.0
+
+        td, yd = _decimate(t, y, 2000)
+
+        assert len(td) <= 2002
+        assert np.all(np.diff(td) > 0)
+        assert yd.max() == 5.0 and yd.min() == y.min()
+        assert td[0] == t[0] and td[-1] == t[-1]
+
+    def test_short_signal_unchanged(self):
+        """Test: Kurze Signale werden nicht verändert"""
+        t = np.linspace(0, 1, 100)
+
+        td, yd = _decimate(t, t**2, 2000)
+
+        assert np.array_equal(td, t) and np.array_equal(yd, t**2)
+
+    def test_plot_functions(self):
+        """Test: plot_signal und plot_step zeichnen höchstens max_points Punkte"""
+        t = np.linspace(0, 1000, 2_000_001)
+        y = np.sin(t)
+
+        fig = plot_signal(t, y, u=np.cos(t), show_input=True, show=False)
+        for ax in fig.axes:
+            assert len(ax.lines[0].get_xdata()) <= 8002
+
+        fig = plot_step(t, y, max_points=1000, show=False)
+        assert len(fig.axes[0].lines[0].get_xdata()) <= 1002
+        fig = plot_step(t[:500], y[:500], max_points=None, show=False)
+        assert len(fig.axes[0].lines[0].get_xdata()) == 500
+
+
+class TestStepPlot:
+    """Tests für den wiederverwendbaren Sprungantwort-Plot"""
+
+    @staticmethod
+    def _response(Kp):
+        system = closed_loop(P(Kp=Kp), PT1(Kp=2.0, T=1.0))
+        t, y = simulate_step(system, t_end=10.0)
+        return t, y, system
+
+    def test_update_reuses_artists(self):
+        """Test: update ersetzt Daten, erzeugt aber keine neuen Artists"""
+        plot = StepPlot(setpoint=1.0)
+        t, y, system = self._response(1.0)
+        plot.update(t, y, system=system)
+        n_lines, n_texts = len(plot.ax.lines), len(plot.ax.texts)
+
+        t, y, system = self._response(4.0)
+        metrics = plot.update(t, y, system=system, title="Kp = 4")
+
+        assert len(plot.ax.lines) == n_lines and len(plot.ax.texts) == n_texts
+        assert np.array_equal(plot.line.get_ydata(), y)
+        assert plot.ax.get_title() == "Kp = 4"
+        assert metrics == get_step_metrics(t, y, system=system)
+        assert f"{metrics['steady_state']:.4f}" in plot.ax.texts[0].get_text()
+
+    def test_rescale(self):
+        """Test: Achsen folgen den Daten, nicht bei jeder kleinen Änderung"""
+        plot = StepPlot(metrics=False)
+        t = np.linspace(0, 10, 200)
+        plot.update(t, 1 - np.exp(-t))
+        ylim = plot.ax.get_ylim()
+
+        plot.update(t, 0.99 * (1 - np.exp(-t)))
+        assert plot.ax.get_ylim() == ylim
+
+        plot.update(2 * t, 3 * (1 - np.exp(-t)))
+        assert plot.ax.get_ylim()[1] > 3.0
+        assert plot.ax.get_xlim() == (0.0, 20.0)
+
+    def test_additional_lines(self):
+        """Test: Zusatzlinien mit eigenem oder gemeinsamem Zeitvektor"""
+        plot = StepPlot(metrics=False)
+        plot.add_line("u", label="Eingang u(t)", color="red", linestyle="--")
+        plot.add_line("Tt", color="orange")
+        t = np.linspace(0, 10, 100)
+
+        plot.update(t, np.sin(t), lines={"u": np.ones_like(t), "Tt": ([1, 1], [0, 1])})
+
+        assert np.array_equal(plot._lines["u"].get_ydata(), np.ones_like(t))
+        assert list(plot._lines["Tt"].get_xdata()) == [1, 1]
+        labels = [text.get_text() for text in plot.ax.get_legend().get_texts()]
+        assert "Eingang u(t)" in labels
+
+    def test_blitting(self):
+        """Test: Mit Blitting wird der gespeicherte Hintergrund wiederverwendet"""
+        plot = StepPlot(blit=True)
+        t, y, system = self._response(1.0)
+        plot.update(t, y, system=system)
+
+        assert plot.line.get_animated()
+        background = plot._background
+        assert background is not None
+
+        plot.update(t, 1.01 * y, system=system)
+        assert plot._background is background
+
+        # Neue Achsengrenzen erfordern einen neuen Hintergrund
+        plot.update(t, 3.0 * y, system=system)
+        assert plot._background is not background
+
+    def test_without_blitting_artists_stay_visible(self):
+        """Test: Ohne Blitting bleiben alle Artists beim Speichern sichtbar"""
+        plot = StepPlot(blit=False)
+        t, y, system = self._response(2.0)
+        plot.update(t, y, system=system)
+
+        assert not plot.line.get_animated()
+        assert plot._background is None
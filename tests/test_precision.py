@@ -0,0 +1,106 @@
+"""
+Tests für die float32-Genauigkeit der gestapelten Simulation
+
+Dokumentierte Genauigkeit: Mit precision="float32" weichen Sprungantworten
+über 2000 Zeitschritte höchstens 1e-4 (bezogen auf den Endwert) von der
+float64-Rechnung ab, die Kennwerte Endwert, Maximum und Überschwingen
+höchstens 1e-4 relativ bzw. 0.01 Prozentpunkte, Zeitkennwerte höchstens
+einen Zeitschritt. t_max ist nur bei echtem Überschwingen definiert: Bei
+monoton steigenden Antworten liegt das Maximum im Rauschen des Endwerts
+und kann beliebig springen.
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+
+from regelung import (
+    IT1,
+    PID,
+    PT1,
+    PT2,
+    P,
+    ParametricLoop,
+    Totzeit,
+    closed_loop,
+    series_connection,
+    simulate_signal,
+    simulate_step,
+)
+from regelung.simulation import simulate_step_batch, step_metrics_batch
+
+
+def _systems():
+    strecke = PT2(Kp=1.0, T1=2.0, T2=0.5)
+    systems = [closed_loop(P(Kp=kp), strecke) for kp in [0.5, 2.0, 8.0]]
+    systems.append(closed_loop(PID(Kp=1.5, Ti=3.0, Td=0.3), IT1(T1=1.0, Ki=0.5)))
+    systems.append(series_connection(PT1(Kp=2.0, T=0.05), Totzeit(Tt=1.0, order=4)))
+    return systems
+
+
+class TestPrecision:
+    """Genauigkeit von float32 gegenüber float64"""
+
+    def test_trajectories(self):
+        """Test: float32-Trajektorien weichen höchstens 1e-4 ab"""
+        t, Y64 = simulate_step_batch(_systems(), t_end=30.0, n_points=2000)
+        _, Y32 = simulate_step_batch(
+            _systems(), t_end=30.0, n_points=2000, precision="float32"
+        )
+
+        assert Y32.dtype == np.float32
+        scale = np.abs(Y64[:, -1:])
+        assert np.max(np.abs(Y32 - Y64) / scale) < 1e-4
+
+    def test_metrics(self):
+        """Test: Kennwerte aus float32-Trajektorien"""
+        t, Y64 = simulate_step_batch(_systems(), t_end=30.0, n_points=2000)
+        _, Y32 = simulate_step_batch(
+            _systems(), t_end=30.0, n_points=2000, precision="float32"
+        )
+
+        m64 = step_metrics_batch(t, Y64)
+        m32 = step_metrics_batch(t, Y32)
+
+        for key in ["steady_state", "y_max"]:
+            assert np.allclose(m32[key], m64[key], rtol=1e-4)
+        assert np.allclose(m32["overshoot_pct"], m64["overshoot_pct"], atol=1e-2)
+        for key in ["rise_time", "settling_time"]:
+            assert np.allclose(m32[key], m64[key], atol=t[1])
+        peak = m64["overshoot_pct"] > 0.1
+        assert peak.any() and not peak.all()
+        assert np.allclose(m32["t_max"][peak], m64["t_max"][peak], atol=t[1])
+
+    def test_parametric_loop(self):
+        """Test: ParametricLoop mit float32"""
+        loop = ParametricLoop(PID, PT2)
+        params = dict(
+            Kp=np.linspace(0.5, 3.0, 20), Ti=3.0, Td=0.2, Kp_s=1.0, T1=2.0, T2=0.5
+        )
+
+        m64 = loop.step_metrics(t_end=30.0, n_points=2000, **params)
+        m32 = loop.step_metrics(
+            t_end=30.0, n_points=2000, precision="float32", **params
+        )
+
+        assert np.allclose(m32["overshoot_pct"], m64["overshoot_pct"], atol=1e-2)
+
+    def test_single_system(self):
+        """Test: simulate_step und simulate_signal mit float32"""
+        system = _systems()[1]
+        t, y64 = simulate_step(system, t_end=30.0, precision="float64")
+        _, y32 = simulate_step(system, t_end=30.0, precision="float32")
+        _, y_sig = simulate_signal(system, t, np.ones_like(t), precision="float32")
+
+        assert y32.dtype == y_sig.dtype == np.float32
+        assert np.array_equal(y32, y_sig)
+        assert np.max(np.abs(y32 - y64)) < 1e-4 * abs(y64[-1])
+
+    def test_invalid_precision(self):
+        """Test: Nur float32 und float64 sind erlaubt"""
+        with pytest.raises(ValueError):
+            simulate_step_batch(_systems(), precision="float16")
+        with pytest.raises(ValueError):
+            simulate_step(_systems()[0], solver="Radau", precision="float32")
@@ -0,0 +1,87 @@
+"""
+Tests für die Ordnungsreduktion
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+from control import StateSpace, feedback, ss
+
+from regelung import PT1, I, P, Totzeit, series_connection, simulate_signal
+from regelung.simulation import balanced_reduction, hankel_singular_values
+
+
+def _loop():
+    """Regelkreis mit PT1-Kette und hochaufgelöster Totzeit (14 Zustände)."""
+    strecke = series_connection(
+        PT1(Kp=1.0, T=2.0),
+        PT1(Kp=1.0, T=0.5),
+        PT1(Kp=1.0, T=0.2),
+        PT1(Kp=1.0, T=0.1),
+        Totzeit(Tt=1.0, order=10),
+    )
+    return feedback(P(Kp=0.5).tf() * strecke, 1)
+
+
+class TestBalancedReduction:
+    """Tests für balanced_reduction"""
+
+    def test_hinf_bound_holds(self):
+        """Test: Frequenzgangfehler liegt unter der H∞-Schranke"""
+        system = _loop()
+        reduced, info = balanced_reduction(system, hinf_tol=1e-2)
+        omega = np.logspace(-3, 3, 400)
+
+        error = np.max(np.abs(system(1j * omega) - reduced(1j * omega)))
+
+        assert info["order"] < len(system.den[0][0]) - 1
+        assert info["hinf_bound"] <= 1e-2
+        assert error <= info["hinf_bound"] * (1 + 1e-6)
+
+    def test_residualization_keeps_dc_gain(self):
+        """Test: Residualisierung erhält die stationäre Verstärkung"""
+        system = _loop()
+        reduced, _ = balanced_reduction(system, order=3, method="residualize")
+
+        assert np.isclose(reduced.dcgain(), system.dcgain())
+
+    def test_step_tolerance(self):
+        """Test: Automatische Ordnung für vorgegebenen Sprungantwortfehler"""
+        system = _loop()
+        reduced, info = balanced_reduction(system, step_tol=1e-3, t_end=40.0)
+        t = np.linspace(0, 40.0, 1000)
+
+        _, y = simulate_signal(system, t, np.ones_like(t))
+        _, yr = simulate_signal(reduced, t, np.ones_like(t))
+
+        assert info["step_error"] <= 1e-3
+        assert np.max(np.abs(y - yr)) <= 1e-3
+
+    def test_integrator_is_kept(self):
+        """Test: Integrator wird abgespalten und nicht reduziert"""
+        strecke = series_connection(I(Ki=1.0), Totzeit(Tt=0.5, order=8))
+        reduced, info = balanced_reduction(strecke, hinf_tol=1e-3)
+        t = np.linspace(0, 10, 500)
+
+        _, y = simulate_signal(strecke, t, np.ones_like(t))
+        _, yr = simulate_signal(reduced, t, np.ones_like(t))
+
+        assert info["n_unstable"] == 1
+        assert np.allclose(y, yr, atol=1e-2)
+
+    def test_state_space_input(self):
+        """Test: Zustandsraummodelle bleiben Zustandsraummodelle"""
+        reduced, info = balanced_reduction(ss(_loop()), order=4)
+
+        assert isinstance(reduced, StateSpace)
+        assert reduced.nstates == 4
+        assert len(info["hsv"]) == len(hankel_singular_values(_loop()))
+
+    def test_requires_exactly_one_target(self):
+        """Test: Genau eine Vorgabe erforderlich"""
+        with pytest.raises(ValueError):
+            balanced_reduction(_loop())
+        with pytest.raises(ValueError):
+            balanced_reduction(_loop(), order=2, hinf_tol=1e-3)
@@ -0,0 +1,62 @@
+"""
+Tests für die Wurzelortskurve
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+
+from regelung import IT1, PT2, Totzeit, plot_root_locus, series_connection
+from regelung.simulation import root_locus
+
+
+class TestRootLocus:
+    """Tests für root_locus"""
+
+    @pytest.mark.parametrize(
+        "open_loop",
+        [
+            PT2(Kp=1.0, T1=2.0, T2=0.5).tf(),
+            IT1(T1=1.0, Ki=1.0).tf(),
+            series_connection(PT2(Kp=1.0, T1=2.0, T2=0.5), Totzeit(Tt=1.0, order=6)),
+        ],
+    )
+    def test_roots_solve_characteristic_equation(self, open_loop):
+        """Test: Jeder Punkt ist Wurzel von D + K·N"""
+        gains, roots = root_locus(open_loop, k_max=20.0)
+        num = np.asarray(open_loop.num[0][0], dtype=float)
+        den = np.asarray(open_loop.den[0][0], dtype=float)
+
+        assert np.all(np.diff(gains) > 0)
+        for k in range(0, len(gains), max(1, len(gains) // 25)):
+            char = np.polyadd(den, gains[k] * num)
+            # Rückwärtsfehler: Residuum bezogen auf die Koeffizientennorm
+            scale = np.polyval(np.abs(char), np.abs(roots[k]))
+            assert np.all(np.abs(np.polyval(char, roots[k])) <= 1e-8 * scale)
+
+    def test_branches_are_smooth(self):
+        """Test: Aufeinanderfolgende Punkte eines Astes liegen dicht beieinander"""
+        L = series_connection(PT2(Kp=1.0, T1=2.0, T2=0.5), Totzeit(Tt=1.0, order=8))
+        gains, roots = root_locus(L, k_max=10.0, resolution=0.01)
+
+        extent = max(np.ptp(roots.real), np.ptp(roots.imag))
+        steps = np.abs(np.diff(roots, axis=0))
+        assert np.max(steps) <= 0.02 * extent
+
+    def test_pt2_breakaway(self):
+        """Test: PT2 mit P-Regler: Pole treffen sich bei -(1/T1 + 1/T2)/2"""
+        gains, roots = root_locus(PT2(Kp=1.0, T1=2.0, T2=0.5).tf(), k_max=50.0)
+
+        assert np.allclose(roots[0].real.min(), -2.0)
+        assert np.allclose(roots[-1].real, -1.25)
+
+    def test_plot(self):
+        """Test: Plot mit Stabilitätsgrenze"""
+        L = series_connection(PT2(Kp=1.0, T1=2.0, T2=0.5), Totzeit(Tt=1.0, order=4))
+        gains, roots = root_locus(L, k_max=20.0)
+
+        fig = plot_root_locus(gains, roots, zeros=L.zeros(), show=False)
+
+        assert fig is not None
@@ -0,0 +1,97 @@
+"""
+Tests für Kennwert-Sensitivitäten und vektorisierte Kennwerte
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+
+from regelung import IT1, PID, PT1, PT2, P, closed_loop
+from regelung.simulation import (
+    get_step_metrics,
+    simulate_step_batch,
+    step_metrics_batch,
+    step_sensitivities,
+)
+
+
+class TestStepMetricsBatch:
+    """Tests für step_metrics_batch"""
+
+    def test_close_to_get_step_metrics(self):
+        """Test: Kennwerte stimmen bis auf die Interpolation überein"""
+        strecke = PT2(Kp=1.0, T1=2.0, T2=0.5)
+        systeme = [closed_loop(P(Kp=kp), strecke) for kp in [1.0, 4.0]]
+        t, Y = simulate_step_batch(systeme, t_end=30.0, n_points=3000)
+
+        m = step_metrics_batch(t, Y)
+
+        for b, y in enumerate(Y):
+            ref = get_step_metrics(t, y)
+            assert np.isclose(m["steady_state"][b], ref["steady_state"])
+            assert np.isclose(m["y_max"][b], ref["y_max"], atol=1e-4)
+            assert np.isclose(m["t_max"][b], ref["t_max"], atol=2 * t[1])
+            assert np.isclose(m["rise_time"][b], ref["rise_time"], atol=2 * t[1])
+
+    def test_pt1_settling_time(self):
+        """Test: Ausregelzeit PT1 = T·ln(50) beim 2%-Band"""
+        t, Y = simulate_step_batch([PT1(Kp=1.0, T=1.0)], t_end=40.0, n_points=4001)
+
+        m = step_metrics_batch(t, Y)
+
+        assert np.isclose(m["settling_time"][0], np.log(50.0), atol=1e-3)
+
+    def test_analytic_final_value(self):
+        """Test: Mit Systemen genügt eine kurze Simulation"""
+        systeme = [PT1(Kp=2.0, T=1.0), IT1(T1=1.0, Ki=0.5)]
+        t, Y = simulate_step_batch(systeme, t_end=4.0, n_points=4001)
+
+        m = step_metrics_batch(t, Y, systems=systeme)
+
+        assert np.allclose(m["steady_state"], [2.0, np.inf])
+        assert np.isclose(m["rise_time"][0], np.log(9.0), atol=1e-3)
+        assert np.isnan(m["rise_time"][1])
+
+
+class TestStepSensitivities:
+    """Tests für step_sensitivities"""
+
+    def test_steady_state_derivative(self):
+        """Test: d(Endwert)/dKp = Ks / (1 + Kp·Ks)² bei P-Regler"""
+        sens = step_sensitivities(
+            P(Kp=2.0), PT1(Kp=1.5, T=1.0), params=["regler.Kp"], t_end=20.0
+        )
+
+        i = sens["metrics"].index("steady_state")
+        assert np.isclose(sens["jacobian"][i, 0], 1.5 / (1 + 3.0) ** 2, rtol=1e-4)
+
+    @pytest.mark.parametrize(
+        "strecke", [PT2(Kp=1.0, T1=2.0, T2=0.5), IT1(T1=1.0, Ki=0.5)]
+    )
+    def test_methods_agree(self, strecke):
+        """Test: Sensitivitätssysteme und Differenzenquotienten stimmen überein"""
+        regler = PID(Kp=1.5, Ti=4.0, Td=0.3)
+        kwargs = dict(t_end=40.0, n_points=4000)
+
+        exact = step_sensitivities(regler, strecke, **kwargs)
+        fd = step_sensitivities(regler, strecke, method="fd", **kwargs)
+
+        assert exact["params"] == fd["params"]
+        for name in ["steady_state", "y_max", "overshoot_pct", "rise_time"]:
+            i = exact["metrics"].index(name)
+            assert np.allclose(
+                exact["jacobian"][i], fd["jacobian"][i], rtol=2e-2, atol=1e-3
+            )
+
+    def test_parameter_selection(self):
+        """Test: Parameter mit und ohne Präfix, mehrdeutige Namen"""
+        regler, strecke = PID(Kp=1.0, Ti=2.0, Td=0.1), PT2(Kp=1.0, T1=1.0, T2=0.5)
+
+        sens = step_sensitivities(regler, strecke, params=["Ti", "strecke.Kp"])
+
+        assert sens["params"] == ["regler.Ti", "strecke.Kp"]
+        assert sens["jacobian"].shape == (7, 2)
+        with pytest.raises(ValueError):
+            step_sensitivities(regler, strecke, params=["Kp"])
@@ -0,0 +1,231 @@
+"""
+Tests für gestapelte Simulation und lokalen Simulationsdienst
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from regelung import PI, PT1, PT2, I, P, closed_loop, simulate_signal
+from regelung.simulation import simulate_signal_batch, simulate_step_batch
+from regelung.simulation.server import SimulationClient, SimulationServer, to_spec
+
+
+class TestSimulateBatch:
+    """Tests für simulate_step_batch und simulate_signal_batch"""
+
+    def test_matches_simulate_signal(self):
+        """Test: Gestapelte Simulation entspricht forced_response"""
+        strecke = PT2(Kp=1.0, T1=2.0, T2=0.5)
+        systeme = [closed_loop(P(Kp=kp), strecke) for kp in [0.5, 2.0, 8.0]]
+        systeme.append(PT1(Kp=2.0, T=1.0).tf())
+
+        t, Y = simulate_step_batch(systeme, t_end=15.0, n_points=600)
+
+        assert Y.shape == (4, 600)
+        for system, y in zip(systeme, Y):
+            _, y_ref = simulate_signal(system, t, np.ones_like(t))
+            assert np.allclose(y, y_ref, atol=1e-8)
+
+    def test_signal_per_system(self):
+        """Test: Je System ein eigenes Eingangssignal"""
+        t = np.linspace(0, 10, 500)
+        U = np.vstack([np.sin(t), np.cos(t)])
+        systeme = [PT1(Kp=1.0, T=1.0), I(Ki=0.5)]
+
+        _, Y = simulate_signal_batch(systeme, t, U)
+
+        for system, u, y in zip(systeme, U, Y):
+            _, y_ref = simulate_signal(system.tf(), t, u)
+            assert np.allclose(y, y_ref, atol=1e-8)
+
+    def test_coefficient_arrays(self):
+        """Test: Koeffizienten-Arrays statt Systemen"""
+        T = np.array([0.5, 1.0, 2.0])
+        num = np.ones((3, 1))
+        den = np.column_stack([T, np.ones(3)])
+
+        t, Y = simulate_step_batch((num, den), t_end=10.0, n_points=1001)
+
+        assert np.allclose(Y, 1.0 - np.exp(-t / T[:, None]), atol=1e-6)
+
+    def test_non_uniform_time_raises(self):
+        """Test: Nicht äquidistanter Zeitvektor wird abgelehnt"""
+        t = np.array([0.0, 0.1, 0.3, 0.4])
+        with pytest.raises(ValueError):
+            simulate_signal_batch([PT1(Kp=1.0, T=1.0)], t, np.ones(4))
+
+
+@pytest.fixture
+def server():
+    with SimulationServer(("127.0.0.1", 0), window=0.02) as server:
+        yield server
+
+
+class TestSimulationServer:
+    """Tests für SimulationServer und SimulationClient"""
+
+    def test_step_round_trip(self, server):
+        """Test: Sprungantwort über HTTP entspricht lokaler Simulation"""
+        client = SimulationClient(server.address)
+        strecke = PT2(Kp=1.0, T1=2.0, T2=0.5)
+        regler = PI(Kp=2.0, Ti=1.5)
+
+        t, y = client.step(strecke, regler, t_end=20.0, n_points=400)
+        _, y_ref = simulate_signal(closed_loop(regler, strecke), t, np.ones_like(t))
+
+        assert np.allclose(y, y_ref, atol=1e-8)
+
+    def test_signal_and_metrics(self, server):
+        """Test: Signal- und Kennwert-Aufträge"""
+        client = SimulationClient(server.address)
+        t = np.linspace(0, 10, 200)
+
+        _, y = client.signal({"type": "PT1", "Kp": 2.0, "T": 1.0}, t, 1.0)
+        metrics = client.metrics(PT1(Kp=2.0, T=1.0), t_end=10.0)
+
+        assert np.isclose(y[-1], 2.0, rtol=1e-3)
+        assert np.isclose(metrics["steady_state"], 2.0, rtol=1e-3)
+
+    def test_concurrent_requests_are_batched(self, server):
+        """Test: Gleichzeitige Anfragen werden gemeinsam simuliert"""
+        client = SimulationClient(server.address)
+        results = {}
+
+        def request(kp):
+            results[kp] = client.step(PT1(Kp=1.0, T=1.0), P(Kp=kp), t_end=5.0)
+
+        threads = [threading.Thread(target=request, args=(k,)) for k in range(1, 9)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = client.stats()
+        assert len(results) == 8
+        assert stats["count"] == 8
+        assert stats["batches"] < 8
+        assert stats["p50_ms"] <= stats["p99_ms"]
+
+    def test_metrics_use_final_value(self, server):
+        """Test: Stationärwert analytisch, auch wenn noch nicht eingeschwungen"""
+        metrics = SimulationClient(server.address).metrics(
+            PT1(Kp=2.0, T=1.0), t_end=2.0
+        )
+
+        assert metrics["steady_state"] == pytest.approx(2.0)
+
+    def test_signal_time_vectors(self, server):
+        """Test: Nur gleiche Zeitvektoren werden gemeinsam simuliert"""
+        client = SimulationClient(server.address)
+        strecke = PT1(Kp=1.0, T=1.0)
+        t1 = np.linspace(0, 10, 101)
+        t2 = np.linspace(0, 5, 101)
+        results = {}
+
+        def request(t):
+            results[t[-1]] = client.signal(strecke, t, np.sin(t))[1]
+
+        threads = [threading.Thread(target=request, args=(t,)) for t in (t1, t2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for t in (t1, t2):
+            _, y_ref = simulate_signal(strecke.tf(), t, np.sin(t))
+            assert np.allclose(results[t[-1]], y_ref, atol=1e-8)
+        with pytest.raises(RuntimeError):
+            client.signal(strecke, [0.0, 1.0, 3.0], 1.0)
+
+    def test_submit_requires_start(self):
+        """Test: Nach stop() kein Warten auf ein Ergebnis"""
+        with SimulationServer(("127.0.0.1", 0)) as server:
+            server.stop()
+            with pytest.raises(RuntimeError, match="nicht gestartet"):
+                server.submit("metrics", {"strecke": to_spec(PT1(Kp=1.0, T=1.0))})
+
+    def test_postprocessing_error(self, server, monkeypatch):
+        """Test: Fehler bei der Auswertung erreichen den Aufrufer"""
+        from regelung.simulation import server as module
+
+        def fail(*args, **kwargs):
+            raise ArithmeticError("Auswertung fehlgeschlagen")
+
+        monkeypatch.setattr(module, "get_step_metrics", fail)
+        spec = {"strecke": to_spec(PT1(Kp=1.0, T=1.0))}
+        with pytest.raises(ArithmeticError):
+            server.submit("metrics", spec, timeout=5.0)
+
+        monkeypatch.undo()
+        assert server.submit("metrics", spec, timeout=5.0)["steady_state"] == 1.0
+
+    def test_stop_fails_queued_jobs(self, monkeypatch):
+        """Test: stop() lässt wartende Aufträge fehlschlagen statt hängen"""
+        server = SimulationServer(("127.0.0.1", 0), window=0.0).start()
+        release = threading.Event()
+        run_group = server._run_group
+
+        def blocking(group, jobs):
+            release.wait(5.0)
+            run_group(group, jobs)
+
+        monkeypatch.setattr(server, "_run_group", blocking)
+        spec = {"strecke": to_spec(PT1(Kp=1.0, T=1.0))}
+        errors = {}
+
+        def request(key, payload):
+            try:
+                server.submit("step", payload, timeout=5.0)
+            except Exception as exc:  # noqa: BLE001
+                errors[key] = exc
+
+        first = threading.Thread(target=request, args=("first", spec))
+        first.start()
+        time.sleep(0.1)
+        second = threading.Thread(
+            target=request, args=("second", {**spec, "t_end": 5.0})
+        )
+        second.start()
+        time.sleep(0.1)
+        stopper = threading.Thread(target=server.stop)
+        stopper.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in (first, second, stopper):
+            thread.join(5.0)
+
+        assert "first" not in errors
+        assert isinstance(errors["second"], RuntimeError)
+
+    def test_repeated_request_uses_cache(self, server):
+        """Test: Wiederholte Aufträge kommen aus dem Cache"""
+        client = SimulationClient(server.address)
+        client.metrics(PT1(Kp=1.0, T=1.0))
+        client.metrics(PT1(Kp=1.0, T=1.0))
+
+        assert client.stats()["cache_hits"] == 1
+
+    def test_invalid_request(self, server):
+        """Test: Unbekannter Typ liefert Fehler"""
+        client = SimulationClient(server.address)
+        with pytest.raises(RuntimeError):
+            client.step({"type": "Unbekannt"})
+
+    def test_unix_socket(self, tmp_path):
+        """Test: Dienst über Unix-Socket"""
+        path = str(tmp_path / "regelung.sock")
+        with SimulationServer(path) as server:
+            t, y = SimulationClient(server.address).step(PT1(Kp=1.0, T=1.0))
+
+        assert np.isclose(y[-1], 1.0 - np.exp(-10.0), atol=1e-6)
+
+    def test_to_spec(self):
+        """Test: Objekte werden über ihre Parameter beschrieben"""
+        assert to_spec(PI(Kp=2.0, Ti=1.5)) == {"type": "PI", "Kp": 2.0, "Ti": 1.5}
+        assert to_spec([PT1(Kp=1.0, T=1.0)]) == [{"type": "PT1", "Kp": 1.0, "T": 1.0}]
@@ -0,0 +1,66 @@
+"""
+Tests für Sollwertprofile durch Überlagerung
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+
+from regelung import PI, PT2, closed_loop, simulate_signal
+from regelung.simulation import simulate_setpoint_profile
+
+
+def _system():
+    return closed_loop(PI(Kp=2.0, Ti=1.5), PT2(Kp=1.0, T1=2.0, T2=0.5))
+
+
+class TestSetpointProfile:
+    """Tests für simulate_setpoint_profile"""
+
+    @pytest.mark.parametrize("method", ["fft", "sparse"])
+    def test_sampled_profile(self, method):
+        """Test: Abgetastetes Profil entspricht den (Zeit, Wert)-Paaren"""
+        t = np.linspace(0, 100, 10001)
+        values = np.random.default_rng(0).uniform(0, 10, 50)
+        r = values[np.minimum(np.arange(len(t)) // 200, 49)]
+        pairs = [(2.0 * k, v) for k, v in enumerate(values)]
+
+        _, y = simulate_setpoint_profile(_system(), t, r, method=method)
+        _, y_pairs = simulate_setpoint_profile(_system(), t, pairs, method=method)
+        t_fine = np.linspace(0, 100, 100001)
+        r_fine = values[np.minimum((t_fine // 2.0).astype(int), 49)]
+        _, y_fine = simulate_signal(_system(), t_fine, r_fine)
+
+        assert np.allclose(y, y_pairs, atol=1e-10)
+        assert np.allclose(y, y_fine[::10], atol=1e-2)
+
+    def test_pairs_between_samples(self):
+        """Test: Sprungzeitpunkte zwischen den Abtastpunkten"""
+        t = np.linspace(0, 40, 4001)
+        profile = [(0.0, 1.0), (10.005, 3.0), (25.0, -2.0)]
+
+        _, y = simulate_setpoint_profile(_system(), t, profile)
+        t_fine = np.linspace(0, 40, 400001)
+        r_fine = np.select([t_fine >= 25.0, t_fine >= 10.005], [-2.0, 3.0], 1.0)
+        _, y_fine = simulate_signal(_system(), t_fine, r_fine)
+
+        assert np.allclose(y, y_fine[::100], atol=1e-3)
+
+    def test_methods_agree(self):
+        """Test: FFT und dünn besetzte Summe liefern dasselbe"""
+        t = np.linspace(0, 50, 5001)
+        profile = [(float(k), float(k % 3)) for k in range(0, 50, 2)]
+
+        _, y_fft = simulate_setpoint_profile(_system(), t, profile, method="fft")
+        _, y_sparse = simulate_setpoint_profile(_system(), t, profile, method="sparse")
+
+        assert np.allclose(y_fft, y_sparse, atol=1e-10)
+
+    def test_invalid_input(self):
+        """Test: Ungültige Zeitvektoren und Profile"""
+        with pytest.raises(ValueError):
+            simulate_setpoint_profile(_system(), np.array([0.0, 1.0, 3.0]), [(0, 1)])
+        with pytest.raises(ValueError):
+            simulate_setpoint_profile(_system(), np.linspace(0, 1, 11), [(-1, 1)])
@@ -0,0 +1,100 @@
+"""
+Tests für Testsignale und blockweise Simulation
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+
+from regelung import PT1, PT2, I, simulate_signal, simulate_signal_chunked
+from regelung.signals import PRBS, Chirp, Ramp, Setpoints, Sine, Step
+
+
+class TestSignals:
+    """Tests für die Signalgeneratoren"""
+
+    def test_step(self):
+        """Test: Sprung mit Verzögerung"""
+        t = np.array([0.0, 0.5, 1.0, 2.0])
+        assert np.allclose(Step(amplitude=2.0, t0=1.0)(t), [0, 0, 2, 2])
+
+    def test_ramp(self):
+        """Test: Rampe beginnt bei t0"""
+        t = np.array([0.0, 1.0, 3.0])
+        assert np.allclose(Ramp(slope=0.5, t0=1.0)(t), [0, 0, 1.0])
+
+    def test_sine(self):
+        """Test: Sinus mit Offset"""
+        t = np.array([0.0, 0.25])
+        assert np.allclose(Sine(amplitude=2.0, frequency=1.0, offset=1.0)(t), [1, 3])
+
+    def test_chirp_amplitude(self):
+        """Test: Gleitsinus bleibt innerhalb der Amplitude"""
+        t, u = Chirp(f0=0.1, f1=2.0, t1=10.0, amplitude=3.0).sample(10.0, 0.001)
+        assert np.max(np.abs(u)) <= 3.0 + 1e-12
+        assert np.isclose(u[0], 0.0)
+
+    def test_prbs_values_and_period(self):
+        """Test: PRBS nimmt nur ±amplitude an und ist periodisch"""
+        prbs = PRBS(amplitude=0.5, bit_time=0.1, nbits=5)
+        t = np.arange(0, 3.1, 0.1) + 0.05
+        u = prbs(t)
+
+        assert set(np.unique(u)) <= {-0.5, 0.5}
+        assert np.allclose(prbs(t + 31 * 0.1), u)
+
+    def test_setpoints(self):
+        """Test: Stückweise konstantes Profil"""
+        profil = Setpoints(times=[1.0, 2.0], values=[3.0, -1.0], initial=0.5)
+        t = np.array([0.0, 1.0, 1.5, 2.0, 5.0])
+        assert np.allclose(profil(t), [0.5, 3.0, 3.0, -1.0, -1.0])
+
+    def test_setpoints_unsorted_raises(self):
+        """Test: Unsortierte Zeitpunkte werfen Fehler"""
+        with pytest.raises(ValueError):
+            Setpoints(times=[2.0, 1.0], values=[1.0, 2.0])
+
+    def test_chunks_match_sample(self):
+        """Test: Blöcke ergeben zusammen das vollständige Signal"""
+        signal = Sine(frequency=0.3) + 0.5 * Step(t0=2.0)
+        t_full, u_full = signal.sample(10.0, 0.01)
+        blocks = list(signal.chunks(10.0, 0.01, chunk_size=137))
+
+        assert np.allclose(np.concatenate([t for t, _ in blocks]), t_full)
+        assert np.allclose(np.concatenate([u for _, u in blocks]), u_full)
+
+
+class TestSimulateSignalChunked:
+    """Tests für die blockweise Simulation"""
+
+    def test_signal_object_in_simulate_signal(self):
+        """Test: simulate_signal akzeptiert Signal-Objekte"""
+        strecke = PT1(Kp=2.0, T=1.0)
+        t = np.linspace(0, 10, 1000)
+
+        _, y = simulate_signal(strecke.tf(), t, Step(amplitude=3.0))
+
+        assert np.isclose(y[-1], 6.0, rtol=1e-3)
+
+    def test_chunked_matches_forced_response(self):
+        """Test: Blockweise Simulation entspricht simulate_signal"""
+        strecke = PT2(Kp=1.0, T1=2.0, T2=0.5)
+        signal = PRBS(bit_time=0.5, nbits=6) + Ramp(slope=0.1)
+        t, u = signal.sample(30.0, 0.01)
+
+        _, y_ref = simulate_signal(strecke.tf(), t, u)
+        blocks = simulate_signal_chunked(strecke, signal.chunks(30.0, 0.01, 500))
+        y = np.concatenate([y for _, y in blocks])
+
+        assert np.allclose(y, y_ref, atol=1e-8)
+
+    def test_chunked_step_from_rest(self):
+        """Test: Sprung bei t=0 startet aus der Ruhelage, ohne Versatz"""
+        t, u = Step(amplitude=2.0).sample(10.0, 0.01)
+
+        chunks = [(t[:300], u[:300]), (t[300:], u[300:])]
+        y = np.concatenate([y for _, y in simulate_signal_chunked(I(Ki=0.5), chunks)])
+
+        assert np.allclose(y, 1.0 * t, atol=1e-10)
@@ -7,8 +7,27 @@ Licensed under MIT License
 
 import numpy as np
 import pytest
-
-from regelung import PI, PT1, P, closed_loop, simulate_signal, simulate_step
+from control import feedback, series
+
+from regelung import (
+    IT1,
+    PI,
+    PID,
+    PT1,
+    PT2,
+    BlockDiagram,
+    D,
+    I,
+    P,
+    cascade_loop,
+    closed_loop,
+    final_value,
+    gang_of_four,
+    simulate_closed_loop,
+    simulate_signal,
+    simulate_step,
+)
+from regelung.simulation import get_step_metrics
 
 
 class TestClosedLoop:
@@ -43,6 +62,147 @@ class TestClosedLoop:
         assert 0 < dc_gain <= 1.0
 
 
+class TestGangOfFour:
+    """Tests für die vier Sensitivitätsfunktionen"""
+
+    def test_t_matches_closed_loop(self):
+        """Test: T entspricht closed_loop"""
+        regler = PID(Kp=2.0, Ti=1.5, Td=0.3)
+        strecke = PT2(Kp=1.0, T1=2.0, T2=0.5)
+        gof = gang_of_four(regler, strecke)
+        system = closed_loop(regler, strecke)
+
+        for s in [0.1j, 1j, 2.0 + 3j]:
+            assert np.isclose(gof["T"](s), system(s))
+
+    def test_s_plus_t_is_one(self):
+        """Test: S + T = 1"""
+        gof = gang_of_four(PI(Kp=2.0, Ti=1.0), PT1(Kp=1.0, T=1.0))
+
+        for s in [0.5j, 1j, 1.0 + 1j]:
+            assert np.isclose(gof["S"](s) + gof["T"](s), 1.0)
+
+    def test_shared_denominator(self):
+        """Test: Alle vier Funktionen haben denselben Nenner"""
+        gof = gang_of_four(PI(Kp=2.0, Ti=1.0), PT1(Kp=1.0, T=1.0))
+        den = gof["S"].den[0][0]
+
+        for key in ["T", "PS", "CS"]:
+            assert np.allclose(gof[key].den[0][0], den)
+
+    def test_simulate_reference_matches_step(self):
+        """Test: Sollwertsprung entspricht Sprungantwort von closed_loop"""
+        regler = PI(Kp=2.0, Ti=1.0)
+        strecke = PT1(Kp=1.0, T=1.0)
+        t = np.linspace(0, 10, 500)
+
+        _, y, u = simulate_closed_loop(regler, strecke, t, r=np.ones_like(t))
+        _, y_ref = simulate_signal(closed_loop(regler, strecke), t, np.ones_like(t))
+
+        assert np.allclose(y, y_ref, atol=1e-6)
+        assert u is not None
+
+    def test_pi_rejects_load_disturbance(self):
+        """Test: PI-Regler regelt Laststörung aus, Stellgröße kompensiert"""
+        t = np.linspace(0, 30, 3000)
+        d = np.ones_like(t)
+
+        _, y, u = simulate_closed_loop(PI(Kp=2.0, Ti=1.0), PT1(Kp=1.0, T=1.0), t, d=d)
+
+        assert abs(y[-1]) < 1e-2
+        assert np.isclose(u[-1], -1.0, atol=1e-2)
+
+    def test_improper_controller_has_no_u(self):
+        """Test: Idealer PID + PT1 liefert keine Stellgröße"""
+        t = np.linspace(0, 5, 100)
+        _, y, u = simulate_closed_loop(
+            PID(Kp=2.0, Ti=1.0, Td=0.5), PT1(Kp=1.0, T=1.0), t, r=np.ones_like(t)
+        )
+
+        assert u is None
+        assert len(y) == len(t)
+
+
+class TestCascadeLoop:
+    """Tests für Kaskadenregelung und Blockschaltbilder"""
+
+    def _reference(self, outer, inner, inner_s, outer_s):
+        inner_cl = feedback(series(inner.tf(), inner_s.tf()), 1)
+        return feedback(series(outer.tf(), inner_cl, outer_s.tf()), 1)
+
+    def test_cascade_matches_transfer_functions(self):
+        """Test: Kaskade entspricht verschachtelten feedback-Aufrufen"""
+        args = (PI(Kp=1.0, Ti=5.0), P(Kp=4.0), PT1(Kp=1.0, T=0.5), PT1(Kp=2.0, T=10.0))
+        system = cascade_loop(*args)
+        reference = self._reference(*args)
+
+        t = np.linspace(0, 60, 600)
+        _, y = simulate_signal(system, t, np.ones_like(t))
+        _, y_ref = simulate_signal(reference, t, np.ones_like(t))
+
+        assert np.allclose(y, y_ref, atol=1e-6)
+
+    def test_cascade_order_is_sum_of_blocks(self):
+        """Test: Keine Ordnungserhöhung (PI + P + PT1 + PT2 = 4 Zustände)"""
+        system = cascade_loop(
+            PI(Kp=1.0, Ti=5.0),
+            P(Kp=4.0),
+            PT1(Kp=1.0, T=0.5),
+            PT2(Kp=1.0, T1=5.0, T2=2.0),
+        )
+
+        assert system.nstates == 4
+
+    def test_cascade_inner_pid(self):
+        """Test: Idealer PID als Folgeregler wird mit der Strecke verschmolzen"""
+        args = (
+            PI(Kp=0.5, Ti=8.0),
+            PID(Kp=2.0, Ti=1.0, Td=0.1),
+            PT1(Kp=1.0, T=0.5),
+            PT1(Kp=2.0, T=10.0),
+        )
+        system = cascade_loop(*args)
+
+        for s in [0.1j, 1j]:
+            assert np.isclose(system(s), self._reference(*args)(s))
+
+    def test_improper_outer_controller_raises(self):
+        """Test: Idealer PID als Führungsregler ist nicht realisierbar"""
+        with pytest.raises(ValueError):
+            cascade_loop(
+                PID(Kp=1.0, Ti=5.0, Td=1.0),
+                P(Kp=4.0),
+                PT1(Kp=1.0, T=0.5),
+                PT1(Kp=2.0, T=10.0),
+            )
+
+    def test_feedforward_compensates_disturbance(self):
+        """Test: Ideale Störgrößenaufschaltung kompensiert Störung vollständig"""
+        bd = BlockDiagram()
+        bd.add_input("r")
+        bd.add_input("z")
+        bd.add_sum("e", {"r": 1, "y": -1})
+        bd.add_block("u_r", PI(Kp=2.0, Ti=1.0), "e")
+        bd.add_block("u_v", P(Kp=-1.0), "z")
+        bd.add_sum("u", {"u_r": 1, "u_v": 1, "z": 1})
+        bd.add_block("y", PT1(Kp=1.0, T=1.0), "u")
+        system = bd.compile(inputs=["z"], outputs="y")
+
+        t = np.linspace(0, 10, 200)
+        _, y = simulate_signal(system, t, np.ones_like(t))
+
+        assert np.allclose(y, 0.0, atol=1e-9)
+
+    def test_unknown_signal_raises(self):
+        """Test: Unbekannte Signale werden erkannt"""
+        bd = BlockDiagram()
+        bd.add_input("r")
+        bd.add_block("y", PT1(Kp=1.0, T=1.0), "x")
+
+        with pytest.raises(ValueError):
+            bd.compile(outputs="y")
+
+
 class TestSimulateStep:
     """Tests für Sprungantwort-Simulation"""
 
@@ -171,3 +331,69 @@ class TestEdgeCases:
 
         with pytest.raises((ValueError, AssertionError)):
             simulate_signal(strecke.tf(), t, u)
+
+
+class TestFinalValue:
+    """Tests für den analytischen Endwert"""
+
+    def test_dc_gain(self):
+        """Test: Endwert = G(0) für stabile Systeme"""
+        assert np.isclose(final_value(PT1(Kp=2.0, T=1.0)), 2.0)
+        system = closed_loop(P(Kp=3.0), PT2(Kp=1.0, T1=2.0, T2=0.5))
+        assert np.isclose(final_value(system), 0.75)
+
+    def test_system_type(self):
+        """Test: Integrierende und differenzierende Systeme"""
+        assert final_value(I(Ki=1.0)) == np.inf
+        assert final_value(IT1(Ki=-1.0, T1=0.5)) == -np.inf
+        assert final_value(D(Kd=1.0).tf() * PT1(Kp=1.0, T=1.0).tf()) == 0.0
+        loop = closed_loop(PI(Kp=1.0, Ti=2.0), I(Ki=1.0))
+        assert np.isclose(final_value(loop), 1.0)
+
+    def test_unstable_has_no_final_value(self):
+        """Test: Instabile Regelkreise haben keinen Endwert"""
+        strecke = PT2(Kp=1.0, T1=1.0, T2=1.0)
+        assert np.isnan(final_value(closed_loop(PI(Kp=10.0, Ti=0.1), strecke)))
+
+
+class TestStepMetricsFinalValue:
+    """Tests für get_step_metrics mit System"""
+
+    def test_short_simulation(self):
+        """Test: Kurze Simulation liefert korrektes Überschwingen"""
+        system = closed_loop(PI(Kp=2.0, Ti=1.5), PT2(Kp=1.0, T1=2.0, T2=0.5))
+        t_long, y_long = simulate_step(system, t_end=100.0)
+        t, y = simulate_step(system, t_end=15.0)
+
+        ref = get_step_metrics(t_long, y_long)
+        metrics = get_step_metrics(t, y, system=system)
+
+        assert np.isclose(metrics["steady_state"], 1.0)
+        assert np.isclose(metrics["overshoot_pct"], ref["overshoot_pct"], atol=0.5)
+
+    def test_settling_time_oscillating(self):
+        """Test: Ausregelzeit ist der letzte Austritt aus dem 2%-Band"""
+        system = closed_loop(P(Kp=5.0), PT2(Kp=1.0, T1=2.0, T2=0.5))
+        t, y = simulate_step(system, t_end=20.0, precision="float64")
+        steady_state = 5.0 / 6.0
+
+        metrics = get_step_metrics(t, y, system=system)
+
+        outside = np.abs(y - steady_state) > 0.02 * steady_state
+        last = np.nonzero(outside)[0][-1]
+        assert t[last] <= metrics["settling_time"] <= t[last + 1]
+        assert np.isclose(metrics["settling_time"], 3.25, atol=0.02)
+
+        # Noch nicht ausgeregelt: nan statt Simulationsende
+        t, y = simulate_step(system, t_end=2.0, precision="float64")
+        assert np.isnan(get_step_metrics(t, y, system=system)["settling_time"])
+
+    def test_integrator(self):
+        """Test: Rampenförmige Antwort hat keine bezogenen Kennwerte"""
+        t, y = simulate_step(I(Ki=1.0).tf(), t_end=5.0)
+
+        metrics = get_step_metrics(t, y, system=I(Ki=1.0))
+
+        assert metrics["steady_state"] == np.inf
+        assert np.isnan(metrics["settling_time"])
+        assert np.isclose(metrics["y_max"], y[-1])
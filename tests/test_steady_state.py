@@ -0,0 +1,88 @@
+"""
+Tests für Fehlerkonstanten und bleibende Regelabweichung
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+
+from regelung import (
+    PI,
+    PID,
+    PT1,
+    PT2,
+    I,
+    P,
+    ParametricLoop,
+    closed_loop,
+    series_connection,
+    simulate_signal,
+)
+from regelung.simulation import error_constants
+
+
+class TestErrorConstants:
+    """Tests für error_constants"""
+
+    def test_type_0(self):
+        """Test: P-Regler an PT1 - bleibende Regelabweichung beim Sprung"""
+        c = error_constants(series_connection(P(Kp=4.0), PT1(Kp=2.0, T=1.0)))
+
+        assert c["type"] == 0
+        assert np.isclose(c["Kp"], 8.0)
+        assert c["Kv"] == 0.0
+        assert np.isclose(c["e_step"], 1.0 / 9.0)
+        assert c["e_ramp"] == np.inf
+
+    def test_type_1_ramp_error(self):
+        """Test: Rampenfehler 1/Kv stimmt mit der Simulation überein"""
+        regler, strecke = PI(Kp=2.0, Ti=1.0), PT2(Kp=1.0, T1=1.0, T2=0.5)
+        c = error_constants(series_connection(regler, strecke))
+        t = np.linspace(0, 60, 6001)
+
+        _, y = simulate_signal(closed_loop(regler, strecke), t, t)
+
+        assert c["type"] == 1
+        assert c["e_step"] == 0.0
+        assert np.isclose(t[-1] - y[-1], c["e_ramp"], rtol=1e-3)
+
+    def test_type_2(self):
+        """Test: PI-Regler an I-Strecke folgt der Rampe ohne Fehler"""
+        c = error_constants(series_connection(PI(Kp=1.0, Ti=2.0), I(Ki=1.0)))
+
+        assert c["type"] == 2
+        assert c["Kv"] == np.inf
+        assert np.isclose(c["Ka"], 0.5)
+        assert c["e_ramp"] == 0.0
+        assert np.isclose(c["e_parabola"], 2.0)
+
+    def test_unstable_loop(self):
+        """Test: Instabiler Regelkreis hat keine bleibende Abweichung"""
+        c = error_constants(
+            series_connection(PI(Kp=10.0, Ti=0.1), PT2(Kp=1.0, T1=1.0, T2=1.0))
+        )
+
+        assert np.isnan(c["e_step"])
+
+
+class TestParametricErrorConstants:
+    """Tests für ParametricLoop.error_constants"""
+
+    def test_grid_matches_scalar(self):
+        """Test: Vektorisierte Auswertung entspricht error_constants"""
+        loop = ParametricLoop(PID, PT2)
+        Kp = np.linspace(0.5, 5.0, 4)[:, None]
+        Ti = np.array([0.5, 2.0, 8.0])
+
+        c = loop.error_constants(Kp=Kp, Ti=Ti, Td=0.2, Kp_s=1.5, T1=2.0, T2=0.5)
+
+        assert c["Kv"].shape == (4, 3)
+        for i, kp in enumerate(Kp[:, 0]):
+            for j, ti in enumerate(Ti):
+                regler = PID(Kp=kp, Ti=ti, Td=0.2)
+                L = series_connection(regler, PT2(Kp=1.5, T1=2.0, T2=0.5))
+                ref = error_constants(L)
+                assert c["type"][i, j] == ref["type"] == 1
+                assert np.isclose(c["Kv"][i, j], ref["Kv"])
+                assert np.isclose(c["e_ramp"][i, j], ref["e_ramp"], equal_nan=True)
@@ -0,0 +1,72 @@
+"""
+Tests für Kennwerte ohne gespeicherte Trajektorien
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+
+from regelung import PID, PT1, PT2, P, ParametricLoop, closed_loop
+from regelung.simulation import (
+    simulate_step_batch,
+    step_metrics_batch,
+    step_metrics_sweep,
+)
+
+
+class TestStepMetricsSweep:
+    """Tests für step_metrics_sweep"""
+
+    def test_matches_step_metrics_batch(self):
+        """Test: Kennwerte eingeschwungener Antworten wie step_metrics_batch"""
+        strecke = PT2(Kp=1.0, T1=2.0, T2=0.5)
+        systeme = [closed_loop(P(Kp=kp), strecke) for kp in [0.5, 2.0, 6.0]]
+        t, Y = simulate_step_batch(systeme, t_end=60.0, n_points=6000)
+
+        ref = step_metrics_batch(t, Y)
+        m = step_metrics_sweep(systeme, t_end=60.0, n_points=6000, chunk_size=2)
+
+        for name in ["steady_state", "y_max", "overshoot_pct", "rise_time"]:
+            assert np.allclose(m[name], ref[name], rtol=1e-4, atol=1e-6)
+        assert np.allclose(m["t_max"], ref["t_max"], atol=t[1])
+        assert np.allclose(m["settling_time"], ref["settling_time"], atol=t[1])
+        assert np.allclose(m["y_end"], Y[:, -1])
+
+    def test_pt1_integrals(self):
+        """Test: PT1 mit K=1: IAE = T, ISE = T/2, ITAE = T²"""
+        m = step_metrics_sweep([PT1(Kp=1.0, T=2.0)], t_end=60.0, n_points=20001)
+
+        assert np.isclose(m["iae"][0], 2.0, rtol=1e-4)
+        assert np.isclose(m["ise"][0], 1.0, rtol=1e-4)
+        assert np.isclose(m["itae"][0], 4.0, rtol=1e-3)
+        assert np.isclose(m["settling_time"][0], 2.0 * np.log(50.0), atol=1e-2)
+
+    def test_unstable_reference_is_nan(self):
+        """Test: Instabile Systeme haben keinen Endwert"""
+        num = np.array([[1.0], [1.0]])
+        den = np.array([[1.0, 1.0], [1.0, -1.0]])
+
+        m = step_metrics_sweep((num, den), t_end=5.0)
+
+        assert np.isclose(m["steady_state"][0], 1.0)
+        assert np.isnan(m["steady_state"][1])
+        assert np.isnan(m["settling_time"][1])
+
+
+class TestParametricSweep:
+    """Tests für ParametricLoop.sweep_metrics"""
+
+    def test_grid_shape_and_values(self):
+        """Test: Gitterform und Übereinstimmung mit step_metrics"""
+        loop = ParametricLoop(PID, PT2)
+        Kp = np.linspace(0.5, 3.0, 4)[:, None]
+        Ti = np.linspace(1.0, 5.0, 3)
+        p = dict(Kp=Kp, Ti=Ti, Td=0.2, Kp_s=1.0, T1=2.0, T2=0.5)
+
+        m = loop.sweep_metrics(t_end=80.0, n_points=4000, **p)
+        ref = loop.step_metrics(t_end=80.0, n_points=4000, **p)
+
+        assert m.shape == (4, 3)
+        assert np.allclose(m["overshoot_pct"], ref["overshoot_pct"], atol=5e-2)
+        assert np.all(m["iae"] > 0)
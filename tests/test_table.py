@@ -0,0 +1,125 @@
+"""
+Tests für vorberechnete Antworttabellen
+
+Copyright (c) 2025 Gwynspring
+Licensed under MIT License
+"""
+
+import numpy as np
+import pytest
+
+from regelung import PI, PT1, PT2, P, ParametricLoop
+from regelung.simulation import ResponseTable
+
+
+def _table(**kwargs):
+    loop = ParametricLoop(P, PT1)
+    grid = {
+        "Kp": np.linspace(0.1, 5.0, 50),
+        "Kp_s": np.linspace(0.5, 5.0, 10),
+        "T": np.linspace(0.5, 5.0, 10),
+    }
+    return loop, ResponseTable(loop, grid, t_end=15.0, n_points=500, **kwargs)
+
+
+class TestResponseTable:
+    """Tests für ResponseTable"""
+
+    def test_grid_point_matches_simulation(self):
+        """Test: Gitterpunkt entspricht der gestapelten Simulation"""
+        loop, table = _table()
+
+        t, y = table.response(Kp=1.0, Kp_s=2.0, T=1.0)
+
+        t_ref, y_ref = loop.step(t_end=15.0, n_points=500, Kp=1.0, Kp_s=2.0, T=1.0)
+        assert np.array_equal(t, t_ref)
+        assert np.allclose(y, y_ref, atol=1e-4 * np.ptp(y_ref))
+
+    def test_uncompressed_exact(self):
+        """Test: Ohne Kompression exakt wie die Simulation"""
+        loop, table = _table(compress=False)
+
+        _, y = table.response(Kp=2.5, Kp_s=1.5, T=3.0)
+
+        _, y_ref = loop.step(t_end=15.0, n_points=500, Kp=2.5, Kp_s=1.5, T=3.0)
+        # Gitterwerte aus linspace weichen um Rundungsfehler von 2.5 ab
+        np.testing.assert_allclose(y, y_ref, rtol=1e-12, atol=1e-12 * np.ptp(y_ref))
+
+    def test_lazy_cross(self):
+        """Test: Erster Zugriff berechnet das Achsenkreuz, danach nur Nachschlagen"""
+        _, table = _table()
+
+        table.response(Kp=1.0, Kp_s=2.0, T=1.0)
+        assert len(table) == 50 + 10 + 10 - 2
+
+        table.response(Kp=3.0, Kp_s=2.0, T=1.0)
+        table.response(Kp=1.0, Kp_s=4.5, T=1.0)
+        assert len(table) == 68
+
+    def test_interpolation(self):
+        """Test: Zwischenwerte liegen zwischen den Nachbarantworten"""
+        _, table = _table(compress=False)
+
+        _, y_low = table.response(Kp=1.0, Kp_s=2.0, T=1.0)
+        _, y_high = table.response(Kp=1.1, Kp_s=2.0, T=1.0)
+        _, y = table.response(Kp=1.025, Kp_s=2.0, T=1.0)
+
+        assert np.allclose(y, 0.75 * y_low + 0.25 * y_high)
+
+    def test_precompute_and_memory(self):
+        """Test: precompute füllt alle Punkte, 16 Bit je Abtastwert"""
+        _, table = _table()
+
+        table.precompute(chunk_size=777)
+
+        assert len(table) == 5000
+        assert table.nbytes == 5000 * 500 * 2
+
+    def test_fixed_parameter(self):
+        """Test: Parameter mit einem Gitterwert dürfen fehlen"""
+        loop = ParametricLoop(PI, PT2)
+        grid = {"Kp": [1.0, 2.0], "Ti": [1.0, 2.0], "Kp_s": 1.0, "T1": 2.0, "T2": 0.5}
+        table = ResponseTable(loop, grid, t_end=20.0)
+
+        _, y = table.response(Kp=1.5, Ti=2.0)
+
+        assert table.shape == (2, 2, 1, 1, 1)
+        assert np.isclose(y[-1], 1.0, atol=1e-2)
+
+    def test_unstable_nan(self):
+        """Test: Instabile Kreise liefern nan"""
+        loop = ParametricLoop(P, PT1)
+        grid = {"Kp": [-5.0, 1.0], "Kp_s": 1.0, "T": 1.0}
+        table = ResponseTable(loop, grid, t_end=500.0)
+
+        _, y = table.response(Kp=-5.0)
+
+        assert np.all(np.isnan(y))
+        assert np.all(np.isfinite(table.response(Kp=1.0)[1]))
+
+    def test_invalid_parameters(self):
+        """Test: Fehlende, unbekannte und zu große Werte werden erkannt"""
+        _, table = _table()
+
+        with pytest.raises(ValueError, match="außerhalb"):
+            table.response(Kp=6.0, Kp_s=2.0, T=1.0)
+        with pytest.raises(ValueError, match="fehlt"):
+            table.response(Kp=1.0, Kp_s=2.0)
+        with pytest.raises(ValueError, match="Unbekannte"):
+            table.response(Kp=1.0, Kp_s=2.0, T=1.0, Td=0.1)
+        with pytest.raises(ValueError):
+            ResponseTable(ParametricLoop(P, PT1), {"Kp": [1.0]})
+
+    def test_save_load(self, tmp_path):
+        """Test: Gespeicherte Tabelle liefert dieselben Antworten"""
+        loop, table = _table()
+        _, y = table.response(Kp=1.0, Kp_s=2.0, T=1.0)
+        path = tmp_path / "tabelle.npz"
+
+        table.save(path)
+        loaded = ResponseTable.load(path, loop)
+
+        assert len(loaded) == len(table)
+        assert np.array_equal(loaded.response(Kp=1.0, Kp_s=2.0, T=1.0)[1], y)
+        with pytest.raises(ValueError):
+            ResponseTable.load(path, ParametricLoop(PI, PT1))